@@ -0,0 +1,189 @@
+"""Benchmark of the throughput and latency of ``DaskStorage``.
+
+A ``SubprocessCluster`` is started on this machine for each combination of backend and study
+size, and a synthetic objective is optimized on all of its workers at once through a
+``DaskStorage``. For each run, the following is reported:
+
+* trials per second, measured end to end on the client;
+* p50 and p99 latency of every ``optuna_*`` handler called on the scheduler;
+* CPU time spent on the scheduler's event loop thread inside each handler, and the total CPU
+  time of the scheduler process, which includes the backend calls that are run off the loop.
+
+The scheduler runs in its own process, unlike the scheduler of a ``LocalCluster``, which shares
+the process of the client, so that its CPU time does not include the client's.
+
+Handler latency and CPU time are measured on the scheduler by wrapping the handlers that
+``_OptunaSchedulerExtension`` registers. Since handlers interleave on the event loop, the CPU
+time of a handler may include time spent in other handlers while it awaits.
+
+Usage, with ``optuna-integration`` and ``distributed`` installed::
+
+    python benchmarks/dask_storage.py --n-workers 4 --n-trials 200 1000 --backends inmemory sqlite
+
+Pass ``--output results.json`` to additionally dump the raw numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import os
+import tempfile
+import time
+from typing import Any
+import warnings
+
+from distributed import Client
+from distributed import Scheduler
+from distributed import wait
+from distributed.deploy.subprocess import SubprocessCluster
+import numpy as np
+import optuna
+
+from optuna_integration.dask import DaskStorage
+
+
+def _install_handler_timers(dask_scheduler: Scheduler) -> None:
+    records: dict[str, list[tuple[float, float]]] = {}
+    dask_scheduler.optuna_benchmark_records = records  # type: ignore[attr-defined]
+
+    def _timed(name: str, handler: Callable) -> Callable:
+        # The first parameter must be named ``comm`` for the scheduler to pass it on.
+        async def timed_handler(comm: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            start_cpu = time.thread_time()
+            try:
+                result = handler(comm, **kwargs)
+                if hasattr(result, "__await__"):
+                    result = await result
+                return result
+            finally:
+                records.setdefault(name, []).append(
+                    (time.perf_counter() - start, time.thread_time() - start_cpu)
+                )
+
+        return timed_handler
+
+    for name, handler in list(dask_scheduler.handlers.items()):
+        if name.startswith("optuna_"):
+            dask_scheduler.handlers[name] = _timed(name, handler)
+
+
+def _collect_handler_records(dask_scheduler: Scheduler) -> dict[str, list[tuple[float, float]]]:
+    return dask_scheduler.optuna_benchmark_records  # type: ignore[attr-defined]
+
+
+def _scheduler_process_cpu_time(dask_scheduler: Scheduler) -> float:
+    return time.process_time()
+
+
+def _objective(trial: optuna.Trial) -> float:
+    x = trial.suggest_float("x", -10, 10)
+    y = trial.suggest_int("y", -10, 10)
+    z = trial.suggest_categorical("z", ["a", "b", "c"])
+    for step in range(3):
+        trial.report(x * step, step)
+    trial.set_user_attr("z", z)
+    return x**2 + y**2
+
+
+def _run(
+    client: Client, storage_url: str | None, n_trials: int, n_workers: int, batch_writes: bool
+) -> dict[str, Any]:
+    storage = DaskStorage(storage_url, client=client, batch_writes=batch_writes)
+    # Handlers are wrapped after registration, which itself is not measured.
+    client.run_on_scheduler(_install_handler_timers)
+    study = optuna.create_study(storage=storage, sampler=optuna.samplers.RandomSampler())
+
+    n_trials_per_worker = [
+        n_trials // n_workers + (i < n_trials % n_workers) for i in range(n_workers)
+    ]
+    start_cpu = client.run_on_scheduler(_scheduler_process_cpu_time)
+    start = time.perf_counter()
+    futures = [
+        client.submit(study.optimize, _objective, n_trials=n, pure=False)
+        for n in n_trials_per_worker
+        if n > 0
+    ]
+    wait(futures)
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - start
+    scheduler_cpu = client.run_on_scheduler(_scheduler_process_cpu_time) - start_cpu
+
+    handlers = {}
+    for name, records in client.run_on_scheduler(_collect_handler_records).items():
+        latencies, cpu_times = np.array(records).T
+        handlers[name.removeprefix("optuna_")] = {
+            "calls": len(records),
+            "p50_ms": float(np.percentile(latencies, 50) * 1000),
+            "p99_ms": float(np.percentile(latencies, 99) * 1000),
+            "loop_cpu_s": float(cpu_times.sum()),
+        }
+    return {
+        "trials_per_second": n_trials / elapsed,
+        "elapsed_s": elapsed,
+        "scheduler_process_cpu_s": scheduler_cpu,
+        "handlers": handlers,
+    }
+
+
+def _print_result(backend: str, n_trials: int, result: dict[str, Any]) -> None:
+    print(
+        f"\n[{backend}, {n_trials} trials] {result['trials_per_second']:.1f} trials/s, "
+        f"elapsed {result['elapsed_s']:.2f} s, "
+        f"scheduler process CPU {result['scheduler_process_cpu_s']:.2f} s"
+    )
+    print(f"  {'handler':<40} {'calls':>8} {'p50 ms':>9} {'p99 ms':>9} {'loop CPU s':>11}")
+    handlers = sorted(result["handlers"].items(), key=lambda item: -item[1]["loop_cpu_s"])
+    for name, stats in handlers:
+        print(
+            f"  {name:<40} {stats['calls']:>8} {stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} "
+            f"{stats['loop_cpu_s']:>11.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-workers", type=int, default=4)
+    parser.add_argument("--n-trials", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument(
+        "--backends", nargs="+", choices=["inmemory", "sqlite"], default=["inmemory", "sqlite"]
+    )
+    parser.add_argument("--batch-writes", action="store_true")
+    parser.add_argument("--output", help="Path of a JSON file to write the results to.")
+    args = parser.parse_args()
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+
+    results = []
+    for backend in args.backends:
+        for n_trials in args.n_trials:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                storage_url = None
+                if backend == "sqlite":
+                    storage_url = f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}"
+                # A fresh cluster per run keeps the scheduler's state and timers separate.
+                cluster = SubprocessCluster(
+                    n_workers=args.n_workers, threads_per_worker=1, dashboard_address=None
+                )
+                with cluster, Client(cluster) as client:
+                    # Unlike those of a ``LocalCluster``, the workers start in the background.
+                    client.wait_for_workers(args.n_workers)
+                    client.run(optuna.logging.set_verbosity, optuna.logging.WARNING)
+                    client.run(
+                        warnings.simplefilter, "ignore", optuna.exceptions.ExperimentalWarning
+                    )
+                    result = _run(client, storage_url, n_trials, args.n_workers, args.batch_writes)
+            _print_result(backend, n_trials, result)
+            results.append({"backend": backend, "n_trials": n_trials, **result})
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
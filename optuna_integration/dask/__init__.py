@@ -1,4 +1,5 @@
+from ._optimize import optimize
 from .dask import DaskStorage
 
 
-__all__ = ["DaskStorage"]
+__all__ = ["DaskStorage", "optimize"]
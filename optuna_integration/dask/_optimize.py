@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+import copy
+import time
+
+import optuna
+from optuna import logging
+from optuna._experimental import experimental_func
+from optuna.storages._heartbeat import get_heartbeat_thread
+from optuna.study._optimize import _log_failed_trial
+from optuna.study._tell import _tell_with_warning
+from optuna.trial import FrozenTrial
+from optuna.trial import TrialState
+
+from optuna_integration._imports import try_import
+from optuna_integration.dask.dask import DaskStorage
+
+
+with try_import() as _imports:
+    import distributed
+    from distributed import as_completed
+    from distributed import get_client
+    from distributed import KilledWorker
+
+
+_logger = logging.get_logger(__name__)
+
+
+def _run_trial(
+    study: optuna.Study,
+    trial_id: int,
+    func: Callable[[optuna.Trial], float | Sequence[float]],
+) -> tuple[TrialState | None, float | Sequence[float] | None, Exception | None]:
+    # Runs on a worker. Errors are sent back rather than raised, so that Dask does not treat
+    # them as task failures; the driver decides what to do with them.
+    trial = optuna.Trial(study, trial_id)
+    with get_heartbeat_thread(trial_id, study._storage):
+        try:
+            return None, func(trial), None
+        except optuna.TrialPruned as e:
+            return TrialState.PRUNED, None, e
+        except Exception as e:
+            return TrialState.FAIL, None, e
+
+
+def _count_slots(client: "distributed.Client", resources: dict[str, float] | None) -> int:
+    workers = client.scheduler_info()["workers"].values()
+    if not resources:
+        return sum(worker["nthreads"] for worker in workers)
+    return sum(
+        min(int(worker["resources"].get(name, 0) // amount) for name, amount in resources.items())
+        for worker in workers
+    )
+
+
+@experimental_func("5.0.0")
+def optimize(
+    study: optuna.Study,
+    func: Callable[[optuna.Trial], float | Sequence[float]],
+    n_trials: int | None = None,
+    timeout: float | None = None,
+    *,
+    n_jobs: int | None = None,
+    client: "distributed.Client" | None = None,
+    resources: dict[str, float] | None = None,
+    catch: Iterable[type[Exception]] | type[Exception] = (),
+    callbacks: Iterable[Callable[[optuna.Study, FrozenTrial], None]] | None = None,
+    max_retries: int = 3,
+) -> None:
+    """Optimize an objective function on a Dask cluster.
+
+    Each trial is submitted as an individual Dask task, and a new trial is submitted as soon as
+    one finishes, so that workers are kept busy even if trials take very different times.
+    Trials are created and finished in this process, while the objective function runs on the
+    workers. The study must use :class:`~optuna_integration.DaskStorage`.
+
+    If a worker is lost while running a trial, Dask reschedules the trial on another worker.
+    Once Dask gives up, the trial is failed and replaced by a new trial.
+
+    Example:
+
+        .. code::
+
+            import optuna
+            from distributed import Client
+
+            from optuna_integration.dask import DaskStorage
+            from optuna_integration.dask import optimize
+
+
+            def objective(trial):
+                x = trial.suggest_float("x", -10, 10)
+                return (x - 2) ** 2
+
+
+            with Client() as client:
+                study = optuna.create_study(storage=DaskStorage())
+                optimize(study, objective, n_trials=100, client=client)
+
+    Args:
+        study:
+            Study to optimize. Its storage must be a
+            :class:`~optuna_integration.DaskStorage`.
+        func:
+            A callable that implements the objective function. It is pickled and run on the
+            workers.
+        n_trials:
+            The number of trials. If this argument is set to :obj:`None`, there is no limitation
+            on the number of trials. Trials replacing lost ones are not counted.
+        timeout:
+            Stop submitting new trials after the given number of seconds. Trials that are
+            already running are waited for. If this argument is set to :obj:`None`, there is no
+            time limit.
+        n_jobs:
+            The number of trials to keep running at once. If this argument is set to
+            :obj:`None`, it is the number of worker threads in the cluster or, if
+            ``resources`` is given, the number of trials that fit on its workers. It is then
+            counted again whenever a trial finishes, so that it follows adaptive scaling of the
+            cluster. At least one trial is submitted at a time so that an adaptive cluster
+            without workers scales up. To let an adaptive cluster grow beyond its current size,
+            set ``n_jobs`` to the desired number of concurrent trials.
+        client:
+            Dask ``Client`` to submit the trials with. If not provided, will attempt to find an
+            existing ``Client``.
+        resources:
+            Abstract resources that each trial needs, e.g. ``{"GPU": 1, "MEMORY": 8e9}``. The
+            workers must have been started with the corresponding resources. See the
+            `Dask documentation <https://distributed.dask.org/en/stable/resources.html>`__.
+        catch:
+            A study continues to run even when a trial raises one of the exceptions specified
+            in this argument.
+        callbacks:
+            List of callback functions that are invoked in this process at the end of each
+            trial. Each function must accept two parameters with the following types in this
+            order: :class:`~optuna.study.Study` and :class:`~optuna.trial.FrozenTrial`.
+        max_retries:
+            Maximum number of trials that are failed because of lost workers and replaced by
+            new trials. Once it is exceeded, :class:`distributed.KilledWorker` is raised.
+    """
+
+    _imports.check()
+    if not isinstance(study._storage, DaskStorage):
+        raise ValueError("The storage of the study must be DaskStorage.")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"n_jobs must be positive, but got {n_jobs}.")
+    if not isinstance(catch, Iterable):
+        catch = (catch,)
+    catch = tuple(catch)
+    callbacks = list(callbacks or [])
+    client = client or get_client()
+
+    start_time = time.time()
+    n_submitted = 0
+    n_lost = 0
+    running: dict[distributed.Future, optuna.Trial] = {}
+    futures = as_completed()  # type: ignore[no-untyped-call]
+
+    def _fill() -> None:
+        nonlocal n_submitted
+        n_concurrent = n_jobs or max(_count_slots(client, resources), 1)
+        while len(running) < n_concurrent:
+            if study._stop_flag or (n_trials is not None and n_submitted >= n_trials):
+                return
+            if timeout is not None and time.time() - start_time >= timeout:
+                return
+            trial = study.ask()
+            future = client.submit(
+                _run_trial, study, trial._trial_id, func, resources=resources, pure=False
+            )
+            running[future] = trial
+            futures.add(future)  # type: ignore[no-untyped-call]
+            n_submitted += 1
+
+    study._stop_flag = False
+    study._thread_local.in_optimize_loop = True
+    try:
+        _fill()
+        for future in futures:
+            trial = running.pop(future)
+            try:
+                state, value_or_values, func_err = future.result()
+            except KilledWorker:
+                if not _is_finished(study, trial):
+                    study.tell(trial, state=TrialState.FAIL)
+                _logger.warning(f"Trial {trial.number} failed because its worker was lost.")
+                n_lost += 1
+                if n_lost > max_retries:
+                    raise
+                n_submitted -= 1
+                _fill()
+                continue
+
+            frozen_trial = _tell(study, trial, state, value_or_values, func_err)
+            if (
+                frozen_trial.state == TrialState.FAIL
+                and func_err is not None
+                and not isinstance(func_err, catch)
+            ):
+                raise func_err
+            for callback in callbacks:
+                callback(study, frozen_trial)
+            _fill()
+    finally:
+        study._thread_local.in_optimize_loop = False
+        for future, trial in running.items():
+            future.cancel()  # type: ignore[no-untyped-call]
+            if not _is_finished(study, trial):
+                study.tell(trial, state=TrialState.FAIL)
+
+
+def _is_finished(study: optuna.Study, trial: optuna.Trial) -> bool:
+    # A trial may have been finished behind the driver's back, e.g. failed by the scheduler
+    # because its heartbeat stopped, in which case telling it again would raise.
+    return study._storage.get_trial(trial._trial_id).state.is_finished()
+
+
+def _tell(
+    study: optuna.Study,
+    trial: optuna.Trial,
+    state: TrialState | None,
+    value_or_values: float | Sequence[float] | None,
+    func_err: Exception | None,
+) -> FrozenTrial:
+    # Mirrors how ``Study.optimize`` finishes and logs a trial.
+    if _is_finished(study, trial):
+        frozen_trial = copy.deepcopy(study._storage.get_trial(trial._trial_id))
+        _logger.warning(
+            f"Trial {frozen_trial.number} was already finished with state "
+            f"{frozen_trial.state.name}, so its result is discarded."
+        )
+        return frozen_trial
+
+    updated_state, values, warning_message = _tell_with_warning(
+        study=study,
+        trial=trial,
+        value_or_values=value_or_values,
+        state=state,
+        suppress_warning=True,
+    )
+    frozen_trial = copy.deepcopy(study._storage.get_trial(trial._trial_id))
+    if updated_state == TrialState.COMPLETE:
+        assert values is not None
+        study._log_completed_trial(values, frozen_trial.number, frozen_trial.params)
+    elif updated_state == TrialState.PRUNED:
+        _logger.info(f"Trial {frozen_trial.number} pruned. {str(func_err)}")
+    elif func_err is not None:
+        _log_failed_trial(
+            frozen_trial.number,
+            frozen_trial.params,
+            repr(func_err),
+            value_or_values=value_or_values,
+        )
+    else:
+        assert warning_message is not None
+        _log_failed_trial(
+            frozen_trial.number,
+            frozen_trial.params,
+            warning_message,
+            value_or_values=value_or_values,
+        )
+    return frozen_trial
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import array
 import asyncio
+import base64
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Callable
 from collections.abc import Container
 from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from datetime import datetime
+from datetime import timedelta
+import functools
+import itertools
+import os
+import pickle
+import sys
+import threading
+import time
 from typing import Any
+from typing import BinaryIO
 import uuid
+import zlib
 
 import optuna
+from optuna import logging
 from optuna._experimental import experimental_class
 from optuna._typing import JSONSerializable
 from optuna.distributions import BaseDistribution
@@ -17,6 +37,7 @@ from optuna.distributions import distribution_to_json
 from optuna.distributions import json_to_distribution
 from optuna.storages import BaseStorage
 from optuna.storages import InMemoryStorage
+from optuna.storages._heartbeat import BaseHeartbeat
 from optuna.study import StudyDirection
 from optuna.study._frozen import FrozenStudy
 from optuna.trial import FrozenTrial
@@ -32,6 +53,11 @@ with try_import() as _imports:
     from distributed.protocol.pickle import loads
     from distributed.utils import thread_state  # type: ignore[attr-defined]
     from distributed.worker import get_client
+    from tornado.ioloop import PeriodicCallback
+    import tqdm
+
+
+_logger = logging.get_logger(__name__)
 
 
 def _serialize_frozentrial(trial: FrozenTrial) -> dict:
@@ -64,17 +90,219 @@ def _deserialize_frozentrial(data: dict) -> FrozenTrial:
         data["datetime_start"] = datetime.fromisoformat(data["datetime_start"])
     if data["datetime_complete"] is not None:
         data["datetime_complete"] = datetime.fromisoformat(data["datetime_complete"])
-    data["system_attrs"] = (
+    data["system_attrs"] = _decode_attr_values(
         loads(data["system_attrs"])  # type: ignore[no-untyped-call]
         if data["system_attrs"]
         else {}
     )
-    data["user_attrs"] = (
+    data["user_attrs"] = _decode_attr_values(
         loads(data["user_attrs"]) if data["user_attrs"] else {}  # type: ignore[no-untyped-call]
     )
     return FrozenTrial(**data)
 
 
+_EPOCH = datetime(1970, 1, 1)
+_NO_DATETIME = -(2**63)
+_INTERNABLE_ATTR_TYPES = (str, int, float, bool, type(None))
+
+
+def _pack(typecode: str, values: Iterable[Any]) -> bytes:
+    return array.array(typecode, values).tobytes()
+
+
+def _unpack(typecode: str, data: bytes, byteorder: str) -> array.array:
+    unpacked = array.array(typecode)
+    unpacked.frombytes(data)
+    if byteorder != sys.byteorder:
+        unpacked.byteswap()
+    return unpacked
+
+
+def _datetime_to_microseconds(dt: datetime | None) -> int:
+    if dt is None:
+        return _NO_DATETIME
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+def _microseconds_to_datetime(microseconds: int) -> datetime | None:
+    if microseconds == _NO_DATETIME:
+        return None
+    return _EPOCH + timedelta(microseconds=microseconds)
+
+
+def _encode_attrs(attrs_list: list[dict[str, Any]]) -> dict:
+    key_ids: dict[str, int] = {}
+    value_ids: dict[tuple[type, Any], int] = {}
+    value_table: list[Any] = []
+    counts = []
+    keys = []
+    values = []
+    for attrs in attrs_list:
+        counts.append(len(attrs))
+        for key, value in attrs.items():
+            keys.append(key_ids.setdefault(key, len(key_ids)))
+            # Only scalars are deduplicated so that e.g. ``(1, 2)`` and ``(1.0, 2)`` stay apart.
+            if type(value) in _INTERNABLE_ATTR_TYPES:
+                value_id = value_ids.setdefault((type(value), value), len(value_table))
+                if value_id == len(value_table):
+                    value_table.append(value)
+            else:
+                value_id = len(value_table)
+                value_table.append(value)
+            values.append(value_id)
+    return {
+        "counts": _pack("q", counts),
+        "keys": _pack("q", keys),
+        "values": _pack("q", values),
+        "key_table": list(key_ids),
+        "value_table": dumps(value_table) if value_table else b"",  # type: ignore[no-untyped-call]
+    }
+
+
+def _decode_attrs(data: dict, byteorder: str) -> list[dict[str, Any]]:
+    key_table = data["key_table"]
+    value_table = loads(data["value_table"]) if data["value_table"] else []  # type: ignore[no-untyped-call]  # NOQA: E501
+    keys = _unpack("q", data["keys"], byteorder)
+    values = _unpack("q", data["values"], byteorder)
+    value_table = [_decode_attr_value(value) for value in value_table]
+    attrs_list = []
+    offset = 0
+    for count in _unpack("q", data["counts"], byteorder):
+        attrs_list.append(
+            {key_table[keys[i]]: value_table[values[i]] for i in range(offset, offset + count)}
+        )
+        offset += count
+    return attrs_list
+
+
+def _serialize_frozentrials(
+    trials: Sequence[FrozenTrial], distribution_ids: dict[BaseDistribution, int]
+) -> dict:
+    # Encodes a batch of trials column by column. Distributions are replaced by their ids in
+    # ``distribution_ids``, which is extended with unseen distributions and is expected to be
+    # shipped to the receiver separately.
+    param_name_ids: dict[str, int] = {}
+    n_values = []
+    values = []
+    n_params = []
+    param_names = []
+    param_distributions = []
+    param_values = []
+    n_intermediate_values = []
+    intermediate_steps: list[int] = []
+    intermediate_values: list[float] = []
+    for trial in trials:
+        if trial.values is None:
+            n_values.append(-1)
+        else:
+            n_values.append(len(trial.values))
+            values.extend(trial.values)
+        n_params.append(len(trial.distributions))
+        for name, distribution in trial.distributions.items():
+            param_names.append(param_name_ids.setdefault(name, len(param_name_ids)))
+            param_distributions.append(
+                distribution_ids.setdefault(distribution, len(distribution_ids))
+            )
+            param_values.append(distribution.to_internal_repr(trial.params[name]))
+        n_intermediate_values.append(len(trial.intermediate_values))
+        intermediate_steps.extend(trial.intermediate_values.keys())
+        intermediate_values.extend(trial.intermediate_values.values())
+
+    return {
+        "byteorder": sys.byteorder,
+        "trial_ids": _pack("q", (t._trial_id for t in trials)),
+        "numbers": _pack("q", (t.number for t in trials)),
+        "states": _pack("b", (t.state.value for t in trials)),
+        "datetime_start": _pack(
+            "q", (_datetime_to_microseconds(t.datetime_start) for t in trials)
+        ),
+        "datetime_complete": _pack(
+            "q", (_datetime_to_microseconds(t.datetime_complete) for t in trials)
+        ),
+        "n_values": _pack("q", n_values),
+        "values": _pack("d", values),
+        "n_params": _pack("q", n_params),
+        "param_name_table": list(param_name_ids),
+        "param_names": _pack("q", param_names),
+        "param_distributions": _pack("q", param_distributions),
+        "param_values": _pack("d", param_values),
+        "n_intermediate_values": _pack("q", n_intermediate_values),
+        "intermediate_steps": _pack("q", intermediate_steps),
+        "intermediate_values": _pack("d", intermediate_values),
+        "user_attrs": _encode_attrs([t.user_attrs for t in trials]),
+        "system_attrs": _encode_attrs([t.system_attrs for t in trials]),
+    }
+
+
+def _deserialize_frozentrials(
+    data: dict, distributions: Sequence[BaseDistribution]
+) -> list[FrozenTrial]:
+    byteorder = data["byteorder"]
+    trial_ids = _unpack("q", data["trial_ids"], byteorder)
+    numbers = _unpack("q", data["numbers"], byteorder)
+    states = _unpack("b", data["states"], byteorder)
+    datetime_start = _unpack("q", data["datetime_start"], byteorder)
+    datetime_complete = _unpack("q", data["datetime_complete"], byteorder)
+    n_values = _unpack("q", data["n_values"], byteorder)
+    values = _unpack("d", data["values"], byteorder).tolist()
+    n_params = _unpack("q", data["n_params"], byteorder)
+    param_name_table = data["param_name_table"]
+    param_names = _unpack("q", data["param_names"], byteorder)
+    param_distributions = _unpack("q", data["param_distributions"], byteorder)
+    param_values = _unpack("d", data["param_values"], byteorder)
+    n_intermediate_values = _unpack("q", data["n_intermediate_values"], byteorder)
+    intermediate_steps = _unpack("q", data["intermediate_steps"], byteorder)
+    intermediate_values = _unpack("d", data["intermediate_values"], byteorder)
+    user_attrs = _decode_attrs(data["user_attrs"], byteorder)
+    system_attrs = _decode_attrs(data["system_attrs"], byteorder)
+
+    trials = []
+    values_offset = 0
+    params_offset = 0
+    intermediate_offset = 0
+    for i in range(len(trial_ids)):
+        trial_values = None
+        if n_values[i] >= 0:
+            trial_values = values[values_offset : values_offset + n_values[i]]
+            values_offset += n_values[i]
+
+        params = {}
+        trial_distributions = {}
+        for j in range(params_offset, params_offset + n_params[i]):
+            name = param_name_table[param_names[j]]
+            distribution = distributions[param_distributions[j]]
+            params[name] = distribution.to_external_repr(param_values[j])
+            trial_distributions[name] = distribution
+        params_offset += n_params[i]
+
+        intermediate_end = intermediate_offset + n_intermediate_values[i]
+        trial_intermediate_values = dict(
+            zip(
+                intermediate_steps[intermediate_offset:intermediate_end],
+                intermediate_values[intermediate_offset:intermediate_end],
+            )
+        )
+        intermediate_offset = intermediate_end
+
+        trials.append(
+            FrozenTrial(
+                number=numbers[i],
+                state=TrialState(states[i]),
+                value=None,
+                values=trial_values,
+                datetime_start=_microseconds_to_datetime(datetime_start[i]),
+                datetime_complete=_microseconds_to_datetime(datetime_complete[i]),
+                params=params,
+                distributions=trial_distributions,
+                user_attrs=user_attrs[i],
+                system_attrs=system_attrs[i],
+                intermediate_values=trial_intermediate_values,
+                trial_id=trial_ids[i],
+            )
+        )
+    return trials
+
+
 def _serialize_frozenstudy(study: FrozenStudy) -> dict:
     data = {
         "directions": [d.name for d in study._directions],
@@ -95,21 +323,359 @@ def _serialize_frozenstudy(study: FrozenStudy) -> dict:
 def _deserialize_frozenstudy(data: dict) -> FrozenStudy:
     data["directions"] = [StudyDirection[d] for d in data["directions"]]
     data["direction"] = None
-    data["system_attrs"] = (
+    data["system_attrs"] = _decode_attr_values(
         loads(data["system_attrs"])  # type: ignore[no-untyped-call]
         if data["system_attrs"]
         else {}
     )
-    data["user_attrs"] = (
+    data["user_attrs"] = _decode_attr_values(
         loads(data["user_attrs"]) if data["user_attrs"] else {}  # type: ignore[no-untyped-call]
     )
     return FrozenStudy(**data)
 
 
+# Attribute values larger than ``DaskStorage``'s ``attr_compression_threshold`` are stored as
+# ``{_COMPRESSED_ATTR_KEY: <base64 of the zlib-compressed pickle>}``, which every backend can
+# store as JSON. In bulk listings, the scheduler may replace them by ``{_OMITTED_ATTR_KEY: None}``.
+_COMPRESSED_ATTR_KEY = "__optuna_dask_compressed__"
+_OMITTED_ATTR_KEY = "__optuna_dask_omitted__"
+
+
+def _encode_attr_value(value: Any, compression_threshold: int | None) -> bytes:
+    data = dumps(value)  # type: ignore[no-untyped-call]
+    if compression_threshold is None or len(data) <= compression_threshold:
+        return data
+    compressed = base64.b64encode(zlib.compress(data)).decode("ascii")
+    return dumps({_COMPRESSED_ATTR_KEY: compressed})  # type: ignore[no-untyped-call]
+
+
+def _is_attr_marker(value: Any, key: str) -> bool:
+    return type(value) is dict and len(value) == 1 and key in value
+
+
+def _decode_attr_value(value: Any) -> Any:
+    if _is_attr_marker(value, _COMPRESSED_ATTR_KEY):
+        data = zlib.decompress(base64.b64decode(value[_COMPRESSED_ATTR_KEY]))
+        return loads(data)  # type: ignore[no-untyped-call]
+    return value
+
+
+def _decode_attr_values(attrs: dict[str, Any]) -> dict[str, Any]:
+    return {key: _decode_attr_value(value) for key, value in attrs.items()}
+
+
+def _omit_compressed_attrs(trial: FrozenTrial) -> FrozenTrial:
+    # Returns a shallow copy so that the trial held by the backend is left untouched.
+    def _omit(attrs: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: (
+                {_OMITTED_ATTR_KEY: None}
+                if _is_attr_marker(value, _COMPRESSED_ATTR_KEY)
+                else value
+            )
+            for key, value in attrs.items()
+        }
+
+    if not any(
+        _is_attr_marker(value, _COMPRESSED_ATTR_KEY)
+        for value in itertools.chain(trial.user_attrs.values(), trial.system_attrs.values())
+    ):
+        return trial
+    trial = copy.copy(trial)
+    trial.user_attrs = _omit(trial.user_attrs)
+    trial.system_attrs = _omit(trial.system_attrs)
+    return trial
+
+
+class _LazyAttrs(dict):
+    """Attributes of a trial whose omitted values are fetched from the scheduler when read.
+
+    A fetched value replaces its placeholder, so each value is fetched at most once per copy.
+    Pickling the attributes fetches every omitted value and produces a plain :obj:`dict`.
+    """
+
+    def __init__(self, attrs: dict[str, Any], fetch: Callable[[str], Any]) -> None:
+        super().__init__(attrs)
+        self._fetch = fetch
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if _is_attr_marker(value, _OMITTED_ATTR_KEY):
+            value = self._fetch(key)
+            super().__setitem__(key, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding ``__iter__`` also keeps ``dict(attrs)`` and ``{**attrs}`` from copying the
+        # placeholders directly, since CPython then goes through ``keys`` and ``__getitem__``.
+        return iter(list(super().keys()))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [self[key] for key in self]
+
+    def items(self) -> list[tuple[str, Any]]:  # type: ignore[override]
+        return [(key, self[key]) for key in self]
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self.items()),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> _LazyAttrs:
+        attrs = {key: copy.deepcopy(value, memo) for key, value in super().items()}
+        return _LazyAttrs(attrs, self._fetch)
+
+
+def _wrap_omitted_attrs(trial: FrozenTrial, fetch: Callable[[int, bool, str], Any]) -> None:
+    for system in (False, True):
+        attrs = trial.system_attrs if system else trial.user_attrs
+        if any(_is_attr_marker(value, _OMITTED_ATTR_KEY) for value in attrs.values()):
+            lazy_attrs = _LazyAttrs(attrs, functools.partial(fetch, trial._trial_id, system))
+            if system:
+                trial.system_attrs = lazy_attrs
+            else:
+                trial.user_attrs = lazy_attrs
+
+
+_BATCHABLE_METHODS = (
+    "set_trial_param",
+    "set_trial_state_values",
+    "set_trial_intermediate_value",
+    "set_trial_user_attr",
+    "set_trial_system_attr",
+    "record_heartbeat",
+)
+
+
+_JOURNALED_METHODS = (
+    "create_new_study",
+    "delete_study",
+    "set_study_user_attr",
+    "set_study_system_attr",
+    "create_new_trial",
+    "set_trial_param",
+    "set_trial_state_values",
+    "set_trial_intermediate_value",
+    "set_trial_user_attr",
+    "set_trial_system_attr",
+)
+
+
+def _study_topic(storage_name: str, study_id: int) -> str:
+    return f"optuna-{storage_name}-{study_id}"
+
+
+class _StudyChangeLog:
+    """Per-study log of trial changes kept on the scheduler.
+
+    Every write to a trial bumps the study version and moves the trial to the end of
+    ``trial_versions``, so the trials changed after a given watermark can be found by walking
+    the log backwards. ``epoch`` identifies the log itself and lets clients detect that it has
+    been reset, e.g. after the study was deleted. The log also interns the study's
+    distributions, which clients keep in the same order so that they are sent only once.
+    """
+
+    def __init__(self) -> None:
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self.trial_versions: OrderedDict[int, int] = OrderedDict()
+        self.distribution_ids: dict[BaseDistribution, int] = {}
+        self.distributions: list[str] = []
+
+    def record(self, trial_id: int) -> None:
+        self.version += 1
+        self.trial_versions[trial_id] = self.version
+        self.trial_versions.move_to_end(trial_id)
+
+    def serialize_trials(self, trials: Sequence[FrozenTrial]) -> dict:
+        serialized_trials = _serialize_frozentrials(trials, self.distribution_ids)
+        for distribution in itertools.islice(self.distribution_ids, len(self.distributions), None):
+            self.distributions.append(distribution_to_json(distribution))
+        return serialized_trials
+
+    def changed_since(self, watermark: int) -> list[int]:
+        changed = []
+        for trial_id, version in reversed(self.trial_versions.items()):
+            if version <= watermark:
+                break
+            changed.append(trial_id)
+        changed.reverse()
+        return changed
+
+
+def _dominates(values0: Sequence[float], values1: Sequence[float]) -> bool:
+    return all(v0 <= v1 for v0, v1 in zip(values0, values1)) and any(
+        v0 < v1 for v0, v1 in zip(values0, values1)
+    )
+
+
+class _StudySummary:
+    """Per-study aggregates that the scheduler maintains incrementally.
+
+    A summary is built from the backend once, on first use, and then kept up to date by the
+    extension's write handlers, so that queries on it never have to scan the study's trials.
+    """
+
+    def __init__(
+        self, trials: Iterable[FrozenTrial], directions: Sequence[StudyDirection]
+    ) -> None:
+        self.trial_states: dict[int, TrialState] = {}
+        self.state_counts: Counter[TrialState] = Counter()
+        self.n_objectives = len(directions)
+        # Values are negated for maximized objectives so that smaller is always better.
+        self._signs = [-1.0 if d == StudyDirection.MAXIMIZE else 1.0 for d in directions]
+        self.pareto_front: dict[int, list[float]] = {}
+        for trial in trials:
+            self.update(trial._trial_id, trial.state, trial.values)
+
+    def update(
+        self, trial_id: int, state: TrialState, values: Sequence[float] | None = None
+    ) -> None:
+        old_state = self.trial_states.get(trial_id)
+        if old_state is not None:
+            self.state_counts[old_state] -= 1
+        self.trial_states[trial_id] = state
+        self.state_counts[state] += 1
+        if state == TrialState.COMPLETE and values is not None:
+            self._add_complete_trial(trial_id, [s * v for s, v in zip(self._signs, values)])
+
+    @property
+    def best_trial_id(self) -> int | None:
+        # With a single objective, the front holds the trials tied for the best value. Ties go
+        # to the smallest trial ID, i.e. the smallest number, as in ``BaseStorage``.
+        return min(self.pareto_front) if self.pareto_front else None
+
+    def _add_complete_trial(self, trial_id: int, values: list[float]) -> None:
+        if any(_dominates(other, values) for other in self.pareto_front.values()):
+            return
+        self.pareto_front = {
+            other_id: other
+            for other_id, other in self.pareto_front.items()
+            if not _dominates(values, other)
+        }
+        self.pareto_front[trial_id] = values
+
+    def count(self, states: Iterable[TrialState] | None) -> int:
+        if states is None:
+            return len(self.trial_states)
+        return sum(self.state_counts[state] for state in states)
+
+
+class _InMemoryStorageJournal:
+    """Append-only log of the writes to an InMemoryStorage, compacted by snapshots.
+
+    Every write applied to the storage is appended to the journal file as a pickled record.
+    From time to time, a snapshot of the whole storage is written next to the journal, which
+    then starts over. Restoring the storage only replays the records after the snapshot.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._snapshot_path = f"{path}.snapshot"
+        self._file: BinaryIO | None = None
+        self._seq = 0
+        self._n_records_since_snapshot = 0
+
+    def restore(self) -> InMemoryStorage:
+        storage = InMemoryStorage()
+        snapshot_seq = 0
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, "rb") as f:
+                snapshot_seq, storage = pickle.load(f)
+        self._seq = snapshot_seq
+
+        offset = 0
+        if os.path.exists(self._path):
+            with open(self._path, "rb") as f:
+                while True:
+                    try:
+                        seq, method, kwargs = pickle.load(f)
+                    except (EOFError, pickle.UnpicklingError):
+                        # A record cut short by a crash ends the journal.
+                        break
+                    offset = f.tell()
+                    # Records up to the snapshot remain if the scheduler stopped between writing
+                    # the snapshot and truncating the journal.
+                    if seq > snapshot_seq:
+                        self._replay(storage, method, kwargs)
+                        self._seq = seq
+                        self._n_records_since_snapshot += 1
+
+        self._file = open(self._path, "ab")
+        self._file.truncate(offset)
+        return storage
+
+    @staticmethod
+    def _replay(storage: InMemoryStorage, method: str, kwargs: dict[str, Any]) -> None:
+        if method != "set_trial_state_values":
+            getattr(storage, method)(**kwargs)
+            return
+        kwargs = kwargs.copy()
+        datetime_start = kwargs.pop("datetime_start")
+        datetime_complete = kwargs.pop("datetime_complete")
+        storage.set_trial_state_values(**kwargs)
+        # The timestamps are those of the original write rather than of the replay.
+        trial = copy.copy(storage.get_trial(kwargs["trial_id"]))
+        trial.datetime_start = datetime_start
+        trial.datetime_complete = datetime_complete
+        storage._set_trial(kwargs["trial_id"], trial)
+
+    def append(self, method: str, kwargs: dict[str, Any]) -> None:
+        assert self._file is not None
+        self._seq += 1
+        pickle.dump((self._seq, method, kwargs), self._file)
+        self._file.flush()
+        self._n_records_since_snapshot += 1
+
+    def snapshot(self, storage: InMemoryStorage) -> None:
+        assert self._file is not None
+        if self._n_records_since_snapshot == 0:
+            return
+        # The snapshot is written aside and moved into place, so that a crash never leaves a
+        # partial snapshot behind.
+        tmp_path = f"{self._snapshot_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((self._seq, storage), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        self._file.truncate(0)
+        self._n_records_since_snapshot = 0
+
+    def close(self, storage: InMemoryStorage) -> None:
+        if self._file is None:
+            return
+        self.snapshot(storage)
+        self._file.close()
+        self._file = None
+
+
 class _OptunaSchedulerExtension:
     def __init__(self, scheduler: "distributed.Scheduler"):
         self.scheduler = scheduler
         self.storages: dict[str, BaseStorage] = {}
+        self._change_logs: dict[tuple[str, int], _StudyChangeLog] = {}
+        self._trial_study_ids: dict[str, dict[int, int]] = {}
+        self._study_locks: dict[tuple[str, int], asyncio.Lock] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._subscriptions: dict[tuple[str, int], int] = {}
+        self._summaries: dict[tuple[str, int], _StudySummary] = {}
+        self._grace_periods: dict[str, int] = {}
+        self._heartbeats: dict[str, dict[int, float]] = {}
+        self._journals: dict[str, _InMemoryStorageJournal] = {}
 
         methods = [
             "create_new_study",
@@ -132,8 +698,18 @@ class _OptunaSchedulerExtension:
             "set_trial_user_attr",
             "set_trial_system_attr",
             "get_trial",
+            "get_trial_attr",
             "get_all_trials",
+            "get_trials_since",
+            "get_trials_by_number",
             "get_n_trials",
+            "apply_batch",
+            "subscribe_study",
+            "unsubscribe_study",
+            "get_best_trial",
+            "get_pareto_front_trials",
+            "record_heartbeat",
+            "get_stale_trial_ids",
         ]
         handlers = {f"optuna_{method}": getattr(self, method) for method in methods}
         self.scheduler.handlers.update(handlers)
@@ -143,27 +719,233 @@ class _OptunaSchedulerExtension:
     def get_storage(self, name: str) -> BaseStorage:
         return self.storages[name]
 
-    def create_new_study(
+    def teardown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        for storage_name, journal in self._journals.items():
+            journal.close(self.storages[storage_name])  # type: ignore[arg-type]
+
+    def enable_journal(
+        self, storage_name: str, journal: _InMemoryStorageJournal, snapshot_interval: int
+    ) -> None:
+        self._journals[storage_name] = journal
+        storage = self.storages[storage_name]
+        assert isinstance(storage, InMemoryStorage)
+        pc = PeriodicCallback(lambda: journal.snapshot(storage), snapshot_interval * 1000)
+        self.scheduler.periodic_callbacks[f"optuna-snapshot-{storage_name}"] = pc
+        pc.start()
+
+    def _journal_write(
+        self, storage_name: str, method: str, kwargs: dict[str, Any], result: Any
+    ) -> None:
+        # Records carry whatever the backend generated itself, e.g. default study names and
+        # timestamps, so that replaying them reproduces the storage exactly.
+        storage = self.storages[storage_name]
+        if method == "create_new_study":
+            kwargs = {**kwargs, "study_name": storage.get_study_name_from_id(result)}
+        elif method == "create_new_trial":
+            kwargs = {"study_id": kwargs["study_id"], "template_trial": storage.get_trial(result)}
+        elif method == "set_trial_state_values":
+            if not result:
+                return
+            trial = storage.get_trial(kwargs["trial_id"])
+            kwargs = {
+                **kwargs,
+                "datetime_start": trial.datetime_start,
+                "datetime_complete": trial.datetime_complete,
+            }
+        self._journals[storage_name].append(method, kwargs)
+
+    def enable_heartbeat(
+        self, storage_name: str, heartbeat_interval: int, grace_period: int
+    ) -> None:
+        self._grace_periods[storage_name] = grace_period
+        self._heartbeats.setdefault(storage_name, {})
+        key = f"optuna-heartbeat-{storage_name}"
+        if key not in self.scheduler.periodic_callbacks:
+            # The scheduler stops its periodic callbacks when it closes.
+            pc = PeriodicCallback(
+                lambda: self._fail_stale_trials(storage_name), heartbeat_interval * 1000
+            )
+            self.scheduler.periodic_callbacks[key] = pc
+            pc.start()
+
+    def _record_heartbeat(self, storage_name: str, trial_id: int) -> None:
+        # Heartbeats are kept in memory and timed with the scheduler's clock only, so that
+        # recording one never touches the backend.
+        heartbeats = self._heartbeats.get(storage_name)
+        if heartbeats is not None:
+            heartbeats[trial_id] = time.monotonic()
+
+    def _refresh_heartbeat(self, storage_name: str, trial_id: int) -> None:
+        # Like RDBStorage, only trials that have recorded a heartbeat are watched, so that
+        # trials without a heartbeat thread, e.g. those run with ask-and-tell, are never failed.
+        heartbeats = self._heartbeats.get(storage_name)
+        if heartbeats is not None and trial_id in heartbeats:
+            heartbeats[trial_id] = time.monotonic()
+
+    def _forget_heartbeat(self, storage_name: str, trial_id: int) -> None:
+        heartbeats = self._heartbeats.get(storage_name)
+        if heartbeats is not None:
+            heartbeats.pop(trial_id, None)
+
+    def _get_stale_trial_ids(self, storage_name: str) -> list[int]:
+        heartbeats = self._heartbeats.get(storage_name, {})
+        deadline = time.monotonic() - self._grace_periods.get(storage_name, 0)
+        return [trial_id for trial_id, heartbeat in heartbeats.items() if heartbeat < deadline]
+
+    async def _fail_stale_trials(self, storage_name: str) -> None:
+        for trial_id in self._get_stale_trial_ids(storage_name):
+            self._forget_heartbeat(storage_name, trial_id)
+            try:
+                failed = await self._write_trial(
+                    storage_name,
+                    "set_trial_state_values",
+                    trial_id=trial_id,
+                    state=TrialState.FAIL,
+                    values=None,
+                )
+            except (optuna.exceptions.UpdateFinishedTrialError, KeyError):
+                # The trial has finished or has been deleted in the meantime.
+                continue
+            if failed:
+                _logger.warning(
+                    f"Trial with ID {trial_id} failed because its heartbeat has not been "
+                    f"recorded for {self._grace_periods[storage_name]} seconds."
+                )
+
+    async def _call(self, storage_name: str, func: Callable[[BaseStorage], Any]) -> Any:
+        # Backends other than InMemoryStorage may block on I/O, e.g. SQL queries, so they are
+        # called from a thread pool to keep the scheduler's event loop free for Dask itself.
+        storage = self.get_storage(storage_name)
+        if isinstance(storage, InMemoryStorage):
+            return func(storage)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="optuna-dask-storage")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, storage)
+
+    async def _run(self, storage_name: str, method: str, **kwargs: Any) -> Any:
+        result = await self._call(storage_name, lambda storage: getattr(storage, method)(**kwargs))
+        # Journaled storages are in memory and thus written inline, so that records are
+        # appended in the order in which the writes were applied.
+        if storage_name in self._journals and method in _JOURNALED_METHODS:
+            self._journal_write(storage_name, method, kwargs, result)
+        return result
+
+    def _study_lock(self, storage_name: str, study_id: int) -> asyncio.Lock:
+        # Reads run concurrently, while writes to the same study are applied one at a time.
+        key = (storage_name, study_id)
+        if key not in self._study_locks:
+            self._study_locks[key] = asyncio.Lock()
+        return self._study_locks[key]
+
+    def _get_change_log(self, storage_name: str, study_id: int) -> _StudyChangeLog:
+        key = (storage_name, study_id)
+        if key not in self._change_logs:
+            self._change_logs[key] = _StudyChangeLog()
+        return self._change_logs[key]
+
+    async def _get_summary(self, storage_name: str, study_id: int) -> _StudySummary:
+        key = (storage_name, study_id)
+        if key not in self._summaries:
+            # The lock keeps writes out while the summary is built from the backend.
+            async with self._study_lock(storage_name, study_id):
+                if key not in self._summaries:
+                    trials = await self._run(
+                        storage_name, "get_all_trials", study_id=study_id, deepcopy=False
+                    )
+                    directions = await self._run(
+                        storage_name, "get_study_directions", study_id=study_id
+                    )
+                    self._summaries[key] = _StudySummary(trials, directions)
+        return self._summaries[key]
+
+    def _update_summary(
+        self,
+        storage_name: str,
+        study_id: int,
+        trial_id: int,
+        state: TrialState,
+        values: Sequence[float] | None,
+    ) -> None:
+        # A summary that has not been built yet will see this write in the backend.
+        summary = self._summaries.get((storage_name, study_id))
+        if summary is not None:
+            summary.update(trial_id, state, values)
+
+    async def _get_study_id(self, storage_name: str, trial_id: int) -> int:
+        trial_study_ids = self._trial_study_ids.setdefault(storage_name, {})
+        if trial_id not in trial_study_ids:
+            # The trial was created before this extension saw it, e.g. in a resumed RDB study.
+            for study in await self._run(storage_name, "get_all_studies"):
+                trials = await self._run(
+                    storage_name, "get_all_trials", study_id=study._study_id, deepcopy=False
+                )
+                for trial in trials:
+                    trial_study_ids[trial._trial_id] = study._study_id
+        return trial_study_ids[trial_id]
+
+    async def _write_trial(
+        self, storage_name: str, method: str, trial_id: int, **kwargs: Any
+    ) -> Any:
+        study_id = await self._get_study_id(storage_name, trial_id)
+        async with self._study_lock(storage_name, study_id):
+            result = await self._run(storage_name, method, trial_id=trial_id, **kwargs)
+            if result is not False:
+                self._get_change_log(storage_name, study_id).record(trial_id)
+            if method == "set_trial_state_values" and result:
+                self._update_summary(
+                    storage_name, study_id, trial_id, kwargs["state"], kwargs["values"]
+                )
+        # Any write to a trial that has recorded a heartbeat doubles as its next heartbeat, so
+        # that workers rarely have to send heartbeats of their own.
+        if method == "set_trial_state_values" and kwargs["state"].is_finished():
+            self._forget_heartbeat(storage_name, trial_id)
+        else:
+            self._refresh_heartbeat(storage_name, trial_id)
+        if method == "set_trial_state_values" and result:
+            await self._publish_trial(storage_name, study_id, trial_id)
+        return result
+
+    async def _publish_trial(self, storage_name: str, study_id: int, trial_id: int) -> None:
+        if not self._subscriptions.get((storage_name, study_id)):
+            return
+        trial = await self._run(storage_name, "get_trial", trial_id=trial_id)
+        self.scheduler.log_event(
+            _study_topic(storage_name, study_id),
+            {
+                "epoch": self._get_change_log(storage_name, study_id).epoch,
+                "trial": _serialize_frozentrial(trial),
+            },
+        )
+
+    async def create_new_study(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         directions: list[str],
         study_name: str | None = None,
     ) -> int:
-        return self.get_storage(storage_name).create_new_study(
+        return await self._run(
+            storage_name,
+            "create_new_study",
             directions=[StudyDirection[direction] for direction in directions],
             study_name=study_name,
         )
 
-    def delete_study(
+    async def delete_study(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
     ) -> None:
-        return self.get_storage(storage_name).delete_study(study_id=study_id)
+        async with self._study_lock(storage_name, study_id):
+            await self._run(storage_name, "delete_study", study_id=study_id)
+            self._change_logs.pop((storage_name, study_id), None)
+            self._summaries.pop((storage_name, study_id), None)
 
-    def set_study_user_attr(
+    async def set_study_user_attr(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -171,11 +953,16 @@ class _OptunaSchedulerExtension:
         key: str,
         value: Any,
     ) -> None:
-        return self.get_storage(storage_name).set_study_user_attr(
-            study_id=study_id, key=key, value=loads(value)  # type: ignore[no-untyped-call]
-        )
+        async with self._study_lock(storage_name, study_id):
+            await self._run(
+                storage_name,
+                "set_study_user_attr",
+                study_id=study_id,
+                key=key,
+                value=loads(value),  # type: ignore[no-untyped-call]
+            )
 
-    def set_study_system_attr(
+    async def set_study_system_attr(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -183,66 +970,67 @@ class _OptunaSchedulerExtension:
         key: str,
         value: Any,
     ) -> None:
-        return self.get_storage(storage_name).set_study_system_attr(
-            study_id=study_id,
-            key=key,
-            value=loads(value),  # type: ignore[no-untyped-call]
-        )
+        async with self._study_lock(storage_name, study_id):
+            await self._run(
+                storage_name,
+                "set_study_system_attr",
+                study_id=study_id,
+                key=key,
+                value=loads(value),  # type: ignore[no-untyped-call]
+            )
 
-    def get_study_id_from_name(
+    async def get_study_id_from_name(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_name: str,
     ) -> int:
-        return self.get_storage(storage_name).get_study_id_from_name(study_name=study_name)
+        return await self._run(storage_name, "get_study_id_from_name", study_name=study_name)
 
-    def get_study_name_from_id(
+    async def get_study_name_from_id(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
     ) -> str:
-        return self.get_storage(storage_name).get_study_name_from_id(study_id=study_id)
+        return await self._run(storage_name, "get_study_name_from_id", study_id=study_id)
 
-    def get_study_directions(
+    async def get_study_directions(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
     ) -> list[str]:
-        directions = self.get_storage(storage_name).get_study_directions(study_id=study_id)
+        directions = await self._run(storage_name, "get_study_directions", study_id=study_id)
         return [direction.name for direction in directions]
 
-    def get_study_user_attrs(
+    async def get_study_user_attrs(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
     ) -> dict[str, Any]:
-        return dumps(
-            self.get_storage(storage_name).get_study_user_attrs(  # type: ignore[no-untyped-call]
-                study_id=study_id
-            )
+        return dumps(  # type: ignore[no-untyped-call]
+            await self._run(storage_name, "get_study_user_attrs", study_id=study_id)
         )
 
-    def get_study_system_attrs(
+    async def get_study_system_attrs(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
     ) -> dict[str, Any]:
-        return dumps(
-            self.get_storage(storage_name).get_study_system_attrs(  # type: ignore[no-untyped-call]
-                study_id=study_id
-            )
+        return dumps(  # type: ignore[no-untyped-call]
+            await self._run(storage_name, "get_study_system_attrs", study_id=study_id)
         )
 
-    def get_all_studies(self, comm: "distributed.comm.tcp.TCP", storage_name: str) -> list[dict]:
-        studies = self.get_storage(storage_name).get_all_studies()
+    async def get_all_studies(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str
+    ) -> list[dict]:
+        studies = await self._run(storage_name, "get_all_studies")
         return [_serialize_frozenstudy(s) for s in studies]
 
-    def create_new_trial(
+    async def create_new_trial(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -252,12 +1040,29 @@ class _OptunaSchedulerExtension:
         deserialized_template_trial = None
         if template_trial is not None:
             deserialized_template_trial = _deserialize_frozentrial(template_trial)
-        return self.get_storage(storage_name).create_new_trial(
-            study_id=study_id,
-            template_trial=deserialized_template_trial,
-        )
+        async with self._study_lock(storage_name, study_id):
+            trial_id = await self._run(
+                storage_name,
+                "create_new_trial",
+                study_id=study_id,
+                template_trial=deserialized_template_trial,
+            )
+            self._trial_study_ids.setdefault(storage_name, {})[trial_id] = study_id
+            self._get_change_log(storage_name, study_id).record(trial_id)
+            if deserialized_template_trial is None:
+                self._update_summary(storage_name, study_id, trial_id, TrialState.RUNNING, None)
+            else:
+                self._update_summary(
+                    storage_name,
+                    study_id,
+                    trial_id,
+                    deserialized_template_trial.state,
+                    deserialized_template_trial.values,
+                )
+        await self._publish_trial(storage_name, study_id, trial_id)
+        return trial_id
 
-    def set_trial_param(
+    async def set_trial_param(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -266,42 +1071,48 @@ class _OptunaSchedulerExtension:
         param_value_internal: float,
         distribution: str,
     ) -> None:
-        return self.get_storage(storage_name).set_trial_param(
+        await self._write_trial(
+            storage_name,
+            "set_trial_param",
             trial_id=trial_id,
             param_name=param_name,
             param_value_internal=param_value_internal,
             distribution=json_to_distribution(distribution),
         )
 
-    def get_trial_id_from_study_id_trial_number(
+    async def get_trial_id_from_study_id_trial_number(
         self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int, trial_number: int
     ) -> int:
-        return self.get_storage(storage_name).get_trial_id_from_study_id_trial_number(
+        return await self._run(
+            storage_name,
+            "get_trial_id_from_study_id_trial_number",
             study_id=study_id,
             trial_number=trial_number,
         )
 
-    def get_trial_number_from_id(
+    async def get_trial_number_from_id(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         trial_id: int,
     ) -> int:
-        return self.get_storage(storage_name).get_trial_number_from_id(trial_id=trial_id)
+        return await self._run(storage_name, "get_trial_number_from_id", trial_id=trial_id)
 
-    def get_trial_param(
+    async def get_trial_param(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         trial_id: int,
         param_name: str,
     ) -> float:
-        return self.get_storage(storage_name).get_trial_param(
+        return await self._run(
+            storage_name,
+            "get_trial_param",
             trial_id=trial_id,
             param_name=param_name,
         )
 
-    def set_trial_state_values(
+    async def set_trial_state_values(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -309,13 +1120,15 @@ class _OptunaSchedulerExtension:
         state: str,
         values: Sequence[float] | None = None,
     ) -> bool:
-        return self.get_storage(storage_name).set_trial_state_values(
+        return await self._write_trial(
+            storage_name,
+            "set_trial_state_values",
             trial_id=trial_id,
             state=TrialState[state],
             values=values,
         )
 
-    def set_trial_intermediate_value(
+    async def set_trial_intermediate_value(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -323,13 +1136,15 @@ class _OptunaSchedulerExtension:
         step: int,
         intermediate_value: float,
     ) -> None:
-        return self.get_storage(storage_name).set_trial_intermediate_value(
+        await self._write_trial(
+            storage_name,
+            "set_trial_intermediate_value",
             trial_id=trial_id,
             step=step,
             intermediate_value=intermediate_value,
         )
 
-    def set_trial_user_attr(
+    async def set_trial_user_attr(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -337,13 +1152,15 @@ class _OptunaSchedulerExtension:
         key: str,
         value: Any,
     ) -> None:
-        return self.get_storage(storage_name).set_trial_user_attr(
+        await self._write_trial(
+            storage_name,
+            "set_trial_user_attr",
             trial_id=trial_id,
             key=key,
             value=loads(value),  # type: ignore[no-untyped-call]
         )
 
-    def set_trial_system_attr(
+    async def set_trial_system_attr(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -351,22 +1168,36 @@ class _OptunaSchedulerExtension:
         key: str,
         value: JSONSerializable,
     ) -> None:
-        return self.get_storage(storage_name).set_trial_system_attr(
+        await self._write_trial(
+            storage_name,
+            "set_trial_system_attr",
             trial_id=trial_id,
             key=key,
             value=loads(value),  # type: ignore[no-untyped-call]
         )
 
-    def get_trial(
+    async def get_trial(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         trial_id: int,
     ) -> dict:
-        trial = self.get_storage(storage_name).get_trial(trial_id=trial_id)
+        trial = await self._run(storage_name, "get_trial", trial_id=trial_id)
         return _serialize_frozentrial(trial)
 
-    def get_all_trials(
+    async def get_trial_attr(
+        self,
+        comm: "distributed.comm.tcp.TCP",
+        storage_name: str,
+        trial_id: int,
+        system: bool,
+        key: str,
+    ) -> bytes:
+        trial = await self._run(storage_name, "get_trial", trial_id=trial_id)
+        attrs = trial.system_attrs if system else trial.user_attrs
+        return dumps(attrs[key])  # type: ignore[no-untyped-call]
+
+    async def get_all_trials(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
@@ -377,34 +1208,180 @@ class _OptunaSchedulerExtension:
         deserialized_states = None
         if states is not None:
             deserialized_states = tuple(TrialState[s] for s in states)
-        trials = self.get_storage(storage_name).get_all_trials(
+        trials = await self._run(
+            storage_name,
+            "get_all_trials",
             study_id=study_id,
             deepcopy=deepcopy,
             states=deserialized_states,
         )
         return [_serialize_frozentrial(t) for t in trials]
 
-    def get_n_trials(
+    async def get_trials_since(
+        self,
+        comm: "distributed.comm.tcp.TCP",
+        storage_name: str,
+        study_id: int,
+        epoch: str | None,
+        watermark: int,
+        n_distributions: int = 0,
+        omit_compressed_attrs: bool = False,
+    ) -> dict:
+        # The watermark is taken before the backend is read. A write that lands while the
+        # trials are read is recorded with a later version and is thus sent again next time.
+        change_log = self._get_change_log(storage_name, study_id)
+        new_watermark = change_log.version
+        full = epoch != change_log.epoch
+        if full:
+            # The client has never synced with this log, so it needs every trial of the study.
+            trials = await self._run(
+                storage_name, "get_all_trials", study_id=study_id, deepcopy=False
+            )
+            trial_study_ids = self._trial_study_ids.setdefault(storage_name, {})
+            for trial in trials:
+                trial_study_ids[trial._trial_id] = study_id
+        else:
+            changed_trial_ids = change_log.changed_since(watermark)
+            trials = await self._call(
+                storage_name,
+                lambda storage: [storage.get_trial(trial_id) for trial_id in changed_trial_ids],
+            )
+        if omit_compressed_attrs:
+            trials = [_omit_compressed_attrs(trial) for trial in trials]
+        serialized_trials = change_log.serialize_trials(trials)
+        return {
+            "epoch": change_log.epoch,
+            "watermark": new_watermark,
+            "full": full,
+            "distributions": change_log.distributions[0 if full else n_distributions :],
+            "trials": serialized_trials,
+        }
+
+    async def get_trials_by_number(
+        self,
+        comm: "distributed.comm.tcp.TCP",
+        storage_name: str,
+        study_id: int,
+        start: int,
+        stop: int,
+        n_distributions: int = 0,
+    ) -> dict:
+        # Trials are read one by one so that only a single chunk of the study is held on the
+        # scheduler at a time, whatever the backend.
+        def _get_trials(storage: BaseStorage) -> list[FrozenTrial]:
+            stop_ = min(stop, storage.get_n_trials(study_id))
+            return [
+                storage.get_trial(storage.get_trial_id_from_study_id_trial_number(study_id, n))
+                for n in range(start, stop_)
+            ]
+
+        trials = await self._call(storage_name, _get_trials)
+        change_log = self._get_change_log(storage_name, study_id)
+        serialized_trials = change_log.serialize_trials(trials)
+        return {
+            "distributions": change_log.distributions[n_distributions:],
+            "trials": serialized_trials,
+        }
+
+    async def apply_batch(
+        self,
+        comm: "distributed.comm.tcp.TCP",
+        storage_name: str,
+        operations: list[tuple[str, dict[str, Any]]],
+    ) -> list[tuple[bool, Any]]:
+        for method, _ in operations:
+            if method not in _BATCHABLE_METHODS:
+                raise ValueError(f"{method} cannot be applied in a batch.")
+        # Operations are applied independently, as they may come from different threads and
+        # trials, and the outcome of each, a result or a pickled error, is sent back.
+        outcomes: list[tuple[bool, Any]] = []
+        for method, kwargs in operations:
+            try:
+                result = await getattr(self, method)(comm, storage_name=storage_name, **kwargs)
+            except Exception as e:
+                outcomes.append((False, dumps(e)))  # type: ignore[no-untyped-call]
+            else:
+                outcomes.append((True, result))
+        return outcomes
+
+    async def get_best_trial(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int
+    ) -> dict:
+        summary = await self._get_summary(storage_name, study_id)
+        if summary.n_objectives > 1:
+            raise RuntimeError(
+                "Best trial can be obtained only for single-objective optimization."
+            )
+        if summary.best_trial_id is None:
+            raise ValueError("No trials are completed yet.")
+        trial = await self._run(storage_name, "get_trial", trial_id=summary.best_trial_id)
+        return _serialize_frozentrial(trial)
+
+    async def get_pareto_front_trials(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int
+    ) -> list[dict]:
+        summary = await self._get_summary(storage_name, study_id)
+        trial_ids = sorted(summary.pareto_front)
+        trials = await self._call(
+            storage_name, lambda storage: [storage.get_trial(trial_id) for trial_id in trial_ids]
+        )
+        return [_serialize_frozentrial(t) for t in trials]
+
+    async def record_heartbeat(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, trial_id: int
+    ) -> None:
+        self._record_heartbeat(storage_name, trial_id)
+
+    async def get_stale_trial_ids(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int
+    ) -> list[int]:
+        trial_study_ids = self._trial_study_ids.get(storage_name, {})
+        return [
+            trial_id
+            for trial_id in self._get_stale_trial_ids(storage_name)
+            if trial_study_ids.get(trial_id) == study_id
+        ]
+
+    def subscribe_study(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int
+    ) -> None:
+        key = (storage_name, study_id)
+        self._subscriptions[key] = self._subscriptions.get(key, 0) + 1
+
+    def unsubscribe_study(
+        self, comm: "distributed.comm.tcp.TCP", storage_name: str, study_id: int
+    ) -> None:
+        key = (storage_name, study_id)
+        if self._subscriptions.get(key, 0) > 1:
+            self._subscriptions[key] -= 1
+        else:
+            self._subscriptions.pop(key, None)
+
+    async def get_n_trials(
         self,
         comm: "distributed.comm.tcp.TCP",
         storage_name: str,
         study_id: int,
         state: tuple[str, ...] | str | None = None,
     ) -> int:
-        deserialized_state: tuple[TrialState, ...] | TrialState | None = None
+        deserialized_states: tuple[TrialState, ...] | None = None
         if state is not None:
             if isinstance(state, str):
-                deserialized_state = TrialState[state]
+                deserialized_states = (TrialState[state],)
             else:
-                deserialized_state = tuple(TrialState[s] for s in state)
-        return self.get_storage(storage_name).get_n_trials(
-            study_id=study_id,
-            state=deserialized_state,
-        )
+                deserialized_states = tuple(TrialState[s] for s in state)
+        summary = await self._get_summary(storage_name, study_id)
+        return summary.count(deserialized_states)
 
 
 def _register_with_scheduler(
-    dask_scheduler: "distributed.Scheduler", storage: None | str | BaseStorage, name: str
+    dask_scheduler: "distributed.Scheduler",
+    storage: None | str | BaseStorage,
+    name: str,
+    heartbeat_interval: int | None = None,
+    grace_period: int | None = None,
+    journal_path: str | None = None,
+    snapshot_interval: int = 600,
 ) -> None:
     if "optuna" not in dask_scheduler.extensions:
         ext = _OptunaSchedulerExtension(dask_scheduler)
@@ -412,11 +1389,83 @@ def _register_with_scheduler(
         ext = dask_scheduler.extensions["optuna"]
 
     if name not in ext.storages:
-        ext.storages[name] = optuna.storages.get_storage(storage)
+        if journal_path is None:
+            ext.storages[name] = optuna.storages.get_storage(storage)
+        else:
+            journal = _InMemoryStorageJournal(journal_path)
+            ext.storages[name] = journal.restore()
+            ext.enable_journal(name, journal, snapshot_interval)
+    if heartbeat_interval is not None:
+        assert grace_period is not None
+        ext.enable_heartbeat(name, heartbeat_interval, grace_period)
+
+
+def _trial_progress(trial: FrozenTrial) -> tuple[int, ...]:
+    return (
+        0 if trial.state == TrialState.WAITING else 1 if trial.state == TrialState.RUNNING else 2,
+        len(trial.params),
+        len(trial.intermediate_values),
+        len(trial.user_attrs),
+        len(trial.system_attrs),
+    )
+
+
+class _StudyTrialCache:
+    """Local copy of the trials of one study, kept in sync with the scheduler's change log."""
+
+    def __init__(self, fetch_attr: Callable[[int, bool, str], Any] | None = None) -> None:
+        # ``fetch_attr`` is given if the scheduler omits compressed attributes from the deltas.
+        self._fetch_attr = fetch_attr
+        self.epoch: str | None = None
+        self.watermark = 0
+        self.trials: dict[int, FrozenTrial] = {}
+        self.distributions: list[BaseDistribution] = []
+
+    def update(self, delta: dict, n_distributions: int) -> None:
+        # Concurrent syncs may complete out of order. A delta taken at or before the current
+        # watermark carries nothing that a later one has not already applied.
+        if delta["epoch"] == self.epoch and delta["watermark"] <= self.watermark:
+            return
+        if delta["full"]:
+            self.trials = {}
+            n_distributions = 0
+        # ``n_distributions`` is the table size the delta was requested with. The table only
+        # ever grows on the scheduler, so the received entries replace anything after it.
+        self.distributions[n_distributions:] = [
+            json_to_distribution(d) for d in delta["distributions"]
+        ]
+        for trial in _deserialize_frozentrials(delta["trials"], self.distributions):
+            if self._fetch_attr is not None:
+                _wrap_omitted_attrs(trial, self._fetch_attr)
+            self._put(trial)
+        self.epoch = delta["epoch"]
+        self.watermark = delta["watermark"]
+
+    def merge(self, epoch: str, trial: FrozenTrial) -> None:
+        # A pushed trial is only applied if it keeps the trial numbers dense. Anything else,
+        # e.g. a trial whose predecessors have not been synced yet, arrives with the next delta.
+        if epoch == self.epoch and trial.number <= len(self.trials):
+            self._put(trial)
+
+    def _put(self, trial: FrozenTrial) -> None:
+        # Pushed trials and deltas may arrive out of order, so a snapshot that is older than the
+        # cached one, e.g. a late creation event of a trial that already has parameters, is
+        # skipped. Its state and the numbers of its parameters, values and attributes only grow.
+        cached = self.trials.get(trial.number)
+        if cached is not None and any(
+            new < old for new, old in zip(_trial_progress(trial), _trial_progress(cached))
+        ):
+            return
+        self.trials[trial.number] = trial
+
+    def get_all_trials(self) -> list[FrozenTrial]:
+        # Trial numbers are dense within a study, and a delta always carries every trial created
+        # after the previous watermark, so the cache holds numbers ``0`` to ``len - 1``.
+        return [self.trials[number] for number in range(len(self.trials))]
 
 
 @experimental_class("3.1.0")
-class DaskStorage(BaseStorage):
+class DaskStorage(BaseStorage, BaseHeartbeat):
     """Dask-compatible storage class.
 
     This storage class wraps a Optuna storage class (e.g. Optuna’s in-memory or sqlite storage)
@@ -438,6 +1487,18 @@ class DaskStorage(BaseStorage):
        <br>
        <br>
 
+    .. note::
+        Each :obj:`DaskStorage` instance keeps a local copy of the trials it has read, and
+        :meth:`get_all_trials` only transfers the trials changed since the previous call.
+        Changes are tracked by the scheduler, so the underlying storage must not be written to
+        other than through :obj:`DaskStorage`.
+
+    .. note::
+        Every storage method has a coroutine counterpart prefixed with ``a``, e.g.
+        :meth:`aget_trial` for :meth:`get_trial`. With an asynchronous ``Client``, these can be
+        awaited directly on the client's event loop, so that many calls are in flight at once,
+        e.g. with :func:`asyncio.gather`.
+
     Args:
         storage:
             Optuna storage url to use for underlying Optuna storage class to wrap
@@ -458,6 +1519,57 @@ class DaskStorage(BaseStorage):
             Most common usage of this storage class will not need to specify this argument.
             Defaults to :obj:`True`.
 
+        batch_writes:
+            Whether to buffer trial parameter, attribute and intermediate value writes on the
+            client and send them to the scheduler in a single batch. Buffered writes are
+            flushed before trials are read and together with :meth:`set_trial_state_values`.
+            The writes in a batch are applied independently, and an error raised by a buffered
+            write surfaces at the next write or :meth:`set_trial_state_values` call for the
+            same trial. Writes from
+            asynchronous clients are never buffered. Defaults to :obj:`False`.
+
+        heartbeat_interval:
+            Interval in seconds to record the heartbeat of running trials. If it is set, the
+            scheduler fails each running trial whose heartbeat has not been recorded for
+            ``grace_period`` seconds, e.g. because the worker running it died. As with
+            :class:`~optuna.storages.RDBStorage`, only trials that have recorded a heartbeat,
+            e.g. from :meth:`~optuna.study.Study.optimize`, are failed, so trials run with
+            ask-and-tell are left running. After the first heartbeat, every write to a trial
+            counts as a heartbeat, so a heartbeat is only sent separately if the trial has not
+            been written to recently. ``heartbeat_interval`` must be :obj:`None` or a
+            positive integer. Defaults to :obj:`None`, which disables the heartbeat.
+
+        grace_period:
+            Grace period in seconds before a running trial is failed from the last heartbeat.
+            ``grace_period`` must be :obj:`None` or a positive integer. If it is :obj:`None`,
+            the grace period will be ``2 * heartbeat_interval``.
+
+        journal_path:
+            Path of a file on the scheduler's machine to persist the in-memory storage to. Every
+            write is appended to this journal, and the storage is restored from it when a
+            :obj:`DaskStorage` is registered with the same ``journal_path`` again, e.g. after a
+            scheduler restart. It can only be used when ``storage`` is :obj:`None`. Defaults to
+            :obj:`None`, which disables persistence.
+
+        snapshot_interval:
+            Interval in seconds to write a snapshot of the in-memory storage to
+            ``{journal_path}.snapshot``, after which the journal starts over. This bounds the
+            size of the journal and the time to restore the storage. A snapshot is also written
+            when the scheduler closes. Defaults to ``600``.
+
+        attr_compression_threshold:
+            Size in bytes of a pickled user or system attribute above which it is compressed
+            with zlib before it is sent to the scheduler. Compressed attributes are stored
+            compressed by the underlying storage and decompressed transparently when read
+            through :obj:`DaskStorage`. Defaults to :obj:`None`, which disables compression.
+
+        lazy_large_attrs:
+            Whether to leave compressed attributes out of the trials sent to this client by
+            :meth:`get_all_trials`. An omitted attribute is then fetched from the scheduler
+            only when it is read, e.g. with ``trial.user_attrs["key"]``, and again for every
+            copy of the trial. Attributes written without compression are always sent.
+            Trials are always sent in full to asynchronous clients. Defaults to :obj:`False`.
+
     """
 
     def __init__(
@@ -466,23 +1578,75 @@ class DaskStorage(BaseStorage):
         name: str | None = None,
         client: "distributed.Client" | None = None,
         register: bool = True,
+        batch_writes: bool = False,
+        heartbeat_interval: int | None = None,
+        grace_period: int | None = None,
+        journal_path: str | None = None,
+        snapshot_interval: int = 600,
+        attr_compression_threshold: int | None = None,
+        lazy_large_attrs: bool = False,
     ):
         _imports.check()
+        if journal_path is not None and storage is not None:
+            raise ValueError("`journal_path` can only be used with the in-memory storage.")
+        if snapshot_interval <= 0:
+            raise ValueError("The value of `snapshot_interval` should be a positive integer.")
+        if heartbeat_interval is not None and heartbeat_interval <= 0:
+            raise ValueError("The value of `heartbeat_interval` should be a positive integer.")
+        if grace_period is not None and grace_period <= 0:
+            raise ValueError("The value of `grace_period` should be a positive integer.")
+        if attr_compression_threshold is not None and attr_compression_threshold < 0:
+            raise ValueError(
+                "The value of `attr_compression_threshold` should be a non-negative integer."
+            )
         self.name = name or f"dask-storage-{uuid.uuid4().hex}"
         self._client = client
+        self._trial_caches: dict[int, _StudyTrialCache] = {}
+        self._batch_writes = batch_writes
+        self._pending_writes: list[tuple[str, dict[str, Any], Future[Any] | None]] = []
+        self._pending_writes_lock = threading.Lock()
+        self._write_errors: dict[int, Exception] = {}
+        self._flush_lock: asyncio.Lock | None = None
+        self._metadata_cache: dict[tuple, Any] = {}
+        self._metadata_cache_lock = threading.Lock()
+        self._metadata_cache_hits = 0
+        self._metadata_cache_misses = 0
+        self._heartbeat_interval = heartbeat_interval
+        self._grace_period = grace_period
+        self._trial_write_times: dict[int, float] = {}
+        self._attr_compression_threshold = attr_compression_threshold
+        # Omitted attributes are fetched with a blocking call when they are read, which cannot be
+        # made from an asynchronous client.
+        self._lazy_large_attrs = lazy_large_attrs and not (
+            self.client.asynchronous or getattr(thread_state, "on_event_loop_thread", False)
+        )
         if register:
+            if heartbeat_interval is not None and grace_period is None:
+                grace_period = 2 * heartbeat_interval
             if self.client.asynchronous or getattr(thread_state, "on_event_loop_thread", False):
 
                 async def _register() -> DaskStorage:
                     await self.client.run_on_scheduler(  # type: ignore[no-untyped-call]
-                        _register_with_scheduler, storage=storage, name=self.name
+                        _register_with_scheduler,
+                        storage=storage,
+                        name=self.name,
+                        heartbeat_interval=heartbeat_interval,
+                        grace_period=grace_period,
+                        journal_path=journal_path,
+                        snapshot_interval=snapshot_interval,
                     )
                     return self
 
                 self._started = asyncio.ensure_future(_register())
             else:
                 self.client.run_on_scheduler(  # type: ignore[no-untyped-call]
-                    _register_with_scheduler, storage=storage, name=self.name
+                    _register_with_scheduler,
+                    storage=storage,
+                    name=self.name,
+                    heartbeat_interval=heartbeat_interval,
+                    grace_period=grace_period,
+                    journal_path=journal_path,
+                    snapshot_interval=snapshot_interval,
                 )
 
     @property
@@ -506,133 +1670,415 @@ class DaskStorage(BaseStorage):
         # on the scheduler. This is okay since this DaskStorage instance has already been
         # registered with the scheduler, and ``storage`` is only ever needed during the
         # scheduler registration process. We use ``storage=None`` below by convention.
-        return (DaskStorage, (None, self.name, None, False))
+        # The metadata cache only holds values that never change, so it is shipped along.
+        # Options that are not needed for the registration are restored as attributes.
+        return (
+            DaskStorage,
+            (
+                None,
+                self.name,
+                None,
+                False,
+                self._batch_writes,
+                self._heartbeat_interval,
+                self._grace_period,
+            ),
+            {
+                "_metadata_cache": self._metadata_cache.copy(),
+                "_attr_compression_threshold": self._attr_compression_threshold,
+                "_lazy_large_attrs": self._lazy_large_attrs,
+            },
+        )
 
-    def get_base_storage(self) -> BaseStorage:
+    async def _call_scheduler(self, method: str, **kwargs: Any) -> Any:
+        # Buffered writes are applied first, so that calls are seen by the scheduler in the
+        # order they were made.
+        await self._flush_writes()
+        result = await getattr(self.client.scheduler, f"optuna_{method}")(
+            storage_name=self.name, **kwargs
+        )
+        self._note_trial_write(method, kwargs)
+        return result
+
+    def _note_trial_write(self, method: str, kwargs: dict[str, Any]) -> None:
+        # The scheduler takes every write to a trial that has recorded a heartbeat as its next
+        # heartbeat, see record_heartbeat.
+        if self._heartbeat_interval is None or method not in _BATCHABLE_METHODS:
+            return
+        trial_id = kwargs["trial_id"]
+        if method == "set_trial_state_values" and TrialState[kwargs["state"]].is_finished():
+            self._trial_write_times.pop(trial_id, None)
+        elif trial_id in self._trial_write_times:
+            self._trial_write_times[trial_id] = time.monotonic()
+
+    async def _get_metadata(self, key: tuple, method: str, **kwargs: Any) -> Any:
+        # Study directions, names and IDs and trial numbers and IDs never change once set, so
+        # they are fetched from the scheduler at most once.
+        with self._metadata_cache_lock:
+            if key in self._metadata_cache:
+                self._metadata_cache_hits += 1
+                return self._metadata_cache[key]
+            self._metadata_cache_misses += 1
+        value = await self._call_scheduler(method, **kwargs)
+        with self._metadata_cache_lock:
+            self._metadata_cache[key] = value
+        return value
+
+    def metadata_cache_info(self) -> dict[str, int]:
+        """Return statistics of the cache of immutable study and trial metadata.
+
+        Study directions, study names and IDs, and trial numbers and IDs never change once
+        set, so :obj:`DaskStorage` fetches each of them from the scheduler only once.
+
+        Returns:
+            A dictionary with the number of cache ``hits``, cache ``misses`` and the number of
+            cached entries as ``size``.
+        """
+        with self._metadata_cache_lock:
+            return {
+                "hits": self._metadata_cache_hits,
+                "misses": self._metadata_cache_misses,
+                "size": len(self._metadata_cache),
+            }
+
+    def _is_buffering_writes(self) -> bool:
+        return self._batch_writes and not self.client.asynchronous
+
+    def _write(self, method: str, **kwargs: Any) -> Any:
+        if self._is_buffering_writes():
+            self._raise_write_error(kwargs["trial_id"])
+            with self._pending_writes_lock:
+                self._pending_writes.append((method, kwargs, None))
+            return None
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self._call_scheduler, method, **kwargs
+        )
+
+    def _write_and_flush(self, method: str, **kwargs: Any) -> Any:
+        # The write travels in the same batch as the pending writes. Another thread may flush
+        # it first, so its own outcome is returned through a future rather than taken from the
+        # batch that this call flushes. Flushes are serialized, so the future is resolved once
+        # this call's flush returns.
+        future: Future[Any] = Future()
+        with self._pending_writes_lock:
+            self._pending_writes.append((method, kwargs, future))
+        self.client.sync(self._flush_writes)  # type: ignore[no-untyped-call]
+        return future.result(timeout=0)
+
+    async def _flush_writes(self) -> None:
+        # Flushes are serialized so that a reader never overtakes a batch that another thread
+        # has taken from the buffer but not yet applied on the scheduler.
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            with self._pending_writes_lock:
+                pending, self._pending_writes = self._pending_writes, []
+            if not pending:
+                return
+            operations = [(method, kwargs) for method, kwargs, _ in pending]
+            scheduler = self.client.scheduler
+            try:
+                outcomes = await scheduler.optuna_apply_batch(  # type: ignore[union-attr]
+                    storage_name=self.name, operations=operations
+                )
+            except BaseException as e:
+                for _, _, future in pending:
+                    if future is not None:
+                        future.set_exception(e)
+                raise
+            for (method, kwargs, future), (ok, value) in zip(pending, outcomes):
+                if ok:
+                    self._note_trial_write(method, kwargs)
+                    if future is not None:
+                        future.set_result(value)
+                    continue
+                error = loads(value)  # type: ignore[no-untyped-call]
+                if future is not None:
+                    future.set_exception(error)
+                    continue
+                # The error of a buffered write is kept for the trial that it was written to, and
+                # raised by the next write to that trial, rather than by whichever call flushed.
+                with self._pending_writes_lock:
+                    self._write_errors.setdefault(kwargs["trial_id"], error)
+
+    def _raise_write_error(self, trial_id: int) -> None:
+        with self._pending_writes_lock:
+            error = self._write_errors.pop(trial_id, None)
+        if error is not None:
+            raise error
+
+    def subscribe_trial_updates(
+        self, study_id: int, callback: Callable[[FrozenTrial], None] | None = None
+    ) -> Any:
+        """Receive the state transitions of the trials in a study as they happen.
+
+        The scheduler pushes every created trial and every trial whose state changes, e.g.
+        when it finishes, to this client. The pushed trials update the local copy of the
+        study's trials, and ``callback`` is invoked with each of them. This replaces polling
+        :meth:`get_all_trials` or :meth:`get_n_trials` to find out when trials finish.
+
+        Args:
+            study_id:
+                ID of the study.
+            callback:
+                Function called with a :class:`~optuna.trial.FrozenTrial` for each state
+                transition. It is called on the Dask client's event loop, so it should return
+                quickly.
+        """
+
+        def _handle_event(event: tuple[float, dict]) -> None:
+            _, msg = event
+            trial = _deserialize_frozentrial(msg["trial"])
+            cache = self._trial_caches.get(study_id)
+            if cache is not None:
+                cache.merge(msg["epoch"], trial)
+            if callback is not None:
+                callback(copy.deepcopy(trial))
+
+        self.client.subscribe_topic(  # type: ignore[no-untyped-call]
+            _study_topic(self.name, study_id), _handle_event
+        )
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.client.scheduler.optuna_subscribe_study,  # type: ignore[union-attr]
+            storage_name=self.name,
+            study_id=study_id,
+        )
+
+    def unsubscribe_trial_updates(self, study_id: int) -> Any:
+        """Stop receiving the trial state transitions of a study.
+
+        Args:
+            study_id:
+                ID of the study.
+        """
+        self.client.unsubscribe_topic(  # type: ignore[no-untyped-call]
+            _study_topic(self.name, study_id)
+        )
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.client.scheduler.optuna_unsubscribe_study,  # type: ignore[union-attr]
+            storage_name=self.name,
+            study_id=study_id,
+        )
+
+    def get_base_storage(
+        self,
+        storage: str | BaseStorage | None = None,
+        *,
+        chunk_size: int = 1000,
+        show_progress_bar: bool = False,
+    ) -> BaseStorage:
         """Retrieve underlying Optuna storage instance from the scheduler.
 
         This is a convenience method to extract the Optuna storage instance stored on
         the Dask scheduler process to the local Python process.
 
-        If the storage is not InMemoryStorage, it will be converted to InMemoryStorage
-        before being copied to the local. Please note that it is not possible to get
-        exactly the same instance, as study_id and trial_id may change.
+        The studies are copied to a local storage, trial by trial, while the trials are pulled
+        from the scheduler in chunks of ``chunk_size``, so that neither the scheduler nor the
+        local process has to hold the whole storage in a single message. Please note that it is
+        not possible to get exactly the same instance, as study_id and trial_id may change.
+
+        Args:
+            storage:
+                Storage to copy the studies to, either a database URL or a storage instance.
+                It must not contain studies with the same names. If :obj:`None`, a new
+                :class:`~optuna.storages.InMemoryStorage` is created.
+            chunk_size:
+                Maximum number of trials fetched from the scheduler at once.
+            show_progress_bar:
+                Flag to show a progress bar of the copied trials.
+
+        Returns:
+            The local storage holding the copied studies.
         """
-
-        def _get_base_storage(dask_scheduler: distributed.Scheduler, name: str) -> BaseStorage:
-            storage = dask_scheduler.extensions["optuna"].storages[name]
-            if isinstance(storage, InMemoryStorage):
-                return storage
-
-            new_in_memory_storage = InMemoryStorage()
-            for study in storage.get_all_studies():
-                optuna.copy_study(
-                    from_study_name=study.study_name,
-                    from_storage=storage,
-                    to_storage=new_in_memory_storage,
-                    to_study_name=study.study_name,
-                )
-            return new_in_memory_storage
-
-        return self.client.run_on_scheduler(  # type: ignore[no-untyped-call]
-            _get_base_storage, name=self.name
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, but got {chunk_size}.")
+        if storage is None:
+            storage = InMemoryStorage()
+        elif isinstance(storage, str):
+            storage = optuna.storages.get_storage(storage)
+
+        studies = self.get_all_studies()
+        n_trials = [self.get_n_trials(study._study_id) for study in studies]
+        # The progress bar is only created when shown, as tqdm starts a monitor thread.
+        pbar = tqdm.tqdm(total=sum(n_trials)) if show_progress_bar else None
+        try:
+            for study, n in zip(studies, n_trials):
+                study_id = storage.create_new_study(study.directions, study.study_name)
+                for key, value in study.user_attrs.items():
+                    storage.set_study_user_attr(study_id, key, value)
+                for key, value in study.system_attrs.items():
+                    storage.set_study_system_attr(study_id, key, value)
+
+                distributions: list[BaseDistribution] = []
+                for start in range(0, n, chunk_size):
+                    chunk = self.client.sync(  # type: ignore[no-untyped-call]
+                        self.client.scheduler.optuna_get_trials_by_number,  # type: ignore[union-attr]  # NOQA: E501
+                        storage_name=self.name,
+                        study_id=study._study_id,
+                        start=start,
+                        stop=min(start + chunk_size, n),
+                        n_distributions=len(distributions),
+                    )
+                    distributions.extend(json_to_distribution(d) for d in chunk["distributions"])
+                    trials = _deserialize_frozentrials(chunk["trials"], distributions)
+                    for trial in trials:
+                        storage.create_new_trial(study_id, template_trial=trial)
+                    if pbar is not None:
+                        pbar.update(len(trials))
+        finally:
+            if pbar is not None:
+                pbar.close()
+        return storage
+
+    async def acreate_new_study(
+        self, directions: Sequence[StudyDirection], study_name: str | None = None
+    ) -> int:
+        return await self._call_scheduler(
+            "create_new_study",
+            study_name=study_name,
+            directions=[direction.name for direction in directions],
         )
 
     def create_new_study(
         self, directions: Sequence[StudyDirection], study_name: str | None = None
     ) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_create_new_study,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_name=study_name,
-            directions=[direction.name for direction in directions],
+            self.acreate_new_study, directions=directions, study_name=study_name
         )
 
+    async def adelete_study(self, study_id: int) -> None:
+        self._trial_caches.pop(study_id, None)
+        # Study names, and with some backends trial IDs, may be reused after a deletion.
+        with self._metadata_cache_lock:
+            self._metadata_cache.clear()
+        return await self._call_scheduler("delete_study", study_id=study_id)
+
     def delete_study(self, study_id: int) -> None:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_delete_study,  # type: ignore[union-attr]
-            storage_name=self.name,
+            self.adelete_study, study_id=study_id
+        )
+
+    async def aset_study_user_attr(self, study_id: int, key: str, value: Any) -> None:
+        return await self._call_scheduler(
+            "set_study_user_attr",
             study_id=study_id,
+            key=key,
+            value=_encode_attr_value(value, self._attr_compression_threshold),
         )
 
     def set_study_user_attr(self, study_id: int, key: str, value: Any) -> None:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_study_user_attr,  # type: ignore[union-attr]
-            storage_name=self.name,
+            self.aset_study_user_attr, study_id=study_id, key=key, value=value
+        )
+
+    async def aset_study_system_attr(self, study_id: int, key: str, value: Any) -> None:
+        return await self._call_scheduler(
+            "set_study_system_attr",
             study_id=study_id,
             key=key,
-            value=dumps(value),  # type: ignore[no-untyped-call]
+            value=_encode_attr_value(value, self._attr_compression_threshold),
         )
 
     def set_study_system_attr(self, study_id: int, key: str, value: Any) -> None:
-        return self.client.sync(
-            self.client.scheduler.optuna_set_study_system_attr,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_id=study_id,
-            key=key,
-            value=dumps(value),  # type: ignore[no-untyped-call]
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aset_study_system_attr, study_id=study_id, key=key, value=value
         )
 
     # Basic study access
 
+    async def aget_study_id_from_name(self, study_name: str) -> int:
+        return await self._get_metadata(
+            ("study_id", study_name), "get_study_id_from_name", study_name=study_name
+        )
+
     def get_study_id_from_name(self, study_name: str) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_study_id_from_name,  # type: ignore[union-attr]
-            study_name=study_name,
-            storage_name=self.name,
+            self.aget_study_id_from_name, study_name=study_name
+        )
+
+    async def aget_study_name_from_id(self, study_id: int) -> str:
+        return await self._get_metadata(
+            ("study_name", study_id), "get_study_name_from_id", study_id=study_id
         )
 
     def get_study_name_from_id(self, study_id: int) -> str:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_study_name_from_id,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_id=study_id,
+            self.aget_study_name_from_id, study_id=study_id
         )
 
-    def get_study_directions(self, study_id: int) -> list[StudyDirection]:
-        directions = self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_study_directions,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_id=study_id,
+    async def aget_study_directions(self, study_id: int) -> list[StudyDirection]:
+        directions = await self._get_metadata(
+            ("directions", study_id), "get_study_directions", study_id=study_id
         )
         return [StudyDirection[direction] for direction in directions]
 
-    def get_study_user_attrs(self, study_id: int) -> dict[str, Any]:
-        return loads(  # type: ignore[no-untyped-call]
-            self.client.sync(  # type: ignore[no-untyped-call]
-                self.client.scheduler.optuna_get_study_user_attrs,  # type: ignore[union-attr]
-                storage_name=self.name,
-                study_id=study_id,
+    def get_study_directions(self, study_id: int) -> list[StudyDirection]:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aget_study_directions, study_id=study_id
+        )
+
+    async def aget_study_user_attrs(self, study_id: int) -> dict[str, Any]:
+        return _decode_attr_values(
+            loads(  # type: ignore[no-untyped-call]
+                await self._call_scheduler("get_study_user_attrs", study_id=study_id)
             )
         )
 
-    def get_study_system_attrs(self, study_id: int) -> dict[str, Any]:
-        return loads(  # type: ignore[no-untyped-call]
-            self.client.sync(  # type: ignore[no-untyped-call]
-                self.client.scheduler.optuna_get_study_system_attrs,  # type: ignore[union-attr]
-                storage_name=self.name,
-                study_id=study_id,
+    def get_study_user_attrs(self, study_id: int) -> dict[str, Any]:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aget_study_user_attrs, study_id=study_id
+        )
+
+    async def aget_study_system_attrs(self, study_id: int) -> dict[str, Any]:
+        return _decode_attr_values(
+            loads(  # type: ignore[no-untyped-call]
+                await self._call_scheduler("get_study_system_attrs", study_id=study_id)
             )
         )
 
-    def get_all_studies(self) -> list[FrozenStudy]:
-        results = self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_all_studies,  # type: ignore[union-attr]
-            storage_name=self.name,
+    def get_study_system_attrs(self, study_id: int) -> dict[str, Any]:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aget_study_system_attrs, study_id=study_id
         )
+
+    async def aget_all_studies(self) -> list[FrozenStudy]:
+        results = await self._call_scheduler("get_all_studies")
         return [_deserialize_frozenstudy(i) for i in results]
 
+    def get_all_studies(self) -> list[FrozenStudy]:
+        return self.client.sync(self.aget_all_studies)  # type: ignore[no-untyped-call]
+
     # Basic trial manipulation
 
-    def create_new_trial(self, study_id: int, template_trial: FrozenTrial | None = None) -> int:
+    async def acreate_new_trial(
+        self, study_id: int, template_trial: FrozenTrial | None = None
+    ) -> int:
         serialized_template_trial = None
         if template_trial is not None:
             serialized_template_trial = _serialize_frozentrial(template_trial)
+        trial_id = await self._call_scheduler(
+            "create_new_trial", study_id=study_id, template_trial=serialized_template_trial
+        )
+        return trial_id
+
+    def create_new_trial(self, study_id: int, template_trial: FrozenTrial | None = None) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_create_new_trial,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_id=study_id,
-            template_trial=serialized_template_trial,
+            self.acreate_new_trial, study_id=study_id, template_trial=template_trial
+        )
+
+    async def aset_trial_param(
+        self,
+        trial_id: int,
+        param_name: str,
+        param_value_internal: float,
+        distribution: BaseDistribution,
+    ) -> None:
+        return await self._call_scheduler(
+            "set_trial_param",
+            trial_id=trial_id,
+            param_name=param_name,
+            param_value_internal=param_value_internal,
+            distribution=distribution_to_json(distribution),
         )
 
     def set_trial_param(
@@ -642,116 +2088,185 @@ class DaskStorage(BaseStorage):
         param_value_internal: float,
         distribution: BaseDistribution,
     ) -> None:
-        return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_trial_param,  # type: ignore[union-attr]
-            storage_name=self.name,
+        return self._write(
+            "set_trial_param",
             trial_id=trial_id,
             param_name=param_name,
             param_value_internal=param_value_internal,
             distribution=distribution_to_json(distribution),
         )
 
+    async def aget_trial_id_from_study_id_trial_number(
+        self, study_id: int, trial_number: int
+    ) -> int:
+        return await self._get_metadata(
+            ("trial_id", study_id, trial_number),
+            "get_trial_id_from_study_id_trial_number",
+            study_id=study_id,
+            trial_number=trial_number,
+        )
+
     def get_trial_id_from_study_id_trial_number(self, study_id: int, trial_number: int) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_trial_id_from_study_id_trial_number,  # type: ignore[union-attr]  # NOQA: E501
-            storage_name=self.name,
+            self.aget_trial_id_from_study_id_trial_number,
             study_id=study_id,
             trial_number=trial_number,
         )
 
+    async def aget_trial_number_from_id(self, trial_id: int) -> int:
+        return await self._get_metadata(
+            ("trial_number", trial_id), "get_trial_number_from_id", trial_id=trial_id
+        )
+
     def get_trial_number_from_id(self, trial_id: int) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_trial_number_from_id,  # type: ignore[union-attr]
-            storage_name=self.name,
-            trial_id=trial_id,
+            self.aget_trial_number_from_id, trial_id=trial_id
+        )
+
+    async def aget_trial_param(self, trial_id: int, param_name: str) -> float:
+        return await self._call_scheduler(
+            "get_trial_param", trial_id=trial_id, param_name=param_name
         )
 
     def get_trial_param(self, trial_id: int, param_name: str) -> float:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_trial_param,  # type: ignore[union-attr]
-            storage_name=self.name,
-            trial_id=trial_id,
-            param_name=param_name,
+            self.aget_trial_param, trial_id=trial_id, param_name=param_name
+        )
+
+    async def aset_trial_state_values(
+        self, trial_id: int, state: TrialState, values: Sequence[float] | None = None
+    ) -> bool:
+        return await self._call_scheduler(
+            "set_trial_state_values", trial_id=trial_id, state=state.name, values=values
         )
 
     def set_trial_state_values(
         self, trial_id: int, state: TrialState, values: Sequence[float] | None = None
     ) -> bool:
+        if self._is_buffering_writes():
+            # The state update travels in the same batch as the trial's pending writes.
+            updated = self._write_and_flush(
+                "set_trial_state_values", trial_id=trial_id, state=state.name, values=values
+            )
+            self._raise_write_error(trial_id)
+            return updated
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_trial_state_values,  # type: ignore[union-attr]
-            storage_name=self.name,
+            self.aset_trial_state_values, trial_id=trial_id, state=state, values=values
+        )
+
+    async def aset_trial_intermediate_value(
+        self, trial_id: int, step: int, intermediate_value: float
+    ) -> None:
+        return await self._call_scheduler(
+            "set_trial_intermediate_value",
             trial_id=trial_id,
-            state=state.name,
-            values=values,
+            step=step,
+            intermediate_value=intermediate_value,
         )
 
     def set_trial_intermediate_value(
         self, trial_id: int, step: int, intermediate_value: float
     ) -> None:
-        return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_trial_intermediate_value,  # type: ignore[union-attr]
-            storage_name=self.name,
+        return self._write(
+            "set_trial_intermediate_value",
             trial_id=trial_id,
             step=step,
             intermediate_value=intermediate_value,
         )
 
+    async def aset_trial_user_attr(self, trial_id: int, key: str, value: Any) -> None:
+        return await self._call_scheduler(
+            "set_trial_user_attr",
+            trial_id=trial_id,
+            key=key,
+            value=_encode_attr_value(value, self._attr_compression_threshold),
+        )
+
     def set_trial_user_attr(self, trial_id: int, key: str, value: Any) -> None:
-        return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_trial_user_attr,  # type: ignore[union-attr]
-            storage_name=self.name,
+        return self._write(
+            "set_trial_user_attr",
+            trial_id=trial_id,
+            key=key,
+            value=_encode_attr_value(value, self._attr_compression_threshold),
+        )
+
+    async def aset_trial_system_attr(
+        self, trial_id: int, key: str, value: JSONSerializable
+    ) -> None:
+        return await self._call_scheduler(
+            "set_trial_system_attr",
             trial_id=trial_id,
             key=key,
-            value=dumps(value),  # type: ignore[no-untyped-call]
+            value=_encode_attr_value(value, self._attr_compression_threshold),
         )
 
     def set_trial_system_attr(self, trial_id: int, key: str, value: JSONSerializable) -> None:
-        return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_set_trial_system_attr,  # type: ignore[union-attr]
-            storage_name=self.name,
+        return self._write(
+            "set_trial_system_attr",
             trial_id=trial_id,
             key=key,
-            value=dumps(value),  # type: ignore[no-untyped-call]
+            value=_encode_attr_value(value, self._attr_compression_threshold),
         )
 
     # Basic trial access
 
-    async def _get_trial(self, trial_id: int) -> FrozenTrial:
-        serialized_trial = await self.client.scheduler.optuna_get_trial(  # type: ignore[union-attr]  # NOQA: E501
-            trial_id=trial_id, storage_name=self.name
-        )
+    async def aget_trial(self, trial_id: int) -> FrozenTrial:
+        serialized_trial = await self._call_scheduler("get_trial", trial_id=trial_id)
         return _deserialize_frozentrial(serialized_trial)
 
     def get_trial(self, trial_id: int) -> FrozenTrial:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self._get_trial, trial_id=trial_id
+            self.aget_trial, trial_id=trial_id
         )
 
-    async def _get_all_trials(
-        self, study_id: int, deepcopy: bool = True, states: Iterable[TrialState] | None = None
+    async def _aget_trial_attr(self, trial_id: int, system: bool, key: str) -> Any:
+        value = await self._call_scheduler(
+            "get_trial_attr", trial_id=trial_id, system=system, key=key
+        )
+        return _decode_attr_value(loads(value))  # type: ignore[no-untyped-call]
+
+    def _get_trial_attr(self, trial_id: int, system: bool, key: str) -> Any:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self._aget_trial_attr, trial_id=trial_id, system=system, key=key
+        )
+
+    async def aget_all_trials(
+        self, study_id: int, deepcopy: bool = True, states: Container[TrialState] | None = None
     ) -> list[FrozenTrial]:
-        serialized_states = None
-        if states is not None:
-            serialized_states = tuple(s.name for s in states)
-        serialized_trials = await self.client.scheduler.optuna_get_all_trials(  # type: ignore[union-attr]  # NOQA: E501
-            storage_name=self.name,
+        # Only the trials changed since the last sync are sent by the scheduler. Since this
+        # coroutine always runs on the client's event loop, the cache needs no extra locking.
+        if study_id not in self._trial_caches:
+            self._trial_caches[study_id] = _StudyTrialCache(
+                self._get_trial_attr if self._lazy_large_attrs else None
+            )
+        cache = self._trial_caches[study_id]
+        n_distributions = len(cache.distributions)
+        delta = await self._call_scheduler(
+            "get_trials_since",
             study_id=study_id,
-            deepcopy=deepcopy,
-            states=serialized_states,
+            epoch=cache.epoch,
+            watermark=cache.watermark,
+            n_distributions=n_distributions,
+            omit_compressed_attrs=self._lazy_large_attrs,
         )
-        return [_deserialize_frozentrial(t) for t in serialized_trials]
+        cache.update(delta, n_distributions)
+
+        trials = cache.get_all_trials()
+        if states is not None:
+            trials = [t for t in trials if t.state in states]
+        return copy.deepcopy(trials) if deepcopy else trials
 
     def get_all_trials(
         self, study_id: int, deepcopy: bool = True, states: Container[TrialState] | None = None
     ) -> list[FrozenTrial]:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self._get_all_trials,
+            self.aget_all_trials,
             study_id=study_id,
             deepcopy=deepcopy,
             states=states,
         )
 
-    def get_n_trials(
+    async def aget_n_trials(
         self, study_id: int, state: tuple[TrialState, ...] | TrialState | None = None
     ) -> int:
         serialized_state: tuple[str, ...] | str | None = None
@@ -760,9 +2275,93 @@ class DaskStorage(BaseStorage):
                 serialized_state = state.name
             else:
                 serialized_state = tuple(s.name for s in state)
+        return await self._call_scheduler(
+            "get_n_trials", study_id=study_id, state=serialized_state
+        )
+
+    def get_n_trials(
+        self, study_id: int, state: tuple[TrialState, ...] | TrialState | None = None
+    ) -> int:
         return self.client.sync(  # type: ignore[no-untyped-call]
-            self.client.scheduler.optuna_get_n_trials,  # type: ignore[union-attr]
-            storage_name=self.name,
-            study_id=study_id,
-            state=serialized_state,
+            self.aget_n_trials, study_id=study_id, state=state
+        )
+
+    async def aget_best_trial(self, study_id: int) -> FrozenTrial:
+        serialized_trial = await self._call_scheduler("get_best_trial", study_id=study_id)
+        return _deserialize_frozentrial(serialized_trial)
+
+    def get_best_trial(self, study_id: int) -> FrozenTrial:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aget_best_trial, study_id=study_id
         )
+
+    async def aget_pareto_front_trials(self, study_id: int) -> list[FrozenTrial]:
+        serialized_trials = await self._call_scheduler(
+            "get_pareto_front_trials", study_id=study_id
+        )
+        return [_deserialize_frozentrial(t) for t in serialized_trials]
+
+    def get_pareto_front_trials(self, study_id: int) -> list[FrozenTrial]:
+        """Read the completed trials on the Pareto front of a study.
+
+        The front is maintained by the scheduler as trials complete, so only the trials on it
+        are sent to the client. Unlike :attr:`~optuna.study.Study.best_trials`, constraints
+        are not taken into account.
+
+        Args:
+            study_id:
+                ID of the study.
+
+        Returns:
+            List of :class:`~optuna.trial.FrozenTrial` objects, ordered by trial number. For a
+            single-objective study, these are the completed trials tied for the best value.
+        """
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.aget_pareto_front_trials, study_id=study_id
+        )
+
+    # Heartbeat
+
+    async def arecord_heartbeat(self, trial_id: int) -> None:
+        return await self._call_scheduler("record_heartbeat", trial_id=trial_id)
+
+    def record_heartbeat(self, trial_id: int) -> None:
+        # Once the trial has recorded a heartbeat, a write sent within the last half interval
+        # has already refreshed it on the scheduler. Skipping the call then keeps the heartbeat
+        # at most 1.5 intervals old. The first heartbeat is always sent, as it is what makes
+        # the scheduler watch the trial.
+        assert self._heartbeat_interval is not None
+        last_write_time = self._trial_write_times.get(trial_id)
+        if last_write_time is not None and (
+            time.monotonic() - last_write_time < self._heartbeat_interval / 2
+        ):
+            return
+        self._trial_write_times[trial_id] = time.monotonic()
+        if self._is_buffering_writes():
+            # The heartbeat carries the trial's pending writes along.
+            self._write_and_flush("record_heartbeat", trial_id=trial_id)
+            return
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self.arecord_heartbeat, trial_id=trial_id
+        )
+
+    async def _aget_stale_trial_ids(self, study_id: int) -> list[int]:
+        return list(await self._call_scheduler("get_stale_trial_ids", study_id=study_id))
+
+    def _get_stale_trial_ids(self, study_id: int) -> list[int]:
+        return self.client.sync(  # type: ignore[no-untyped-call]
+            self._aget_stale_trial_ids, study_id=study_id
+        )
+
+    def get_heartbeat_interval(self) -> int | None:
+        return self._heartbeat_interval
+
+    def get_heartbeat_stale_trial_callback(
+        self,
+    ) -> Callable[["optuna.Study", FrozenTrial], None] | None:
+        # Stale trials are failed on the scheduler, where no study object is available.
+        return None
+
+    def get_failed_trial_callback(self) -> Callable[["optuna.Study", FrozenTrial], None] | None:
+        # Kept for Optuna versions that predate ``get_heartbeat_stale_trial_callback``.
+        return self.get_heartbeat_stale_trial_callback()
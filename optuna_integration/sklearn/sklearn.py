@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Generator
 from collections.abc import Iterable
 from collections.abc import Mapping
+from concurrent.futures import Executor
 import copy
+import functools
 from logging import DEBUG
 from logging import INFO
 from logging import WARNING
+import multiprocessing
+from multiprocessing.managers import SyncManager
 from numbers import Integral
 from numbers import Number
+import os
+import queue
+import shutil
+import tempfile
+import threading
 from time import time
 from typing import Any
 from typing import List
@@ -18,6 +29,7 @@ import warnings
 import numpy as np
 from optuna import distributions
 from optuna import logging
+from optuna import pruners
 from optuna import samplers
 from optuna import study as study_module
 from optuna import TrialPruned
@@ -32,6 +44,10 @@ from packaging import version
 
 
 with try_import() as _imports:
+    import joblib
+    from joblib import delayed
+    from joblib import Parallel
+    from joblib.executor import get_memmapping_executor
     import pandas as pd
     import scipy as sp
     from scipy.sparse import spmatrix
@@ -44,6 +60,7 @@ with try_import() as _imports:
     from sklearn.model_selection import BaseCrossValidator
     from sklearn.model_selection import check_cv
     from sklearn.model_selection import cross_validate
+    from sklearn.pipeline import Pipeline
     from sklearn.utils import _safe_indexing as sklearn_safe_indexing
     from sklearn.utils import check_random_state
     from sklearn.utils.metaestimators import _safe_split
@@ -129,6 +146,329 @@ def _safe_indexing(
     return sklearn_safe_indexing(X, indices)
 
 
+def _memmap(value: Any, folder: str, name: str) -> Any:
+    # Arrays are dumped once and loaded as read-only memory maps, which all trials share and
+    # which joblib passes to other processes by file name instead of by value.
+    if not isinstance(value, np.ndarray) and not hasattr(value, "iloc"):
+        if not sp.sparse.issparse(value):
+            return value
+    filename = os.path.join(folder, name)
+    joblib.dump(value, filename)
+    return joblib.load(filename, mmap_mode="r")
+
+
+def _copy_fit_params(fit_params: dict[str, Any]) -> dict[str, Any]:
+    # Prevent objects from being shared when parallelization is enabled with n_jobs. Read-only
+    # arrays, e.g. memory maps, cannot be modified by a trial, so they are shared as they are.
+    return {
+        key: (
+            value
+            if isinstance(value, np.ndarray) and not value.flags.writeable
+            else copy.deepcopy(value)
+        )
+        for key, value in fit_params.items()
+    }
+
+
+def _fit_and_score(
+    estimator: "sklearn.base.BaseEstimator",
+    X_train: TwoDimArrayLikeType,
+    y_train: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    X_test: TwoDimArrayLikeType,
+    y_test: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    fit_params: dict[str, Any],
+    scoring: Callable[..., Number],
+    error_score: Number | float | str,
+    return_train_score: bool,
+    fit: bool = True,
+) -> tuple["sklearn.base.BaseEstimator" | None, list[Number]]:
+    # The estimator is returned, since it is a copy when this runs in another process, unless
+    # it failed to fit. If ``fit`` is False, the estimator is already fitted and only scored.
+    start_time = time()
+
+    try:
+        if fit:
+            estimator.fit(X_train, y_train, **fit_params)
+
+    except Exception as e:
+        if error_score == "raise":
+            raise e
+
+        elif isinstance(error_score, Number):
+            fit_time = time() - start_time
+            test_score = error_score
+            score_time = 0.0
+
+            if return_train_score:
+                train_score = error_score
+
+            estimator = None
+
+        else:
+            raise ValueError("error_score must be 'raise' or numeric.") from e
+
+    else:
+        fit_time = time() - start_time
+        test_score = scoring(estimator, X_test, y_test)
+        score_time = time() - fit_time - start_time
+
+        if return_train_score:
+            train_score = scoring(estimator, X_train, y_train)
+
+    # Required for type checking but is never expected to fail.
+    assert isinstance(fit_time, Number)
+    assert isinstance(score_time, Number)
+
+    ret = [test_score, fit_time, score_time]
+
+    if return_train_score:
+        ret.insert(0, train_score)
+
+    return estimator, ret
+
+
+def _fit_and_score_pipeline(
+    upstream: "Pipeline",
+    final_estimator: "sklearn.base.BaseEstimator",
+    outputs: tuple[Any, Any] | None,
+    X_train: TwoDimArrayLikeType,
+    y_train: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    X_test: TwoDimArrayLikeType,
+    y_test: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    upstream_fit_params: dict[str, Any],
+    final_fit_params: dict[str, Any],
+    scoring: Callable[..., Number],
+    error_score: Number | float | str,
+    return_train_score: bool,
+) -> tuple[tuple[Any, Any] | None, float, list[Number]]:
+    # ``outputs`` are the cached outputs of the upstream steps on the training and test sets of
+    # the fold, or None to fit the upstream steps, in which case their outputs are returned
+    # along with the time it took.
+    start_time = time()
+
+    fitted_outputs = None
+    if outputs is None:
+        try:
+            fitted_upstream = clone(upstream)
+            Xt_train = fitted_upstream.fit_transform(X_train, y_train, **upstream_fit_params)
+            fitted_outputs = (Xt_train, fitted_upstream.transform(X_test))
+
+        except Exception as e:
+            if error_score == "raise":
+                raise e
+
+            elif isinstance(error_score, Number):
+                score_time = 0.0
+                assert isinstance(score_time, Number)
+
+                ret = [error_score, score_time, score_time]
+
+                if return_train_score:
+                    ret.insert(0, error_score)
+
+                return None, time() - start_time, ret
+
+            else:
+                raise ValueError("error_score must be 'raise' or numeric.") from e
+
+        outputs = fitted_outputs
+
+    Xt_train, Xt_test = outputs
+    upstream_time = time() - start_time
+
+    _, ret = _fit_and_score(
+        clone(final_estimator),
+        Xt_train,
+        y_train,
+        Xt_test,
+        y_test,
+        final_fit_params,
+        scoring,
+        error_score,
+        return_train_score,
+    )
+
+    return fitted_outputs, upstream_time, ret
+
+
+def _partial_fit_and_score(
+    estimator: "sklearn.base.BaseEstimator",
+    X_train: TwoDimArrayLikeType,
+    y_train: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    X_test: TwoDimArrayLikeType,
+    y_test: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    partial_fit_params: dict[str, Any],
+    scoring: Callable[..., Number],
+    error_score: Number | float | str,
+    return_train_score: bool,
+) -> tuple["sklearn.base.BaseEstimator", list[Number]]:
+    start_time = time()
+
+    try:
+        estimator.partial_fit(X_train, y_train, **partial_fit_params)
+
+    except Exception as e:
+        if error_score == "raise":
+            raise e
+
+        elif isinstance(error_score, Number):
+            fit_time = time() - start_time
+            test_score = error_score
+            score_time = 0.0
+
+            if return_train_score:
+                train_score = error_score
+
+        else:
+            raise ValueError("error_score must be 'raise' or numeric.") from e
+
+    else:
+        fit_time = time() - start_time
+        test_score = scoring(estimator, X_test, y_test)
+        score_time = time() - fit_time - start_time
+
+        if return_train_score:
+            train_score = scoring(estimator, X_train, y_train)
+
+    # Required for type checking but is never expected to fail.
+    assert isinstance(fit_time, Number)
+    assert isinstance(score_time, Number)
+
+    ret = [test_score, fit_time, score_time]
+
+    if return_train_score:
+        ret.insert(0, train_score)
+
+    return estimator, ret
+
+
+def _partial_fit_and_score_in_batches(
+    estimator: "sklearn.base.BaseEstimator",
+    train: np.ndarray,
+    test: np.ndarray,
+    partial_fit_params: dict[str, Any],
+    scoring: Callable[..., Number],
+    error_score: Number | float | str,
+    return_train_score: bool,
+    *,
+    X: TwoDimArrayLikeType,
+    y: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    batch_size: int,
+) -> tuple["sklearn.base.BaseEstimator", list[Number]]:
+    start_time = time()
+
+    try:
+        for start in range(0, len(train), batch_size):
+            batch = train[start : start + batch_size]
+            X_batch, y_batch = _safe_split(estimator, X, y, batch)
+            estimator.partial_fit(
+                X_batch, y_batch, **_check_fit_params(X, partial_fit_params, batch)
+            )
+
+    except Exception as e:
+        if error_score == "raise":
+            raise e
+
+        elif isinstance(error_score, Number):
+            fit_time = time() - start_time
+            test_score = error_score
+            score_time = 0.0
+
+            if return_train_score:
+                train_score = error_score
+
+        else:
+            raise ValueError("error_score must be 'raise' or numeric.") from e
+
+    else:
+        fit_time = time() - start_time
+        test_score = _score_in_batches(estimator, X, y, test, batch_size, scoring)
+        score_time = time() - fit_time - start_time
+
+        if return_train_score:
+            train_score = _score_in_batches(estimator, X, y, train, batch_size, scoring)
+
+    # Required for type checking but is never expected to fail.
+    assert isinstance(fit_time, Number)
+    assert isinstance(score_time, Number)
+
+    ret = [test_score, fit_time, score_time]
+
+    if return_train_score:
+        ret.insert(0, train_score)
+
+    return estimator, ret
+
+
+def _score_in_batches(
+    estimator: "sklearn.base.BaseEstimator",
+    X: TwoDimArrayLikeType,
+    y: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    indices: np.ndarray,
+    batch_size: int,
+    scoring: Callable[..., Number],
+) -> Number:
+    scores = []
+    sizes = []
+    for start in range(0, len(indices), batch_size):
+        batch = indices[start : start + batch_size]
+        X_batch, y_batch = _safe_split(estimator, X, y, batch)
+        scores.append(scoring(estimator, X_batch, y_batch))
+        sizes.append(len(batch))
+
+    # The mean weighted by the sizes of the batches equals the score of the whole set for
+    # metrics that average over samples, such as accuracy.
+    return np.average(np.asarray(scores, dtype=float), weights=sizes)
+
+
+def _partial_fit_and_score_steps(
+    fit_fold: Callable[..., tuple["sklearn.base.BaseEstimator", list[Number]]],
+    index: int,
+    estimator: "sklearn.base.BaseEstimator",
+    fold: tuple[Any, ...],
+    args: tuple[Any, ...],
+    max_iter: int,
+    results_queue: "queue.Queue[tuple[int, int, list[Number]]]",
+    stop: threading.Event,
+) -> None:
+    for step in range(max_iter):
+        if stop.is_set():
+            return
+
+        estimator, ret = fit_fold(estimator, *fold, *args)
+        results_queue.put((index, step, ret))
+
+
+class _LRUCache:
+    """Thread-safe mapping that evicts the least recently used entries beyond ``maxsize``."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def keys(self) -> list[Any]:
+        with self._lock:
+            return list(self._entries)
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class _Objective:
     """Callable that implements objective function.
 
@@ -143,25 +483,47 @@ class _Objective:
             Distributions are assumed to implement the optuna distribution
             interface.
 
+        pipeline_cache:
+            Cache of the outputs of all but the last step of a :class:`~sklearn.pipeline.Pipeline`
+            estimator per fold. If :obj:`None`, the outputs are not cached.
+
         X:
             Training data.
 
         y:
             Target variable.
 
+        batch_size:
+            Number of samples to feed ``partial_fit`` at once if pruning is performed. If
+            :obj:`None`, each training set is fed at once.
+
         cv:
             Cross-validation strategy.
 
+        cv_n_jobs:
+            Number of jobs to fit and score the folds of a trial in parallel.
+
+        cv_results_attr:
+            Name of the user attribute to store all the scores of a trial in. If :obj:`None`,
+            every score is stored in its own user attribute.
+
         enable_pruning:
             If :obj:`True`, pruning is performed in the case where the
             underlying estimator supports ``partial_fit``.
 
+        enable_fold_pruning:
+            If :obj:`True`, pruning is performed after each fold.
+
         error_score:
             Value to assign to the score if an error occurs in fitting. If
             ``"raise"``, the error is raised. If numeric,
             :class:`sklearn.exceptions.FitFailedWarning` is raised. This does not
             affect the refit step, which will always raise the error.
 
+        executor:
+            Executor to cross-validate trials in. If :obj:`None`, trials are cross-validated
+            in the calling thread.
+
         fit_params:
             Parameters passed to ``fit`` one the estimator.
 
@@ -169,10 +531,26 @@ class _Objective:
             Group labels for the samples used while splitting the dataset into
             train/validation set.
 
+        manager:
+            Manager that creates the queue each trial receives the scores of its folds through
+            when pruning with ``cv_n_jobs``. If :obj:`None`, the folds are fitted in the calling
+            thread.
+
         max_iter:
             Maximum number of epochs. This is only used if the underlying
             estimator supports ``partial_fit``.
 
+        memo:
+            Scores of the cross-validations done so far, keyed by the hash of the parameters. If
+            :obj:`None`, every trial is cross-validated.
+
+        resource:
+            ``"n_samples"`` or the name of the parameter of the estimator to use as the resource
+            of successive halving. If :obj:`None`, successive halving is not performed.
+
+        resource_steps:
+            Increasing amounts of the resource that each trial is evaluated with.
+
         return_train_score:
             If :obj:`True`, training scores will be included. Computing
             training scores is used to get insights on how different
@@ -184,6 +562,14 @@ class _Objective:
 
         scoring:
             Scorer function.
+
+        warm_start_cache:
+            Cache of fitted estimators per fold, keyed by the index of the fold, the hash of the
+            other parameters and the value of ``warm_start_param``. If :obj:`None`, estimators
+            are not warm-started.
+
+        warm_start_param:
+            Parameter of the estimator that warm-started estimators are extended along.
     """
 
     def __init__(
@@ -192,25 +578,49 @@ class _Objective:
         param_distributions: Mapping[str, distributions.BaseDistribution],
         X: TwoDimArrayLikeType,
         y: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+        batch_size: int | None,
         cv: "BaseCrossValidator",
+        cv_n_jobs: int | None,
+        cv_results_attr: str | None,
         enable_pruning: bool,
+        enable_fold_pruning: bool,
         error_score: Number | float | str,
+        executor: Executor | None,
         fit_params: dict[str, Any],
         groups: OneDimArrayLikeType | None,
+        manager: SyncManager | None,
         max_iter: int,
+        memo: dict[str, Mapping[str, OneDimArrayLikeType]] | None,
+        pipeline_cache: _LRUCache | None,
+        resource: str | None,
+        resource_steps: list[int],
         return_train_score: bool,
         scoring: Callable[..., Number],
+        warm_start_cache: _LRUCache | None,
+        warm_start_param: str | None,
     ) -> None:
+        self.batch_size = batch_size
         self.cv = cv
+        self.cv_n_jobs = cv_n_jobs
+        self.cv_results_attr = cv_results_attr
         self.enable_pruning = enable_pruning
+        self.enable_fold_pruning = enable_fold_pruning
         self.error_score = error_score
         self.estimator = estimator
+        self.executor = executor
         self.fit_params = fit_params
         self.groups = groups
+        self.manager = manager
         self.max_iter = max_iter
+        self.memo = memo
         self.param_distributions = param_distributions
+        self.pipeline_cache = pipeline_cache
+        self.resource = resource
+        self.resource_steps = resource_steps
         self.return_train_score = return_train_score
         self.scoring = scoring
+        self.warm_start_cache = warm_start_cache
+        self.warm_start_param = warm_start_param
         self.X = X
         self.y = y
 
@@ -218,56 +628,44 @@ class _Objective:
         estimator = clone(self.estimator)
         params = self._get_params(trial)
 
+        memo_key = None
+        if self.memo is not None:
+            memo_key = joblib.hash(params)
+            if memo_key in self.memo:
+                _logger.debug("Reusing the scores of an earlier trial with the same parameters.")
+                return self._store_and_report_scores(trial, self.memo[memo_key])
+
         estimator.set_params(**params)
-        # Prevent objects from being shared when parallelization is enabled with n_jobs.
-        fit_params = copy.deepcopy(self.fit_params)
+        fit_params = _copy_fit_params(self.fit_params)
 
         if self.enable_pruning:
             scores = self._cross_validate_with_pruning(trial, estimator, fit_params)
+        elif self.resource is not None:
+            scores = self._cross_validate_with_resources(trial, estimator, fit_params)
+        elif self.enable_fold_pruning:
+            scores = self._cross_validate_with_fold_pruning(trial, estimator, fit_params)
+        elif self.pipeline_cache is not None:
+            scores = self._cross_validate_with_pipeline_cache(estimator, params, fit_params)
+        elif self.warm_start_cache is not None:
+            scores = self._cross_validate_with_warm_start(estimator, params, fit_params)
+        elif self.executor is not None:
+            # Only the waiting is done in this thread, so that trials run in parallel even if
+            # the estimator holds the GIL.
+            scores = self.executor.submit(
+                self._cross_validate, estimator, self.cv, fit_params
+            ).result()
         else:
-            sklearn_version = sklearn.__version__.split(".")
-            sklearn_major_version = int(sklearn_version[0])
-            sklearn_minor_version = int(sklearn_version[1])
-            try:
-                if sklearn_major_version == 1 and sklearn_minor_version >= 4:
-                    scores = cross_validate(
-                        estimator,
-                        self.X,
-                        self.y,
-                        cv=self.cv,
-                        error_score=self.error_score,
-                        params=fit_params,
-                        groups=self.groups,
-                        return_train_score=self.return_train_score,
-                        scoring=self.scoring,
-                    )
-                else:
-                    scores = cross_validate(
-                        estimator,
-                        self.X,
-                        self.y,
-                        cv=self.cv,
-                        error_score=self.error_score,
-                        fit_params=fit_params,
-                        groups=self.groups,
-                        return_train_score=self.return_train_score,
-                        scoring=self.scoring,
-                    )
-            except ValueError:
-                n_splits = self.cv.get_n_splits(self.X, self.y, self.groups)
-                fit_time = np.array([np.nan] * n_splits)
-                score_time = np.array([np.nan] * n_splits)
-                test_score = np.array(
-                    [self.error_score if self.error_score is not None else np.nan] * n_splits
-                )
+            scores = self._cross_validate(estimator, self.cv, fit_params)
 
-                scores = {
-                    "fit_time": fit_time,
-                    "score_time": score_time,
-                    "test_score": test_score,
-                }
+        if self.memo is not None and memo_key is not None:
+            self.memo[memo_key] = scores
 
-        self._store_scores(trial, scores)
+        return self._store_and_report_scores(trial, scores)
+
+    def _store_and_report_scores(
+        self, trial: Trial, scores: Mapping[str, OneDimArrayLikeType]
+    ) -> float:
+        results = self._store_scores(trial, scores)
 
         test_scores = scores["test_score"]
         scores_list = test_scores if isinstance(test_scores, list) else list(test_scores.tolist())
@@ -279,7 +677,273 @@ class _Objective:
             ).format(e)
             warnings.warn(warn_msg)
 
-        return trial.user_attrs["mean_test_score"]
+        return results["mean_test_score"]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies sent to the executor only cross-validate, and the executor and the manager
+        # cannot be pickled.
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["manager"] = None
+        state["memo"] = None
+        state["pipeline_cache"] = None
+        state["warm_start_cache"] = None
+        return state
+
+    def _cross_validate(
+        self,
+        estimator: "sklearn.base.BaseEstimator",
+        cv: "BaseCrossValidator",
+        fit_params: dict[str, Any],
+    ) -> Mapping[str, OneDimArrayLikeType]:
+        sklearn_version = sklearn.__version__.split(".")
+        sklearn_major_version = int(sklearn_version[0])
+        sklearn_minor_version = int(sklearn_version[1])
+        try:
+            if sklearn_major_version == 1 and sklearn_minor_version >= 4:
+                scores = cross_validate(
+                    estimator,
+                    self.X,
+                    self.y,
+                    cv=cv,
+                    error_score=self.error_score,
+                    params=fit_params,
+                    groups=self.groups,
+                    n_jobs=self.cv_n_jobs,
+                    return_train_score=self.return_train_score,
+                    scoring=self.scoring,
+                )
+            else:
+                scores = cross_validate(
+                    estimator,
+                    self.X,
+                    self.y,
+                    cv=cv,
+                    error_score=self.error_score,
+                    fit_params=fit_params,
+                    groups=self.groups,
+                    n_jobs=self.cv_n_jobs,
+                    return_train_score=self.return_train_score,
+                    scoring=self.scoring,
+                )
+        except ValueError:
+            n_splits = cv.get_n_splits(self.X, self.y, self.groups)
+            fit_time = np.array([np.nan] * n_splits)
+            score_time = np.array([np.nan] * n_splits)
+            test_score = np.array(
+                [self.error_score if self.error_score is not None else np.nan] * n_splits
+            )
+
+            scores = {
+                "fit_time": fit_time,
+                "score_time": score_time,
+                "test_score": test_score,
+            }
+
+        return scores
+
+    def _cross_validate_with_resources(
+        self,
+        trial: Trial,
+        estimator: "sklearn.base.BaseEstimator",
+        fit_params: dict[str, Any],
+    ) -> Mapping[str, OneDimArrayLikeType]:
+        assert self.resource is not None
+
+        # Each budget is evaluated from scratch, and its mean test score is reported with the
+        # budget as the step, so that pruners compare trials at the same budget.
+        for resources in self.resource_steps:
+            if self.resource == "n_samples":
+                cv = check_cv(
+                    [
+                        (train[:resources], test)
+                        for train, test in self.cv.split(self.X, self.y, groups=self.groups)
+                    ]
+                )
+            else:
+                cv = self.cv
+                estimator.set_params(**{self.resource: resources})
+
+            scores = self._cross_validate(estimator, cv, copy.deepcopy(fit_params))
+
+            trial.report(float(np.nanmean(scores["test_score"])), step=resources)
+
+            if trial.should_prune():
+                self._store_scores(trial, scores)
+
+                raise TrialPruned("trial was pruned at {} {}.".format(resources, self.resource))
+
+        return scores
+
+    def _cross_validate_with_pipeline_cache(
+        self,
+        estimator: "Pipeline",
+        params: dict[str, Any],
+        fit_params: dict[str, Any],
+    ) -> Mapping[str, OneDimArrayLikeType]:
+        assert self.pipeline_cache is not None
+
+        # The outputs of the upstream steps only depend on the fold and on the parameters of
+        # those steps, as the rest of the pipeline is the same for every trial.
+        upstream = estimator[:-1]
+        upstream_names = {name for name, _ in upstream.steps}
+        upstream_params = {
+            name: value for name, value in params.items() if name.split("__")[0] in upstream_names
+        }
+        upstream_key = joblib.hash(upstream_params)
+        final_name, final_estimator = estimator.steps[-1]
+        upstream_fit_params = {
+            key: value
+            for key, value in fit_params.items()
+            if not key.startswith(final_name + "__")
+        }
+        final_fit_params = {
+            key[len(final_name) + 2 :]: value
+            for key, value in fit_params.items()
+            if key.startswith(final_name + "__")
+        }
+
+        n_splits = self.cv.get_n_splits(self.X, self.y, self.groups)
+        scores = {
+            "fit_time": np.zeros(n_splits),
+            "score_time": np.zeros(n_splits),
+            "test_score": np.empty(n_splits),
+        }
+        if self.return_train_score:
+            scores["train_score"] = np.empty(n_splits)
+
+        # The cache is only accessed here, so that the folds can be fitted in other processes,
+        # which send back the outputs of the upstream steps that were not cached.
+        results = Parallel(n_jobs=self.cv_n_jobs)(
+            delayed(_fit_and_score_pipeline)(
+                upstream,
+                final_estimator,
+                self.pipeline_cache.get((i, upstream_key)),
+                *_safe_split(estimator, self.X, self.y, train),
+                *_safe_split(estimator, self.X, self.y, test, train_indices=train),
+                _check_fit_params(self.X, upstream_fit_params, train),
+                _check_fit_params(self.X, final_fit_params, train),
+                self.scoring,
+                self.error_score,
+                self.return_train_score,
+            )
+            for i, (train, test) in enumerate(self.cv.split(self.X, self.y, groups=self.groups))
+        )
+
+        for i, (outputs, upstream_time, ret) in enumerate(results):
+            if outputs is not None:
+                self.pipeline_cache.put((i, upstream_key), outputs)
+
+            out = list(np.asarray(ret, dtype=float).tolist())
+            if self.return_train_score:
+                scores["train_score"][i] = out.pop(0)
+            scores["test_score"][i] = out[0]
+            scores["fit_time"][i] = upstream_time
+            scores["fit_time"][i] += out[1]
+            scores["score_time"][i] = out[2]
+
+        return scores
+
+    def _cross_validate_with_warm_start(
+        self,
+        estimator: "sklearn.base.BaseEstimator",
+        params: dict[str, Any],
+        fit_params: dict[str, Any],
+    ) -> Mapping[str, OneDimArrayLikeType]:
+        assert self.warm_start_cache is not None
+        assert self.warm_start_param is not None
+
+        prefix, _, _ = self.warm_start_param.rpartition("__")
+        warm_start_name = prefix + "__warm_start" if prefix else "warm_start"
+        estimator.set_params(**{warm_start_name: True})
+        budget = estimator.get_params()[self.warm_start_param]
+        other_key = joblib.hash(
+            {name: value for name, value in params.items() if name != self.warm_start_param}
+        )
+
+        n_splits = self.cv.get_n_splits(self.X, self.y, self.groups)
+        scores = {
+            "fit_time": np.zeros(n_splits),
+            "score_time": np.zeros(n_splits),
+            "test_score": np.empty(n_splits),
+        }
+        if self.return_train_score:
+            scores["train_score"] = np.empty(n_splits)
+
+        jobs = []
+        for i, (train, test) in enumerate(self.cv.split(self.X, self.y, groups=self.groups)):
+            # Extend the estimator fitted with the largest budget that does not exceed this one.
+            # Cached estimators are never modified, so that concurrent trials can share them.
+            warm_budgets = [
+                key[2]
+                for key in self.warm_start_cache.keys()
+                if key[:2] == (i, other_key) and key[2] <= budget
+            ]
+            warm_budget = max(warm_budgets, default=None)
+            warm_estimator = self.warm_start_cache.get((i, other_key, warm_budget))
+            if warm_estimator is None:
+                fold_estimator = clone(estimator)
+            elif warm_budget == budget:
+                fold_estimator = warm_estimator
+            else:
+                fold_estimator = copy.deepcopy(warm_estimator)
+                fold_estimator.set_params(**{self.warm_start_param: budget})
+
+            jobs.append(
+                delayed(_fit_and_score)(
+                    fold_estimator,
+                    *_safe_split(estimator, self.X, self.y, train),
+                    *_safe_split(estimator, self.X, self.y, test, train_indices=train),
+                    _check_fit_params(self.X, fit_params, train),
+                    self.scoring,
+                    self.error_score,
+                    self.return_train_score,
+                    fit=fold_estimator is not warm_estimator,
+                )
+            )
+
+        # The cache is only accessed here, so that the folds can be fitted in other processes,
+        # which send back the fitted estimators.
+        results = Parallel(n_jobs=self.cv_n_jobs)(jobs)
+
+        for i, (fold_estimator, ret) in enumerate(results):
+            if fold_estimator is not None:
+                self.warm_start_cache.put((i, other_key, budget), fold_estimator)
+
+            out = list(np.asarray(ret, dtype=float).tolist())
+            if self.return_train_score:
+                scores["train_score"][i] = out.pop(0)
+            scores["test_score"][i] = out[0]
+            scores["fit_time"][i] = out[1]
+            scores["score_time"][i] = out[2]
+
+        return scores
+
+    def _cross_validate_with_fold_pruning(
+        self,
+        trial: Trial,
+        estimator: "sklearn.base.BaseEstimator",
+        fit_params: dict[str, Any],
+    ) -> Mapping[str, OneDimArrayLikeType]:
+        # The mean score of the folds evaluated so far is reported after each fold. All trials
+        # are evaluated on the same folds in the same order, so these are comparable per step.
+        fold_scores = []
+        for step, split in enumerate(self.cv.split(self.X, self.y, groups=self.groups)):
+            fold_scores.append(
+                self._cross_validate(estimator, check_cv([split]), copy.deepcopy(fit_params))
+            )
+            scores = {
+                name: np.concatenate([s[name] for s in fold_scores]) for name in fold_scores[0]
+            }
+
+            trial.report(float(np.nanmean(scores["test_score"])), step=step)
+
+            if trial.should_prune():
+                self._store_scores(trial, scores)
+
+                raise TrialPruned("trial was pruned after {} folds.".format(step + 1))
+
+        return scores
 
     def _cross_validate_with_pruning(
         self,
@@ -311,98 +975,173 @@ class _Objective:
         if self.return_train_score:
             scores["train_score"] = np.empty(n_splits)
 
-        for step in range(self.max_iter):
-            for i, (train, test) in enumerate(self.cv.split(self.X, self.y, groups=self.groups)):
-                out = list(
-                    np.asarray(
-                        self._partial_fit_and_score(
-                            estimators[i], train, test, partial_fit_params
-                        ),
-                        dtype=float,
-                    ).tolist()
+        # The jobs are given module level functions and only the data of their fold, since
+        # methods would pickle the whole objective, including ``X``, for every job.
+        fit_fold: Callable[..., tuple["sklearn.base.BaseEstimator", list[Number]]]
+        folds: list[tuple[Any, ...]] = []
+        X, y = self.X, self.y
+        if self.batch_size is None:
+            # The folds are sliced once per trial rather than at every step.
+            fit_fold = _partial_fit_and_score
+            for train, test in self.cv.split(X, y, groups=self.groups):
+                X_train, y_train = _safe_split(estimator, X, y, train)
+                X_test, y_test = _safe_split(estimator, X, y, test, train_indices=train)
+                fold_fit_params = _check_fit_params(X, partial_fit_params, train)
+                folds.append((X_train, y_train, X_test, y_test, fold_fit_params))
+        else:
+            # Only the indices are kept, and every batch is sliced when it is used, so that at
+            # most one batch of ``X`` per fold is loaded in memory at once.
+            folds = list(self.cv.split(X, y, groups=self.groups))
+
+        memmap_folder = None
+        if joblib.effective_n_jobs(self.cv_n_jobs) > 1:
+            # The data is dumped once per trial and loaded as read-only memory maps, which joblib
+            # passes to the other processes by file name.
+            memmap_folder = tempfile.mkdtemp(prefix="optuna_search_cv_")
+            folds = [
+                tuple(
+                    _memmap(a, memmap_folder, "fold{}_{}".format(i, j)) for j, a in enumerate(fold)
                 )
+                for i, fold in enumerate(folds)
+            ]
+            if self.batch_size is not None:
+                X = _memmap(X, memmap_folder, "X")
+                y = _memmap(y, memmap_folder, "y")
+                partial_fit_params = {
+                    key: _memmap(value, memmap_folder, "fit_param_{}".format(i))
+                    for i, (key, value) in enumerate(partial_fit_params.items())
+                }
 
-                if self.return_train_score:
-                    scores["train_score"][i] = out.pop(0)
-
-                scores["test_score"][i] = out[0]
-                scores["fit_time"][i] += out[1]
-                scores["score_time"][i] += out[2]
-
-            intermediate_value = np.nanmean(scores["test_score"])
-
-            trial.report(float(intermediate_value), step=step)
-
-            if trial.should_prune():
-                self._store_scores(trial, scores)
-
-                raise TrialPruned("trial was pruned at iteration {}.".format(step))
+        if self.batch_size is not None:
+            fit_fold = functools.partial(
+                _partial_fit_and_score_in_batches, X=X, y=y, batch_size=self.batch_size
+            )
+            # The fit parameters are sliced along with every batch.
+            folds = [(train, test, partial_fit_params) for train, test in folds]
 
-        return scores
+        steps = self._iter_steps(fit_fold, estimators, folds)
 
-    def _get_params(self, trial: Trial) -> dict[str, Any]:
-        return {
-            name: trial._suggest(name, distribution)
-            for name, distribution in self.param_distributions.items()
-        }
+        try:
+            for step, results in enumerate(steps):
+                for i, ret in enumerate(results):
+                    out = list(np.asarray(ret, dtype=float).tolist())
 
-    def _partial_fit_and_score(
-        self,
-        estimator: "sklearn.base.BaseEstimator",
-        train: list[int],
-        test: list[int],
-        partial_fit_params: dict[str, Any],
-    ) -> list[Number]:
-        X_train, y_train = _safe_split(estimator, self.X, self.y, train)
-        X_test, y_test = _safe_split(estimator, self.X, self.y, test, train_indices=train)
+                    if self.return_train_score:
+                        scores["train_score"][i] = out.pop(0)
 
-        start_time = time()
+                    scores["test_score"][i] = out[0]
+                    scores["fit_time"][i] += out[1]
+                    scores["score_time"][i] += out[2]
 
-        try:
-            estimator.partial_fit(X_train, y_train, **partial_fit_params)
+                intermediate_value = np.nanmean(scores["test_score"])
 
-        except Exception as e:
-            if self.error_score == "raise":
-                raise e
+                trial.report(float(intermediate_value), step=step)
 
-            elif isinstance(self.error_score, Number):
-                fit_time = time() - start_time
-                test_score = self.error_score
-                score_time = 0.0
+                if trial.should_prune():
+                    self._store_scores(trial, scores)
 
-                if self.return_train_score:
-                    train_score = self.error_score
+                    raise TrialPruned("trial was pruned at iteration {}.".format(step))
 
-            else:
-                raise ValueError("error_score must be 'raise' or numeric.") from e
+        finally:
+            # Stop the folds that are still being fitted in other processes.
+            steps.close()
 
-        else:
-            fit_time = time() - start_time
-            test_score = self.scoring(estimator, X_test, y_test)
-            score_time = time() - fit_time - start_time
+            if memmap_folder is not None:
+                shutil.rmtree(memmap_folder, ignore_errors=True)
 
-            if self.return_train_score:
-                train_score = self.scoring(estimator, X_train, y_train)
+        return scores
 
-        # Required for type checking but is never expected to fail.
-        assert isinstance(fit_time, Number)
-        assert isinstance(score_time, Number)
+    def _iter_steps(
+        self,
+        fit_fold: Callable[..., tuple["sklearn.base.BaseEstimator", list[Number]]],
+        estimators: list["sklearn.base.BaseEstimator"],
+        folds: list[tuple[Any, ...]],
+    ) -> Generator[list[list[Number]], None, None]:
+        args = (self.scoring, self.error_score, self.return_train_score)
+        n_jobs = joblib.effective_n_jobs(self.cv_n_jobs)
+
+        if n_jobs == 1:
+            for _ in range(self.max_iter):
+                yield [
+                    fit_fold(estimator, *fold, *args)[1]
+                    for estimator, fold in zip(estimators, folds)
+                ]
+
+            return
+
+        # Every fold is fitted for all the steps by a single job, which only sends its scores
+        # back at each step, so that the estimators and the data of the folds are not sent to
+        # other processes at every step. The jobs run in the active joblib backend, which is
+        # resolved here since ``Parallel`` looks it up when it is created, while another
+        # thread waits for them so that the scores are received as soon as they are sent.
+        assert self.manager is not None
+        results_queue = self.manager.Queue()
+        stop = self.manager.Event()
+        parallel = Parallel(n_jobs=self.cv_n_jobs)
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                parallel(
+                    delayed(_partial_fit_and_score_steps)(
+                        fit_fold, i, estimator, fold, args, self.max_iter, results_queue, stop
+                    )
+                    for i, (estimator, fold) in enumerate(zip(estimators, folds))
+                )
+            except BaseException as e:
+                errors.append(e)
 
-        ret = [test_score, fit_time, score_time]
+        thread = threading.Thread(target=run)
+        thread.start()
 
-        if self.return_train_score:
-            ret.insert(0, train_score)
+        try:
+            received: dict[int, dict[int, list[Number]]] = {}
+            for step in range(self.max_iter):
+                while len(received.get(step, {})) < len(folds):
+                    try:
+                        i, fold_step, ret = results_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        # A job that failed never sends the scores of the remaining steps, so its
+                        # error is raised here.
+                        if errors:
+                            raise errors[0]
+                        continue
+
+                    received.setdefault(fold_step, {})[i] = ret
+
+                results = received.pop(step)
+                yield [results[i] for i in range(len(folds))]
+
+        finally:
+            stop.set()
+            thread.join()
 
-        return ret
+    def _get_params(self, trial: Trial) -> dict[str, Any]:
+        return {
+            name: trial._suggest(name, distribution)
+            for name, distribution in self.param_distributions.items()
+        }
 
-    def _store_scores(self, trial: Trial, scores: Mapping[str, OneDimArrayLikeType]) -> None:
+    def _store_scores(
+        self, trial: Trial, scores: Mapping[str, OneDimArrayLikeType]
+    ) -> dict[str, Any]:
+        results = {}
         for name, array in scores.items():
             if name in ["test_score", "train_score"]:
                 for i, score in enumerate(array):
-                    trial.set_user_attr("split{}_{}".format(i, name), score)
+                    results["split{}_{}".format(i, name)] = score
+
+            results["mean_{}".format(name)] = np.nanmean(array)
+            results["std_{}".format(name)] = np.nanstd(array)
+
+        if self.cv_results_attr is not None:
+            # A single write, which matters for storages where every write is a round trip.
+            trial.set_user_attr(self.cv_results_attr, results)
+        else:
+            for key, value in results.items():
+                trial.set_user_attr(key, value)
 
-            trial.set_user_attr("mean_{}".format(name), np.nanmean(array))
-            trial.set_user_attr("std_{}".format(name), np.nanstd(array))
+        return results
 
 
 @experimental_class("0.17.0")
@@ -420,6 +1159,20 @@ class OptunaSearchCV(BaseEstimator):
             Distributions are assumed to implement the optuna distribution
             interface.
 
+        batch_size:
+            Number of samples to feed ``partial_fit`` at once if ``enable_pruning`` is
+            :obj:`True`. Each epoch then passes over the training set of every fold in batches
+            of consecutive indices, and the folds are scored batch by batch, as the mean of the
+            scores of the batches weighted by their sizes. This is the score of the whole fold
+            for metrics that average over samples, such as accuracy or the mean squared error,
+            but not e.g. for :math:`R^2` or ROC AUC. Only the indices of the folds are kept, and
+            each batch is sliced from ``X`` when it is used, so that ``X`` can be larger than
+            memory if slicing it is lazy, as for a :class:`numpy.memmap`, an array loaded with
+            ``mmap_mode`` or a Dask array. ``y`` is loaded to find the classes of classifiers.
+            The refit also feeds ``partial_fit`` batches, for ``max_iter`` epochs. If
+            :obj:`None`, each training set is fed to ``partial_fit`` at once and the refit
+            calls ``fit``.
+
         cv:
             Cross-validation strategy. Possible inputs for cv are:
 
@@ -433,10 +1186,35 @@ class OptunaSearchCV(BaseEstimator):
             :class:`sklearn.model_selection.StratifiedKFold` is used. otherwise,
             :class:`sklearn.model_selection.KFold` is used.
 
+        cv_n_jobs:
+            Number of :mod:`joblib` based parallel jobs to fit and score the folds of a single
+            trial. :obj:`None` means ``1`` unless in a :func:`joblib.parallel_config` context.
+            ``-1`` means using all processors. Unlike ``n_jobs``, this speeds up each trial
+            without running more trials at once, so a sequential sampler such as
+            :class:`~optuna.samplers.TPESampler` still sees the result of every trial before
+            suggesting the next one. If ``enable_pruning`` is :obj:`True`, each fold is fitted
+            for all the epochs by the same job, which only sends its scores back at each epoch.
+
+        cv_results_attr:
+            Name of a user attribute of the trials to store their scores in, as a single
+            dictionary with the keys of ``cv_results_``. This takes one storage write per trial,
+            or per pruning step, instead of one per score, which matters for storages such as
+            :class:`~optuna.storages.RDBStorage` where every write is a round trip.
+            ``cv_results_`` is built from this dictionary. If :obj:`None`, every score, e.g.
+            ``split0_test_score`` or ``mean_fit_time``, is stored in its own user attribute.
+
         enable_pruning:
             If :obj:`True`, pruning is performed in the case where the
             underlying estimator supports ``partial_fit``.
 
+        enable_fold_pruning:
+            If :obj:`True`, the folds of a trial are evaluated one after another. After each
+            fold, the mean test score of the folds evaluated so far is reported with the index
+            of the fold as the step, and the trial is pruned if the pruner of the study says
+            so. This works with any estimator, and cannot be used together with
+            ``enable_pruning`` or ``resource``. Since the folds are evaluated one by one,
+            ``cv_n_jobs`` has no effect.
+
         error_score:
             Value to assign to the score if an error occurs in fitting. If
             ``"raise"``, the error is raised. If numeric,
@@ -447,6 +1225,34 @@ class OptunaSearchCV(BaseEstimator):
             Maximum number of epochs. This is only used if the underlying
             estimator supports ``partial_fit``.
 
+        memmap:
+            If :obj:`True`, ``X``, ``y``, ``groups``, the array-valued fit parameters and the
+            indices of the folds are dumped once to a temporary folder and loaded as read-only
+            memory maps, which are shared by all trials and folds instead of being copied.
+            Read-only fit parameters are not deep-copied for every trial. The folder is created
+            by :func:`tempfile.mkdtemp` and deleted at the end of the search.
+
+        memoize:
+            If :obj:`True`, the cross-validation scores of each trial are kept in memory during
+            :meth:`fit`, and a later trial with the same parameters, which samplers often
+            suggest for categorical or discrete distributions, copies them instead of
+            cross-validating again. If :obj:`None`, scores are memoized only if the estimator
+            is deterministic, i.e. every ``random_state`` parameter of the estimator, including
+            those of nested estimators, is an integer. If :obj:`False`, every trial is
+            cross-validated. Memoization cannot be used together with ``enable_pruning``,
+            ``enable_fold_pruning`` or ``resource``, which report to the trial while it is
+            cross-validated, so :obj:`None` turns it off for them.
+
+        max_resources:
+            Largest amount of ``resource`` that a trial is evaluated with. If :obj:`None`, it is
+            the number of samples of the largest training set for ``"n_samples"``, and the value
+            of the parameter in ``estimator`` otherwise.
+
+        min_resources:
+            Amount of ``resource`` that every trial is first evaluated with. If :obj:`None`, it
+            is ``2 * n_splits`` for ``"n_samples"``, multiplied by the number of classes for a
+            classifier, and ``1`` otherwise.
+
         n_jobs:
             Number of :obj:`threading` based parallel jobs. :obj:`None` means ``1``.
             ``-1`` means using the number is set to CPU count.
@@ -464,6 +1270,22 @@ class OptunaSearchCV(BaseEstimator):
             termination signal such as Ctrl+C or SIGTERM. This trades off
             runtime vs quality of the solution.
 
+        pipeline_cache_size:
+            Maximum number of outputs of the upstream steps of a
+            :class:`~sklearn.pipeline.Pipeline` estimator to keep in memory. If it is set, all
+            steps but the last are fitted on the training set of each fold and their outputs
+            for the training and validation sets are cached, keyed by the index of the fold and
+            the parameters suggested for those steps. Trials that share these parameters then
+            only fit and score the last step, which is scored by ``scoring`` directly on the
+            cached outputs. The least recently used outputs are evicted once there are more than
+            ``pipeline_cache_size`` of them, e.g. ``n_splits`` outputs per combination of
+            upstream parameters. With ``cv_n_jobs``, the jobs of the folds that miss the cache
+            send the transformed training and validation sets back to be cached. This cannot be
+            used together with ``enable_pruning``, ``enable_fold_pruning``, ``resource`` or
+            ``trial_backend="loky"``. If :obj:`None`, every trial fits the whole pipeline. To
+            cache fitted transformers on disk instead, see the ``memory`` parameter of
+            :class:`~sklearn.pipeline.Pipeline`.
+
         random_state:
             Seed of the pseudo random number generator. If int, this is the
             seed used by the random number generator. If
@@ -471,12 +1293,31 @@ class OptunaSearchCV(BaseEstimator):
             generator. If :obj:`None`, the global random state from
             :mod:`numpy.random` is used.
 
+        reduction_factor:
+            Factor by which the amount of ``resource`` grows from one evaluation of a trial to
+            the next.
+
         refit:
             If :obj:`True`, refit the estimator with the best found
             hyperparameters. The refitted estimator is made available at the
             ``best_estimator_`` attribute and permits using ``predict``
             directly.
 
+        resource:
+            Resource to allocate to trials by successive halving for estimators that do not
+            support ``partial_fit``. If ``"n_samples"``, each trial is first fitted on
+            ``min_resources`` samples of every training set. Otherwise, this is the name of an
+            integer parameter of ``estimator``, e.g. ``"n_estimators"``, that is set to
+            ``min_resources`` first. The amount is then multiplied by ``reduction_factor``
+            until ``max_resources`` is reached. After each evaluation, the mean test score is
+            reported with the amount of ``resource`` as the step, and the trial is pruned if
+            the pruner of the study says so. If ``study`` is :obj:`None`, the study is created
+            with a :class:`~optuna.pruners.SuccessiveHalvingPruner` whose rungs match these
+            amounts. A user-defined study may use e.g. a
+            :class:`~optuna.pruners.HyperbandPruner` with ``min_resource`` and ``max_resource``
+            set to ``min_resources`` and ``max_resources``. This cannot be used together with
+            ``enable_pruning``. If :obj:`None`, every trial is fitted with the full resource.
+
         return_train_score:
             If :obj:`True`, training scores will be included. Computing
             training scores is used to get insights on how different
@@ -500,6 +1341,16 @@ class OptunaSearchCV(BaseEstimator):
             - If int, then draw ``subsample`` samples.
             - If float, then draw ``subsample`` * ``X.shape[0]`` samples.
 
+        trial_backend:
+            Where the trials are cross-validated. If ``"threading"``, trials run in the ``n_jobs``
+            threads of :meth:`~optuna.study.Study.optimize`. If ``"loky"``, those threads only
+            suggest parameters and record scores, while the folds of each trial are fitted in
+            one of ``n_jobs`` worker processes, so that estimators that hold the GIL scale across
+            cores. Arrays are passed to the processes as memory maps by :mod:`joblib`. Use
+            ``memmap=True`` to avoid hashing and dumping them for every trial. ``"loky"`` cannot
+            be used together with ``enable_pruning``, ``enable_fold_pruning`` or ``resource``,
+            which report to the trial while it is cross-validated.
+
         timeout:
             Time limit in seconds for the search of appropriate models. If
             :obj:`None`, the study is executed without time limitation. If
@@ -511,6 +1362,31 @@ class OptunaSearchCV(BaseEstimator):
         verbose:
             Verbosity level. The higher, the more messages.
 
+        warm_start_cache_size:
+            Maximum number of fitted estimators to keep in memory for ``warm_start_param``,
+            counting each fold separately. Fitted estimators can be large, so this trades memory
+            for the number of budgets that can be extended.
+
+        warm_start_param:
+            Name of a parameter of the estimator that sets its budget, e.g. ``n_estimators``
+            or ``max_iter``. If it is set, the estimator fitted on each fold is kept, keyed by
+            the value of this parameter and by the other parameters suggested in the trial. A
+            later trial with the same other parameters and a budget that is at least as large
+            then deep-copies the estimator with the largest such budget, sets this parameter
+            and refits it with ``warm_start=True`` instead of fitting a clone from scratch. The
+            estimator, or the step of a :class:`~sklearn.pipeline.Pipeline` named by the prefix
+            of this parameter, must accept ``warm_start``. For ensembles such as
+            :class:`~sklearn.ensemble.RandomForestClassifier` and
+            :class:`~sklearn.ensemble.GradientBoostingClassifier`, where the parameter is the
+            total number of members, only the missing members are fitted. Iterative estimators
+            such as :class:`~sklearn.linear_model.SGDClassifier` instead run ``max_iter`` more
+            epochs from the earlier solution, so their scores differ from those of a cold fit.
+            With ``cv_n_jobs``, each job receives the copy of the cached estimator it extends
+            and sends the extended estimator back to the cache, so large estimators are
+            transferred twice per fold. This cannot be used together with ``enable_pruning``,
+            ``enable_fold_pruning``, ``resource``, ``pipeline_cache_size`` or
+            ``trial_backend="loky"``. If :obj:`None`, every trial fits a clone of the estimator.
+
         callbacks:
             List of callback functions that are invoked at the end of each trial. Each function
             must accept two parameters with the following types in this order:
@@ -531,6 +1407,11 @@ class OptunaSearchCV(BaseEstimator):
             Estimator that was chosen by the search. This is present only if
             ``refit`` is set to :obj:`True`.
 
+        n_resources_:
+            Amounts of ``resource`` at which the trials are evaluated, the last of which is used
+            to refit the best estimator. This is present only if ``resource`` is not
+            :obj:`None`.
+
         n_splits_:
             Number of cross-validation splits.
 
@@ -609,7 +1490,14 @@ class OptunaSearchCV(BaseEstimator):
     def cv_results_(self) -> dict[str, Any]:
         """A dictionary mapping a metric name to a list of Cross-Validation results of all trials."""  # NOQA: E501
 
-        cv_results_dict_in_list = [trial_.user_attrs for trial_ in self.trials_]
+        cv_results_dict_in_list = [
+            (
+                trial_.user_attrs.get(self.cv_results_attr, {})
+                if self.cv_results_attr is not None
+                else trial_.user_attrs
+            )
+            for trial_ in self.trials_
+        ]
         if len(cv_results_dict_in_list) == 0:
             cv_results_list_in_dict = {}
         else:
@@ -750,20 +1638,34 @@ class OptunaSearchCV(BaseEstimator):
         estimator: "sklearn.base.BaseEstimator",
         param_distributions: Mapping[str, distributions.BaseDistribution],
         *,
+        batch_size: int | None = None,
         cv: int | "BaseCrossValidator" | Iterable | None = None,
+        cv_n_jobs: int | None = None,
+        cv_results_attr: str | None = None,
         enable_pruning: bool = False,
+        enable_fold_pruning: bool = False,
         error_score: Number | float | str = np.nan,
         max_iter: int = 1000,
+        max_resources: int | None = None,
+        memmap: bool = False,
+        memoize: bool | None = None,
+        min_resources: int | None = None,
         n_jobs: int | None = None,
         n_trials: int | None = 10,
+        pipeline_cache_size: int | None = None,
         random_state: int | np.random.RandomState | None = None,
+        reduction_factor: int = 3,
         refit: bool = True,
+        resource: str | None = None,
         return_train_score: bool = False,
         scoring: Callable[..., float] | str | None = None,
         study: study_module.Study | None = None,
         subsample: float | int = 1.0,
         timeout: float | None = None,
+        trial_backend: str = "threading",
         verbose: int = 0,
+        warm_start_cache_size: int = 100,
+        warm_start_param: str | None = None,
         callbacks: list[Callable[[study_module.Study, FrozenTrial], None]] | None = None,
         catch: Iterable[type[Exception]] | type[Exception] = (),
     ) -> None:
@@ -783,12 +1685,21 @@ class OptunaSearchCV(BaseEstimator):
                     "Please use new distributions such as FloatDistribution etc."
                 )
 
+        self.batch_size = batch_size
         self.cv = cv
+        self.cv_n_jobs = cv_n_jobs
+        self.cv_results_attr = cv_results_attr
         self.enable_pruning = enable_pruning
+        self.enable_fold_pruning = enable_fold_pruning
         self.error_score = error_score
         self.estimator = estimator
         self.max_iter = max_iter
+        self.max_resources = max_resources
+        self.memmap = memmap
+        self.memoize = memoize
+        self.min_resources = min_resources
         self.n_trials = n_trials
+        self.pipeline_cache_size = pipeline_cache_size
         self.n_jobs = n_jobs if n_jobs else 1
         self.param_distributions = (
             param_distributions
@@ -796,16 +1707,35 @@ class OptunaSearchCV(BaseEstimator):
             else dict(param_distributions)
         )
         self.random_state = random_state
+        self.reduction_factor = reduction_factor
         self.refit = refit
+        self.resource = resource
         self.return_train_score = return_train_score
         self.scoring = scoring
         self.study = study
         self.subsample = subsample
         self.timeout = timeout
+        self.trial_backend = trial_backend
         self.verbose = verbose
+        self.warm_start_cache_size = warm_start_cache_size
+        self.warm_start_param = warm_start_param
         self.callbacks = callbacks
         self.catch = catch
 
+    def _memoize(self) -> bool:
+        if self.memoize is not None:
+            return self.memoize
+
+        if self.enable_pruning or self.enable_fold_pruning or self.resource is not None:
+            return False
+
+        # A ``random_state`` of None or of a ``RandomState`` instance makes every fit differ.
+        return all(
+            isinstance(value, Integral)
+            for name, value in self.estimator.get_params().items()
+            if name == "random_state" or name.endswith("__random_state")
+        )
+
     def _check_is_fitted(self) -> None:
         attributes = ["n_splits_", "sample_indices_", "scorer_", "study_"]
 
@@ -825,12 +1755,153 @@ class OptunaSearchCV(BaseEstimator):
         if self.enable_pruning and not hasattr(self.estimator, "partial_fit"):
             raise ValueError("estimator must support partial_fit.")
 
+        if self.batch_size is not None:
+            if not self.enable_pruning:
+                raise ValueError("batch_size requires enable_pruning.")
+
+            if self.batch_size <= 0:
+                raise ValueError("batch_size must be > 0, got {}.".format(self.batch_size))
+
+        if self.enable_fold_pruning and (self.enable_pruning or self.resource is not None):
+            raise ValueError(
+                "enable_fold_pruning cannot be used together with enable_pruning or resource."
+            )
+
+        if self.trial_backend not in ("threading", "loky"):
+            raise ValueError(
+                "trial_backend must be 'threading' or 'loky', got {}.".format(self.trial_backend)
+            )
+
+        if self.trial_backend == "loky" and (
+            self.enable_pruning or self.enable_fold_pruning or self.resource is not None
+        ):
+            raise ValueError(
+                "trial_backend 'loky' cannot be used together with enable_pruning, "
+                "enable_fold_pruning or resource."
+            )
+
+        if self.pipeline_cache_size is not None:
+            if not isinstance(self.estimator, Pipeline) or len(self.estimator.steps) < 2:
+                raise ValueError("pipeline_cache_size requires a Pipeline with at least 2 steps.")
+
+            if self.pipeline_cache_size <= 0:
+                raise ValueError(
+                    "pipeline_cache_size must be > 0, got {}.".format(self.pipeline_cache_size)
+                )
+
+            if (
+                self.enable_pruning
+                or self.enable_fold_pruning
+                or self.resource is not None
+                or self.trial_backend == "loky"
+            ):
+                raise ValueError(
+                    "pipeline_cache_size cannot be used together with enable_pruning, "
+                    "enable_fold_pruning, resource or trial_backend 'loky'."
+                )
+
+        if self.warm_start_param is not None:
+            estimator_params = self.estimator.get_params()
+            prefix, _, _ = self.warm_start_param.rpartition("__")
+            if self.warm_start_param not in estimator_params:
+                raise ValueError(
+                    "warm_start_param must be a parameter of the estimator, got {}.".format(
+                        self.warm_start_param
+                    )
+                )
+
+            if (prefix + "__warm_start" if prefix else "warm_start") not in estimator_params:
+                raise ValueError(
+                    "warm_start_param requires an estimator that accepts warm_start, "
+                    "got {}.".format(self.warm_start_param)
+                )
+
+            if self.warm_start_cache_size <= 0:
+                raise ValueError(
+                    "warm_start_cache_size must be > 0, got {}.".format(self.warm_start_cache_size)
+                )
+
+            if (
+                self.enable_pruning
+                or self.enable_fold_pruning
+                or self.resource is not None
+                or self.pipeline_cache_size is not None
+                or self.trial_backend == "loky"
+            ):
+                raise ValueError(
+                    "warm_start_param cannot be used together with enable_pruning, "
+                    "enable_fold_pruning, resource, pipeline_cache_size or trial_backend 'loky'."
+                )
+
+        if self.memoize and (
+            self.enable_pruning or self.enable_fold_pruning or self.resource is not None
+        ):
+            raise ValueError(
+                "memoize cannot be used together with enable_pruning, enable_fold_pruning or "
+                "resource."
+            )
+
         if self.max_iter <= 0:
             raise ValueError("max_iter must be > 0, got {}.".format(self.max_iter))
 
         if self.study is not None and self.study.direction != StudyDirection.MAXIMIZE:
             raise ValueError("direction of study must be 'maximize'.")
 
+        if self.resource is not None:
+            if self.enable_pruning:
+                raise ValueError("resource cannot be used together with enable_pruning.")
+
+            if self.resource in self.param_distributions:
+                raise ValueError(
+                    "resource {} must not be in param_distributions.".format(self.resource)
+                )
+
+            if self.resource != "n_samples" and self.resource not in self.estimator.get_params():
+                raise ValueError(
+                    "resource must be 'n_samples' or a parameter of the estimator, "
+                    "got {}.".format(self.resource)
+                )
+
+            if self.reduction_factor < 2:
+                raise ValueError(
+                    "reduction_factor must be >= 2, got {}.".format(self.reduction_factor)
+                )
+
+    def _get_resource_steps(
+        self,
+        splits: list[tuple[np.ndarray, np.ndarray]],
+        y: OneDimArrayLikeType | TwoDimArrayLikeType | None,
+    ) -> list[int]:
+        if self.resource == "n_samples":
+            max_resources = max(len(train) for train, _ in splits)
+            min_resources = 2 * len(splits)
+            if is_classifier(self.estimator) and y is not None:
+                min_resources *= len(np.unique(y))
+        else:
+            max_resources = self.estimator.get_params()[self.resource]
+            min_resources = 1
+
+        if self.max_resources is not None:
+            max_resources = self.max_resources
+        min_resources = min(min_resources, max_resources)
+        if self.min_resources is not None:
+            min_resources = self.min_resources
+
+        if not 0 < min_resources <= max_resources:
+            raise ValueError(
+                "min_resources must be > 0 and <= max_resources, got {} and {}.".format(
+                    min_resources, max_resources
+                )
+            )
+
+        resource_steps = []
+        resources = min_resources
+        while resources < max_resources:
+            resource_steps.append(resources)
+            resources *= self.reduction_factor
+        resource_steps.append(max_resources)
+        return resource_steps
+
     def _more_tags(self) -> dict[str, bool]:
         return {"non_deterministic": True, "no_validation": True}
 
@@ -849,11 +1920,28 @@ class OptunaSearchCV(BaseEstimator):
         except ValueError as e:
             _logger.exception(e)
 
+        if self.resource is not None and self.resource != "n_samples":
+            self.best_estimator_.set_params(**{self.resource: self.n_resources_[-1]})
+
         _logger.info("Refitting the estimator using {} samples...".format(n_samples))
 
         start_time = time()
 
-        self.best_estimator_.fit(X, y, **fit_params)
+        if self.batch_size is None:
+            self.best_estimator_.fit(X, y, **fit_params)
+        else:
+            partial_fit_params = fit_params.copy()
+            if is_classifier(self.best_estimator_) and y is not None:
+                partial_fit_params.setdefault("classes", np.unique(y))
+
+            for _ in range(self.max_iter):
+                for start in range(0, n_samples, self.batch_size):
+                    batch = slice(start, start + self.batch_size)
+                    self.best_estimator_.partial_fit(
+                        _safe_indexing(X, batch),
+                        None if y is None else _safe_indexing(y, batch),
+                        **_check_fit_params(X, partial_fit_params, batch),
+                    )
 
         self.refit_time_ = time() - start_time
 
@@ -914,9 +2002,14 @@ class OptunaSearchCV(BaseEstimator):
 
             self.sample_indices_.sort()
 
-        X_res = _safe_indexing(X, self.sample_indices_)
-        y_res = _safe_indexing(y, self.sample_indices_)
-        groups_res = _safe_indexing(groups, self.sample_indices_)
+            X_res = _safe_indexing(X, self.sample_indices_)
+            y_res = _safe_indexing(y, self.sample_indices_)
+            groups_res = _safe_indexing(groups, self.sample_indices_)
+
+        else:
+            # Indexing with every sample would only copy the data.
+            X_res, y_res, groups_res = X, y, groups
+
         fit_params_res = fit_params
 
         if fit_params_res is not None:
@@ -926,30 +2019,93 @@ class OptunaSearchCV(BaseEstimator):
         cv = check_cv(self.cv, y_res, classifier=classifier)
 
         self.n_splits_ = cv.get_n_splits(X_res, y_res, groups=groups_res)
+        # The data is split once, and every trial is evaluated on the same folds.
+        splits = list(cv.split(X_res, y_res, groups=groups_res))
+        if self.resource == "n_samples":
+            # Trials are fitted on the first samples of each training set, so these are shuffled.
+            splits = [(random_state.permutation(train), test) for train, test in splits]
+        cv = check_cv(splits)
+
+        resource_steps = []
+        if self.resource is not None:
+            resource_steps = self._get_resource_steps(splits, y_res)
+            self.n_resources_ = resource_steps
         self.scorer_ = check_scoring(self.estimator, scoring=self.scoring)
 
         if self.study is None:
             seed = random_state.randint(0, np.iinfo("int32").max)
             sampler = samplers.TPESampler(seed=seed)
+            pruner = None
+            if self.resource is not None:
+                pruner = pruners.SuccessiveHalvingPruner(
+                    min_resource=resource_steps[0], reduction_factor=self.reduction_factor
+                )
 
-            self.study_ = study_module.create_study(direction="maximize", sampler=sampler)
+            self.study_ = study_module.create_study(
+                direction="maximize", sampler=sampler, pruner=pruner
+            )
 
         else:
             self.study_ = self.study
 
+        memmap_folder = None
+        if self.memmap:
+            memmap_folder = tempfile.mkdtemp(prefix="optuna_search_cv_")
+            X_res = _memmap(X_res, memmap_folder, "X")
+            y_res = _memmap(y_res, memmap_folder, "y")
+            groups_res = _memmap(groups_res, memmap_folder, "groups")
+            fit_params_res = {
+                key: (
+                    _memmap(value, memmap_folder, "fit_param_{}".format(i))
+                    if isinstance(value, np.ndarray)
+                    else value
+                )
+                for i, (key, value) in enumerate(fit_params_res.items())
+            }
+            cv = check_cv(
+                [
+                    (
+                        _memmap(train, memmap_folder, "train{}".format(i)),
+                        _memmap(test, memmap_folder, "test{}".format(i)),
+                    )
+                    for i, (train, test) in enumerate(cv.split(X_res, y_res, groups=groups_res))
+                ]
+            )
+
+        executor = None
+        if self.trial_backend == "loky":
+            executor = get_memmapping_executor(joblib.effective_n_jobs(self.n_jobs))
+
+        manager = None
+        if self.enable_pruning and joblib.effective_n_jobs(self.cv_n_jobs) > 1:
+            # The manager is started once, and only creates a queue for each trial.
+            manager = multiprocessing.Manager()
+
         objective = _Objective(
             self.estimator,
             self.param_distributions,
             X_res,
             y_res,
+            self.batch_size,
             cv,
+            self.cv_n_jobs,
+            self.cv_results_attr,
             self.enable_pruning,
+            self.enable_fold_pruning,
             self.error_score,
+            executor,
             fit_params_res,
             groups_res,
+            manager,
             self.max_iter,
+            {} if self._memoize() else None,
+            None if self.pipeline_cache_size is None else _LRUCache(self.pipeline_cache_size),
+            self.resource,
+            resource_steps,
             self.return_train_score,
             self.scorer_,
+            None if self.warm_start_param is None else _LRUCache(self.warm_start_cache_size),
+            self.warm_start_param,
         )
 
         _logger.info(
@@ -957,14 +2113,21 @@ class OptunaSearchCV(BaseEstimator):
             "samples...".format(_num_samples(self.sample_indices_))
         )
 
-        self.study_.optimize(
-            objective,
-            n_jobs=self.n_jobs,
-            n_trials=self.n_trials,
-            timeout=self.timeout,
-            callbacks=self.callbacks,
-            catch=self.catch,
-        )
+        try:
+            self.study_.optimize(
+                objective,
+                n_jobs=self.n_jobs,
+                n_trials=self.n_trials,
+                timeout=self.timeout,
+                callbacks=self.callbacks,
+                catch=self.catch,
+            )
+        finally:
+            if manager is not None:
+                manager.shutdown()
+            if memmap_folder is not None:
+                del objective, X_res, y_res, groups_res, fit_params_res, cv
+                shutil.rmtree(memmap_folder, ignore_errors=True)
 
         _logger.info("Finished hyperparameter search!")
 
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime
+import os
+import pickle
+import shutil
 import time
+from typing import Any
 from typing import Iterator
 import warnings
 
 import numpy as np
 import optuna
+from optuna.distributions import BaseDistribution
+from optuna.distributions import CategoricalDistribution
+from optuna.distributions import FloatDistribution
+from optuna.distributions import IntDistribution
 from optuna.storages import InMemoryStorage
+from optuna.study import StudyDirection
 from optuna.testing.tempfile_pool import NamedTemporaryFilePool
+from optuna.trial import FrozenTrial
 from optuna.trial import Trial
+from optuna.trial import TrialState
 import pytest
 
 from optuna_integration._imports import try_import
 from optuna_integration.dask import DaskStorage
+from optuna_integration.dask import optimize
+from optuna_integration.dask.dask import _COMPRESSED_ATTR_KEY
+from optuna_integration.dask.dask import _deserialize_frozentrials
+from optuna_integration.dask.dask import _InMemoryStorageJournal
+from optuna_integration.dask.dask import _OMITTED_ATTR_KEY
 from optuna_integration.dask.dask import _OptunaSchedulerExtension
+from optuna_integration.dask.dask import _serialize_frozentrials
+from optuna_integration.dask.dask import _StudyTrialCache
 
 
 with try_import() as _imports:
@@ -59,6 +80,13 @@ def objective_slow(trial: Trial) -> float:
     return objective(trial)
 
 
+def objective_with_attrs(trial: Trial) -> float:
+    trial.set_user_attr("foo", "bar")
+    for step in range(3):
+        trial.report(float(step), step)
+    return objective(trial)
+
+
 @pytest.fixture
 def client() -> "Client":  # type: ignore[misc]
     with clean():
@@ -102,6 +130,97 @@ def test_study_optimize(client: "Client", storage_specifier: str) -> None:
         assert len(study.trials) == 10
 
 
+def objective_pruned_or_failed(trial: Trial) -> float:
+    if trial.number % 3 == 1:
+        raise optuna.TrialPruned()
+    if trial.number % 3 == 2:
+        raise ValueError("fail")
+    return objective(trial)
+
+
+@pytest.mark.parametrize("storage_specifier", STORAGE_MODES)
+@pytest.mark.parametrize("n_jobs", [None, 1, 3])
+def test_optimize(client: "Client", storage_specifier: str, n_jobs: int | None) -> None:
+    with get_storage_url(storage_specifier) as url, warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage(storage=url))
+        optimize(study, objective, n_trials=10, n_jobs=n_jobs, client=client)
+    assert len(study.trials) == 10
+    assert all(t.state == TrialState.COMPLETE for t in study.trials)
+    assert all("x" in t.params for t in study.trials)
+
+
+def test_optimize_pruned_and_caught_trials(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage())
+        optimize(study, objective_pruned_or_failed, n_trials=6, n_jobs=1, catch=ValueError)
+    states = [t.state for t in study.trials]
+    assert states == [TrialState.COMPLETE, TrialState.PRUNED, TrialState.FAIL] * 2
+
+
+def test_optimize_raises_uncaught_error(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage())
+        with pytest.raises(ValueError, match="fail"):
+            optimize(study, objective_pruned_or_failed, n_trials=6, n_jobs=2)
+    # Trials still running when the error is raised are failed.
+    assert len(study.trials) <= 4
+    assert all(t.state != TrialState.RUNNING for t in study.trials)
+
+
+def test_optimize_callbacks_and_stop(client: "Client") -> None:
+    numbers = []
+
+    def callback(study: optuna.Study, trial: FrozenTrial) -> None:
+        numbers.append(trial.number)
+        if len(numbers) == 3:
+            study.stop()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage())
+        optimize(study, objective, n_trials=10, n_jobs=1, callbacks=[callback])
+    assert numbers == [0, 1, 2]
+    assert len(study.trials) == 3
+
+
+def test_optimize_queued_trials_outlive_grace_period(client: "Client") -> None:
+    def slow_objective(trial: optuna.Trial) -> float:
+        time.sleep(2)
+        return objective(trial)
+
+    # Trials beyond the number of worker threads wait in the queue for longer than the grace
+    # period before they start.
+    n_jobs = sum(client.nthreads().values()) + 2  # type: ignore[no-untyped-call]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage(heartbeat_interval=1, grace_period=1))
+        optimize(study, slow_objective, n_trials=n_jobs, n_jobs=n_jobs)
+    assert [t.state for t in study.trials] == [TrialState.COMPLETE] * n_jobs
+
+
+def test_optimize_trials_finished_elsewhere(client: "Client") -> None:
+    def objective_finished_elsewhere(trial: optuna.Trial) -> float:
+        # Stands in for the scheduler failing the trial, e.g. because its heartbeat stopped.
+        trial.study._storage.set_trial_state_values(trial._trial_id, state=TrialState.FAIL)
+        return 1.0
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        study = optuna.create_study(storage=DaskStorage(heartbeat_interval=1, grace_period=1))
+        optimize(study, objective_finished_elsewhere, n_trials=3, n_jobs=3)
+    assert [t.state for t in study.trials] == [TrialState.FAIL] * 3
+
+
+def test_optimize_requires_dask_storage(client: "Client") -> None:
+    study = optuna.create_study()
+    with pytest.raises(ValueError, match="DaskStorage"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        optimize(study, objective, n_trials=1)
+
+
 @pytest.mark.parametrize("storage_specifier", STORAGE_MODES)
 def test_get_base_storage(client: "Client", storage_specifier: str) -> None:
     with get_storage_url(storage_specifier) as url:
@@ -112,6 +231,403 @@ def test_get_base_storage(client: "Client", storage_specifier: str) -> None:
         assert type(storage) is InMemoryStorage
 
 
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_get_base_storage_copies_studies_in_chunks(client: "Client", chunk_size: int) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        dask_storage = DaskStorage()
+    study = optuna.create_study(storage=dask_storage, study_name="foo")
+    study.set_user_attr("bar", 1)
+    study.optimize(objective_with_attrs, n_trials=10)
+    optuna.create_study(storage=dask_storage, directions=["minimize", "maximize"])
+
+    with get_storage_url("sqlite") as url:
+        storage = dask_storage.get_base_storage(url, chunk_size=chunk_size)
+        copied_study = optuna.load_study(study_name="foo", storage=storage)
+        assert copied_study.user_attrs == {"bar": 1}
+        assert len(storage.get_all_studies()) == 2
+        assert len(copied_study.trials) == 10
+        for trial, copied_trial in zip(study.trials, copied_study.trials):
+            assert copied_trial.number == trial.number
+            assert copied_trial.params == trial.params
+            assert copied_trial.distributions == trial.distributions
+            assert copied_trial.value == trial.value
+            assert copied_trial.intermediate_values == trial.intermediate_values
+            assert copied_trial.user_attrs == trial.user_attrs
+
+
+def test_get_base_storage_invalid_chunk_size(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        dask_storage = DaskStorage()
+    with pytest.raises(ValueError):
+        dask_storage.get_base_storage(chunk_size=0)
+
+
+def test_journal_restores_storage_after_restart(tmp_path: Any) -> None:
+    journal_path = str(tmp_path / "journal")
+    with clean(), warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        with Client(dashboard_address=":0") as client:  # type: ignore[no-untyped-call]
+            storage = DaskStorage(client=client, journal_path=journal_path)
+            study = optuna.create_study(storage=storage, study_name="foo")
+            study.set_user_attr("bar", 1)
+            study.optimize(objective_with_attrs, n_trials=5)
+            trials = study.trials
+        assert os.path.exists(f"{journal_path}.snapshot")
+
+        with Client(dashboard_address=":0") as client:  # type: ignore[no-untyped-call]
+            storage = DaskStorage(client=client, journal_path=journal_path)
+            study = optuna.load_study(storage=storage, study_name="foo")
+            assert study.user_attrs == {"bar": 1}
+            assert study.trials == trials
+            study.optimize(objective_with_attrs, n_trials=2)
+            assert len(study.trials) == 7
+
+
+def test_journal_replay(client: "Client", tmp_path: Any) -> None:
+    journal_path = str(tmp_path / "journal")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(journal_path=journal_path, snapshot_interval=3600)
+    study = optuna.create_study(storage=storage)
+    study.optimize(objective_with_attrs, n_trials=3)
+    study.enqueue_trial({"x": 1.0})
+    trial = study.ask()
+    study.tell(trial, state=TrialState.PRUNED)
+    other_study = optuna.create_study(storage=storage)
+    other_study.optimize(objective, n_trials=1)
+    storage.delete_study(other_study._study_id)
+    trials = study.trials
+
+    # The journal written by the scheduler is replayed on a copy.
+    path = str(tmp_path / "copy")
+    shutil.copy(journal_path, path)
+    with open(path, "ab") as f:
+        f.write(pickle.dumps((100, "set_trial_user_attr", {}))[:-3])
+    journal = _InMemoryStorageJournal(path)
+    restored = journal.restore()
+    assert restored.get_all_trials(study._study_id) == trials
+    assert len(restored.get_all_studies()) == 1
+
+    # Records that are already part of the snapshot are skipped.
+    shutil.copy(path, f"{path}.bak")
+    journal.snapshot(restored)
+    assert os.path.getsize(path) == 0
+    shutil.copy(f"{path}.bak", path)
+    journal.close(restored)
+    restored = _InMemoryStorageJournal(path).restore()
+    assert restored.get_all_trials(study._study_id) == trials
+
+
+def test_journal_requires_in_memory_storage() -> None:
+    with warnings.catch_warnings(), pytest.raises(ValueError):
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        DaskStorage("sqlite:///example.db", journal_path="journal", register=False)
+
+
+def test_batch_writes(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(batch_writes=True)
+    study = optuna.create_study(storage=storage)
+    futures = [
+        client.submit(  # type: ignore[no-untyped-call]
+            study.optimize, objective_with_attrs, n_trials=2, pure=False
+        )
+        for _ in range(3)
+    ]
+    wait(futures)  # type: ignore[no-untyped-call]
+
+    trials = study.trials
+    assert len(trials) == 6
+    for trial in trials:
+        assert trial.state == TrialState.COMPLETE
+        assert "x" in trial.params
+        assert trial.user_attrs == {"foo": "bar"}
+        assert trial.intermediate_values == {0: 0.0, 1: 1.0, 2: 2.0}
+
+
+def test_batch_writes_flushed_on_read(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(batch_writes=True)
+    study_id = storage.create_new_study(directions=[StudyDirection.MINIMIZE])
+    trial_id = storage.create_new_trial(study_id)
+
+    storage.set_trial_user_attr(trial_id, "foo", 1)
+    storage.set_trial_system_attr(trial_id, "bar", 2)
+    assert len(storage._pending_writes) == 2
+
+    trial = storage.get_trial(trial_id)
+    assert not storage._pending_writes
+    assert trial.user_attrs == {"foo": 1}
+    assert trial.system_attrs == {"bar": 2}
+
+    storage.set_trial_user_attr(trial_id, "baz", 3)
+    assert storage.set_trial_state_values(trial_id, TrialState.COMPLETE, [0.0])
+    assert not storage._pending_writes
+    assert storage.get_trial(trial_id).user_attrs == {"foo": 1, "baz": 3}
+
+
+def test_batch_writes_errors_stay_with_their_trial(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(batch_writes=True)
+    study_id = storage.create_new_study(directions=[StudyDirection.MINIMIZE])
+    finished_trial_id = storage.create_new_trial(study_id)
+    trial_id = storage.create_new_trial(study_id)
+    storage.set_trial_state_values(finished_trial_id, TrialState.FAIL)
+
+    storage.set_trial_user_attr(finished_trial_id, "a", 1)
+    storage.set_trial_user_attr(trial_id, "b", 2)
+    # The failing write neither drops the writes after it nor raises from unrelated calls.
+    assert storage.get_trial(trial_id).user_attrs == {"b": 2}
+    assert not storage._pending_writes
+
+    with pytest.raises(optuna.exceptions.UpdateFinishedTrialError):
+        storage.set_trial_user_attr(finished_trial_id, "c", 3)
+    assert storage.get_trial(finished_trial_id).user_attrs == {}
+    assert storage.set_trial_state_values(trial_id, TrialState.COMPLETE, [0.0])
+
+
+def test_batch_writes_concurrent_ask_and_tell(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(batch_writes=True)
+    study = optuna.create_study(storage=storage)
+    n_waiting = 20
+    for i in range(n_waiting):
+        study.enqueue_trial({"x": float(i)})
+
+    def ask_and_tell(_: int) -> None:
+        # Each claimed waiting trial depends on the result of its own state transition, which
+        # may be flushed together with the writes of the other threads.
+        trial = study.ask()
+        x = trial.suggest_float("x", 0.0, n_waiting)
+        trial.set_user_attr("x", x)
+        study.tell(trial, x)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(ask_and_tell, range(n_waiting)))
+
+    trials = study.trials
+    assert len(trials) == n_waiting
+    assert all(trial.state == TrialState.COMPLETE for trial in trials)
+    assert sorted(trial.params["x"] for trial in trials) == [float(i) for i in range(n_waiting)]
+    assert all(trial.user_attrs == {"x": trial.params["x"]} for trial in trials)
+    assert not storage._pending_writes
+
+
+def _get_scheduler_trial(dask_scheduler: "Scheduler", name: str, trial_id: int) -> FrozenTrial:
+    return dask_scheduler.extensions["optuna"].get_storage(name).get_trial(trial_id)
+
+
+@pytest.mark.parametrize("storage_specifier", STORAGE_MODES)
+def test_attr_compression(client: "Client", storage_specifier: str) -> None:
+    large = list(range(1000))
+    with get_storage_url(storage_specifier) as url, warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(storage=url, attr_compression_threshold=100)
+        study = optuna.create_study(storage=storage)
+        study.set_user_attr("large", large)
+        trial = study.ask()
+        trial.set_user_attr("large", large)
+        trial.set_user_attr("small", 1)
+        trial.storage.set_trial_system_attr(trial._trial_id, "large", large)
+        study.tell(trial, 1.0)
+
+        scheduler_trial = client.run_on_scheduler(  # type: ignore[no-untyped-call]
+            _get_scheduler_trial, name=storage.name, trial_id=trial._trial_id
+        )
+        assert set(scheduler_trial.user_attrs["large"]) == {_COMPRESSED_ATTR_KEY}
+        assert scheduler_trial.user_attrs["small"] == 1
+
+        assert study.user_attrs == {"large": large}
+        assert study.trials[0].user_attrs == {"large": large, "small": 1}
+        assert study.trials[0].system_attrs == {"large": large}
+        assert storage.get_trial(trial._trial_id).user_attrs["large"] == large
+        base_storage = storage.get_base_storage()
+        base_study_id = base_storage.get_study_id_from_name(study.study_name)
+        assert base_storage.get_all_trials(base_study_id)[0].user_attrs["large"] == large
+
+
+def test_lazy_large_attrs(client: "Client") -> None:
+    large = list(range(1000))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(attr_compression_threshold=100, lazy_large_attrs=True)
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    trial.set_user_attr("large", large)
+    trial.set_user_attr("small", 1)
+    study.tell(trial, 1.0)
+
+    user_attrs = study.trials[0].user_attrs
+    assert dict.__getitem__(user_attrs, "large") == {_OMITTED_ATTR_KEY: None}
+    assert dict.__getitem__(user_attrs, "small") == 1
+    assert user_attrs["large"] == large
+    assert dict.__getitem__(user_attrs, "large") == large
+
+    user_attrs = study.trials[0].user_attrs
+    assert dict(user_attrs) == {"large": large, "small": 1}
+    assert pickle.loads(pickle.dumps(user_attrs)) == {"large": large, "small": 1}
+    assert study.trials == storage.get_all_trials(study._study_id)
+    assert study.trials[0] == storage.get_trial(trial._trial_id)
+
+
+def test_attr_compression_threshold_must_be_non_negative(client: "Client") -> None:
+    with pytest.raises(ValueError, match="attr_compression_threshold"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        DaskStorage(attr_compression_threshold=-1)
+
+
+def test_metadata_cache(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage()
+    study_id = storage.create_new_study(directions=[StudyDirection.MAXIMIZE], study_name="foo")
+    trial_id = storage.create_new_trial(study_id)
+
+    for _ in range(3):
+        assert storage.get_study_directions(study_id) == [StudyDirection.MAXIMIZE]
+        assert storage.get_study_id_from_name("foo") == study_id
+        assert storage.get_study_name_from_id(study_id) == "foo"
+        assert storage.get_trial_number_from_id(trial_id) == 0
+        assert storage.get_trial_id_from_study_id_trial_number(study_id, 0) == trial_id
+    assert storage.metadata_cache_info() == {"hits": 10, "misses": 5, "size": 5}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        unpickled = pickle.loads(pickle.dumps(storage))
+    assert unpickled.get_study_id_from_name("foo") == study_id
+    assert unpickled.metadata_cache_info() == {"hits": 1, "misses": 0, "size": 5}
+
+    storage.delete_study(study_id)
+    assert storage.metadata_cache_info()["size"] == 0
+    with pytest.raises(KeyError):
+        storage.get_study_id_from_name("foo")
+
+
+def test_heartbeat_ask_and_tell_outlives_grace_period(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage(heartbeat_interval=1, grace_period=1)
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    trial.suggest_float("x", 0, 1)
+    time.sleep(3)
+
+    study.tell(trial, 1.0)
+    assert study.trials[0].state == TrialState.COMPLETE
+
+
+def test_serialize_frozentrials_roundtrip() -> None:
+    float_distribution = FloatDistribution(-1.0, 1.0)
+    categorical_distribution = CategoricalDistribution(["a", None, 1.5])
+    trials = [
+        FrozenTrial(
+            number=0,
+            state=TrialState.COMPLETE,
+            value=None,
+            values=[0.5, -float("inf")],
+            datetime_start=datetime(2023, 1, 2, 3, 4, 5, 678901),
+            datetime_complete=datetime(2023, 1, 2, 3, 4, 6, 1),
+            params={"x": 0.25, "c": None},
+            distributions={"x": float_distribution, "c": categorical_distribution},
+            user_attrs={"list": [1, 2], "s": "v"},
+            system_attrs={"s": "v"},
+            intermediate_values={0: 1.0, 3: float("nan")},
+            trial_id=10,
+        ),
+        FrozenTrial(
+            number=1,
+            state=TrialState.RUNNING,
+            value=None,
+            datetime_start=datetime(2023, 1, 2, 3, 4, 5),
+            datetime_complete=None,
+            params={"c": 1.5, "i": 3},
+            distributions={"c": categorical_distribution, "i": IntDistribution(0, 5)},
+            user_attrs={},
+            system_attrs={"s": 1},
+            intermediate_values={},
+            trial_id=11,
+        ),
+        FrozenTrial(
+            number=2,
+            state=TrialState.WAITING,
+            value=None,
+            datetime_start=None,
+            datetime_complete=None,
+            params={},
+            distributions={},
+            user_attrs={},
+            system_attrs={},
+            intermediate_values={},
+            trial_id=12,
+        ),
+    ]
+
+    distribution_ids: dict[BaseDistribution, int] = {}
+    serialized = _serialize_frozentrials(trials, distribution_ids)
+    assert list(distribution_ids.values()) == [0, 1, 2]
+
+    deserialized = _deserialize_frozentrials(serialized, list(distribution_ids))
+    assert len(deserialized) == len(trials)
+    for actual, expected in zip(deserialized, trials):
+        # NaN never compares equal, so intermediate values are checked separately.
+        np.testing.assert_equal(actual.intermediate_values, expected.intermediate_values)
+        actual.intermediate_values = {}
+        expected.intermediate_values = {}
+        assert actual == expected
+
+
+def test_trial_cache_skips_older_snapshots() -> None:
+    def make_trial(state: TrialState, params: dict[str, float]) -> FrozenTrial:
+        trial = optuna.trial.create_trial(
+            state=state,
+            params=params,
+            distributions={name: FloatDistribution(0, 1) for name in params},
+            value=0.0 if state == TrialState.COMPLETE else None,
+        )
+        trial.number = 0
+        return trial
+
+    cache = _StudyTrialCache()
+    cache.epoch = "epoch"
+    cache.merge("epoch", make_trial(TrialState.RUNNING, {"x": 0.5}))
+    # A late creation event does not replace the trial that already has parameters.
+    cache.merge("epoch", make_trial(TrialState.RUNNING, {}))
+    assert cache.get_all_trials()[0].params == {"x": 0.5}
+
+    cache.merge("epoch", make_trial(TrialState.COMPLETE, {"x": 0.5}))
+    cache.merge("epoch", make_trial(TrialState.RUNNING, {"x": 0.5}))
+    assert cache.get_all_trials()[0].state == TrialState.COMPLETE
+
+
+def test_subscribe_trial_updates(client: "Client") -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+        storage = DaskStorage()
+    study = optuna.create_study(storage=storage)
+    received: list[FrozenTrial] = []
+    storage.subscribe_trial_updates(study._study_id, received.append)
+
+    f = client.submit(study.optimize, objective, n_trials=3)  # type: ignore[no-untyped-call]
+    wait(f)  # type: ignore[no-untyped-call]
+    deadline = time.time() + 10
+    while len(received) < 6 and time.time() < deadline:
+        time.sleep(0.01)
+    assert [t.state for t in received].count(TrialState.RUNNING) == 3
+    assert [t.state for t in received].count(TrialState.COMPLETE) == 3
+    assert sorted(t.number for t in received if t.state == TrialState.COMPLETE) == [0, 1, 2]
+
+    storage.unsubscribe_trial_updates(study._study_id)
+    study.optimize(objective, n_trials=1)
+    time.sleep(0.1)
+    assert len(received) == 6
+
+
 @pytest.mark.parametrize("direction", ["maximize", "minimize"])
 def test_study_direction_best_value(client: "Client", direction: str) -> None:
     # Regression test for https://github.com/jrbourbeau/dask-optuna/issues/15
@@ -161,3 +677,256 @@ if _imports.is_successful():
             await DaskStorage(name="bar")
         assert len(ext.storages) == 2
         assert type(ext.storages["bar"]) is optuna.storages.InMemoryStorage
+
+    @gen_cluster(client=True)
+    async def test_get_all_trials_delta_sync(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage()
+        ext = s.extensions["optuna"]
+        study_id = await storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        trial_ids = [await storage.acreate_new_trial(study_id) for _ in range(3)]
+
+        trials = await storage.aget_all_trials(study_id)
+        assert [t._trial_id for t in trials] == trial_ids
+
+        cache = storage._trial_caches[study_id]
+        delta = await ext.get_trials_since(
+            None,
+            storage_name=storage.name,
+            study_id=study_id,
+            epoch=cache.epoch,
+            watermark=cache.watermark,
+        )
+        assert _deserialize_frozentrials(delta["trials"], cache.distributions) == []
+
+        await storage.aset_trial_state_values(trial_ids[1], TrialState.COMPLETE, [1.0])
+        delta = await ext.get_trials_since(
+            None,
+            storage_name=storage.name,
+            study_id=study_id,
+            epoch=cache.epoch,
+            watermark=cache.watermark,
+        )
+        changed = _deserialize_frozentrials(delta["trials"], cache.distributions)
+        assert [t.number for t in changed] == [1]
+
+        trials = await storage.aget_all_trials(study_id, states=(TrialState.COMPLETE,))
+        assert [t.number for t in trials] == [1]
+        assert trials[0].value == 1.0
+
+    @gen_cluster(client=True)
+    async def test_get_all_trials_after_delete_study(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage()
+        study_id = await storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        await storage.acreate_new_trial(study_id)
+        assert len(await storage.aget_all_trials(study_id)) == 1
+
+        # A second client deletes the study behind the first client's back.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            other = DaskStorage(name=storage.name, client=c, register=False)
+        await other.adelete_study(study_id)
+        new_study_id = await other.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        assert len(await storage.aget_all_trials(new_study_id)) == 0
+
+    @gen_cluster(client=True)
+    async def test_backend_calls_offloaded_from_event_loop(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            in_memory_storage = await DaskStorage()
+        ext = s.extensions["optuna"]
+        await in_memory_storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        assert ext._executor is None
+
+        with get_storage_url("sqlite") as url:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+                storage = await DaskStorage(storage=url)
+            study_id = await storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+            assert ext._executor is not None
+
+            trial_ids = await asyncio.gather(
+                *[storage.create_new_trial(study_id) for _ in range(10)]
+            )
+            assert len(set(trial_ids)) == 10
+            trials = await storage.get_all_trials(study_id)
+            assert [t.number for t in trials] == list(range(10))
+
+    @gen_cluster(client=True)
+    async def test_get_n_trials_uses_state_counters(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with get_storage_url("sqlite") as url:
+            # Trials created before the scheduler extension is involved are counted too.
+            study = optuna.create_study(storage=url)
+            study.optimize(objective, n_trials=2)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+                storage = await DaskStorage(storage=url)
+            ext = s.extensions["optuna"]
+            study_id = study._study_id
+            assert await storage.aget_n_trials(study_id) == 2
+
+            def _fail(*args: Any, **kwargs: Any) -> None:
+                raise AssertionError("get_n_trials must not reach the backend.")
+
+            ext.storages[storage.name].get_n_trials = _fail
+
+            trial_ids = [await storage.acreate_new_trial(study_id) for _ in range(3)]
+            await storage.aset_trial_state_values(trial_ids[0], TrialState.COMPLETE, [0.0])
+            await storage.aset_trial_state_values(trial_ids[1], TrialState.PRUNED)
+            assert await storage.aget_n_trials(study_id) == 5
+            assert await storage.aget_n_trials(study_id, TrialState.COMPLETE) == 3
+            assert await storage.aget_n_trials(study_id, TrialState.RUNNING) == 1
+            assert (
+                await storage.aget_n_trials(study_id, (TrialState.PRUNED, TrialState.RUNNING)) == 2
+            )
+
+    @gen_cluster(client=True)
+    async def test_get_best_trial_and_pareto_front(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage()
+
+        study_id = await storage.acreate_new_study(directions=[StudyDirection.MAXIMIZE])
+        with pytest.raises(ValueError):
+            await storage.aget_best_trial(study_id)
+        assert await storage.aget_pareto_front_trials(study_id) == []
+        for state, value in [
+            (TrialState.COMPLETE, 1.0),
+            (TrialState.COMPLETE, 3.0),
+            (TrialState.PRUNED, 5.0),
+            (TrialState.COMPLETE, 3.0),
+            (TrialState.COMPLETE, 2.0),
+        ]:
+            trial_id = await storage.acreate_new_trial(study_id)
+            await storage.aset_trial_state_values(trial_id, state, [value])
+        assert (await storage.aget_best_trial(study_id)).number == 1
+        assert [t.number for t in await storage.aget_pareto_front_trials(study_id)] == [1, 3]
+
+        study_id = await storage.acreate_new_study(
+            directions=[StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE]
+        )
+        for values in [[1.0, 1.0], [0.0, 0.0], [2.0, 2.0], [1.0, 2.0], [0.0, 0.0]]:
+            trial_id = await storage.acreate_new_trial(study_id)
+            await storage.aset_trial_state_values(trial_id, TrialState.COMPLETE, values)
+        # A template trial is recorded as soon as it is created.
+        await storage.acreate_new_trial(
+            study_id,
+            template_trial=optuna.trial.create_trial(
+                state=TrialState.COMPLETE, values=[-1.0, -1.0]
+            ),
+        )
+        with pytest.raises(RuntimeError):
+            await storage.aget_best_trial(study_id)
+        pareto_front = await storage.aget_pareto_front_trials(study_id)
+        assert [t.number for t in pareto_front] == [1, 3, 4, 5]
+        assert pareto_front[1].values == [1.0, 2.0]
+
+    @gen_cluster(client=True)
+    async def test_async_api_concurrent_calls(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage()
+        study_id = await storage.acreate_new_study(
+            directions=[StudyDirection.MINIMIZE], study_name="foo"
+        )
+        trial_ids = await asyncio.gather(*(storage.acreate_new_trial(study_id) for _ in range(20)))
+        distribution = FloatDistribution(0.0, 1.0)
+        await asyncio.gather(
+            *(storage.aset_trial_param(t, "x", 0.5, distribution) for t in trial_ids),
+            *(storage.aset_trial_user_attr(t, "foo", t) for t in trial_ids),
+        )
+        results = await asyncio.gather(
+            *(storage.aset_trial_state_values(t, TrialState.COMPLETE, [t]) for t in trial_ids),
+            *(storage.aget_all_trials(study_id) for _ in range(5)),
+        )
+        assert results[: len(trial_ids)] == [True] * len(trial_ids)
+
+        trial_lists = await asyncio.gather(*(storage.aget_all_trials(study_id) for _ in range(5)))
+        for trials in trial_lists:
+            assert [t._trial_id for t in trials] == sorted(trial_ids)
+            for trial in trials:
+                assert trial.state == TrialState.COMPLETE
+                assert trial.params == {"x": 0.5}
+                assert trial.user_attrs == {"foo": trial._trial_id}
+        assert await storage.aget_n_trials(study_id, TrialState.COMPLETE) == len(trial_ids)
+        assert (await storage.aget_best_trial(study_id))._trial_id == min(trial_ids)
+
+        # The metadata cache also serves asynchronous clients.
+        assert await storage.aget_study_id_from_name("foo") == study_id
+        assert await storage.aget_study_directions(study_id) == [StudyDirection.MINIMIZE]
+        assert await storage.aget_study_directions(study_id) == [StudyDirection.MINIMIZE]
+        assert storage.metadata_cache_info()["hits"] == 1
+
+    @gen_cluster(client=True)
+    async def test_heartbeat_fails_stale_trials(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage(heartbeat_interval=1, grace_period=1)
+        assert storage.get_heartbeat_interval() == 1
+        study_id = await storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        stale_trial_id = await storage.acreate_new_trial(study_id)
+        alive_trial_id = await storage.acreate_new_trial(study_id)
+        finished_trial_id = await storage.acreate_new_trial(study_id)
+        # A trial without a heartbeat, e.g. one run with ask-and-tell, is never failed.
+        untracked_trial_id = await storage.acreate_new_trial(study_id)
+        for trial_id in [stale_trial_id, alive_trial_id, finished_trial_id]:
+            await storage.arecord_heartbeat(trial_id)
+        await storage.aset_trial_state_values(finished_trial_id, TrialState.COMPLETE, [0.0])
+
+        for step in range(10):
+            await storage.aset_trial_intermediate_value(alive_trial_id, step, 0.0)
+            await asyncio.sleep(0.3)
+
+        assert (await storage.aget_trial(stale_trial_id)).state == TrialState.FAIL
+        assert (await storage.aget_trial(alive_trial_id)).state == TrialState.RUNNING
+        assert (await storage.aget_trial(finished_trial_id)).state == TrialState.COMPLETE
+        assert (await storage.aget_trial(untracked_trial_id)).state == TrialState.RUNNING
+        assert await storage._aget_stale_trial_ids(study_id) == []
+
+    @gen_cluster(client=True)
+    async def test_record_heartbeat_piggybacks_on_writes(
+        c: "Client", s: "Scheduler", a: "Worker", b: "Worker"
+    ) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            storage = await DaskStorage(heartbeat_interval=60)
+        study_id = await storage.acreate_new_study(directions=[StudyDirection.MINIMIZE])
+        trial_id = await storage.acreate_new_trial(study_id)
+
+        ext = s.extensions["optuna"]
+        calls = []
+
+        async def record_heartbeat(comm: Any, storage_name: str, trial_id: int) -> None:
+            calls.append(trial_id)
+            await ext.record_heartbeat(comm, storage_name=storage_name, trial_id=trial_id)
+
+        s.handlers["optuna_record_heartbeat"] = record_heartbeat
+
+        # The first heartbeat is always sent, so that the scheduler starts watching the trial.
+        await asyncio.get_running_loop().run_in_executor(None, storage.record_heartbeat, trial_id)
+        assert calls == [trial_id]
+        # Later writes then count as heartbeats.
+        await storage.aset_trial_intermediate_value(trial_id, 0, 0.0)
+        await asyncio.get_running_loop().run_in_executor(None, storage.record_heartbeat, trial_id)
+        assert calls == [trial_id]
+        storage._trial_write_times[trial_id] -= 60
+        await asyncio.get_running_loop().run_in_executor(None, storage.record_heartbeat, trial_id)
+        assert calls == [trial_id, trial_id]
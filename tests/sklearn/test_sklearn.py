@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import multiprocessing
+from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
 import warnings
 
+import joblib
 import numpy as np
 from optuna import distributions
 from optuna.exceptions import ExperimentalWarning
+from optuna.pruners import NopPruner
+from optuna.pruners import SuccessiveHalvingPruner
+from optuna.pruners import ThresholdPruner
 from optuna.samplers import BruteForceSampler
 from optuna.study import create_study
 from optuna.terminator.erroreval import _CROSS_VALIDATION_SCORES_KEY
+from optuna.trial import Trial
+from optuna.trial import TrialState
 import pytest
 import scipy as sp
 
@@ -17,17 +25,21 @@ from optuna_integration import OptunaSearchCV
 from optuna_integration.sklearn.sklearn import _is_arraylike
 from optuna_integration.sklearn.sklearn import _make_indexable
 from optuna_integration.sklearn.sklearn import _num_samples
+from optuna_integration.sklearn.sklearn import _partial_fit_and_score_steps
 from sklearn.datasets import make_blobs
 from sklearn.datasets import make_regression
 from sklearn.decomposition import PCA
+from sklearn.ensemble import RandomForestClassifier
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.exceptions import NotFittedError
 from sklearn.linear_model import LogisticRegression
 from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import make_scorer
 from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold
 from sklearn.model_selection import PredefinedSplit
 from sklearn.neighbors import KernelDensity
+from sklearn.pipeline import Pipeline
 from sklearn.tree import DecisionTreeRegressor
 
 
@@ -89,6 +101,538 @@ def test_optuna_search(enable_pruning: bool, fit_params: str) -> None:
     optuna_search.score(X, y)
 
 
+@pytest.mark.parametrize("enable_pruning", [True, False])
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_cv_n_jobs(enable_pruning: bool) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = SGDClassifier(max_iter=5, tol=1e-03, random_state=0)
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+    results = []
+    for cv_n_jobs in [None, 2]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExperimentalWarning)
+            optuna_search = OptunaSearchCV(
+                est,
+                param_dist,
+                cv=3,
+                cv_n_jobs=cv_n_jobs,
+                enable_pruning=enable_pruning,
+                error_score="raise",
+                max_iter=3,
+                n_trials=3,
+                random_state=0,
+            )
+        optuna_search.fit(X, y)
+        results.append(optuna_search.cv_results_)
+
+    assert results[0]["mean_test_score"] == results[1]["mean_test_score"]
+    assert results[0]["split2_test_score"] == results[1]["split2_test_score"]
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_cv_n_jobs_follows_joblib_backend() -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = SGDClassifier(max_iter=5, tol=1e-03, random_state=0)
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            cv=3,
+            cv_n_jobs=2,
+            enable_pruning=True,
+            error_score="raise",
+            max_iter=3,
+            n_trials=3,
+            random_state=0,
+        )
+
+    # The mock cannot be sent to other processes, so the folds are fitted in threads.
+    with (
+        joblib.parallel_backend("threading"),
+        patch(
+            "optuna_integration.sklearn.sklearn.multiprocessing.Manager",
+            wraps=multiprocessing.Manager,
+        ) as manager,
+        patch(
+            "optuna_integration.sklearn.sklearn._partial_fit_and_score_steps",
+            wraps=_partial_fit_and_score_steps,
+        ) as fit_steps,
+    ):
+        optuna_search.fit(X, y)
+
+    manager.assert_called_once()
+    assert fit_steps.call_count == 9
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_cv_n_jobs_raises_error_of_fold() -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = SGDClassifier(max_iter=5, tol=1e-03)
+    param_dist = {"alpha": distributions.FloatDistribution(-2.0, -1.0)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            cv=3,
+            cv_n_jobs=2,
+            enable_pruning=True,
+            error_score="raise",
+            max_iter=3,
+            n_trials=1,
+        )
+
+    with pytest.raises(ValueError):
+        optuna_search.fit(X, y)
+
+
+@pytest.mark.parametrize("enable_pruning", [True, False])
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_splits_once(enable_pruning: bool) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = SGDClassifier(max_iter=5, tol=1e-03)
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+    cv = KFold(n_splits=3, shuffle=True, random_state=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            cv=cv,
+            enable_pruning=enable_pruning,
+            max_iter=3,
+            n_trials=3,
+            random_state=0,
+        )
+
+    with patch.object(KFold, "split", side_effect=cv.split) as split:
+        optuna_search.fit(X, y)
+
+    assert split.call_count == 1
+    assert optuna_search.n_splits_ == 3
+    assert len(optuna_search.trials_) == 3
+
+
+@pytest.mark.parametrize("trial_backend", ["threading", "loky"])
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_memmap(trial_backend: str) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    sample_weight = np.ones(30)
+    est = SGDClassifier(max_iter=5, tol=1e-03, random_state=0)
+    param_dist = {"alpha": distributions.CategoricalDistribution([1e-04, 1e-02, 1, 1e02])}
+    results = []
+    for memmap in [False, True]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExperimentalWarning)
+            optuna_search = OptunaSearchCV(
+                est,
+                param_dist,
+                cv=3,
+                memmap=memmap,
+                n_jobs=2,
+                n_trials=4,
+                random_state=0,
+                study=create_study(direction="maximize", sampler=BruteForceSampler()),
+                trial_backend=trial_backend,
+            )
+        with patch("optuna_integration.sklearn.sklearn.shutil.rmtree") as rmtree:
+            optuna_search.fit(X, y, sample_weight=sample_weight)
+        assert rmtree.call_count == int(memmap)
+        results.append({t.params["alpha"]: t.value for t in optuna_search.trials_})
+
+    # Concurrent trials may sample the same parameters, so only common ones are compared.
+    common = results[0].keys() & results[1].keys()
+    assert common
+    assert all(results[0][alpha] == results[1][alpha] for alpha in common)
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_resource_n_samples() -> None:
+    X, y = make_blobs(n_samples=90, random_state=0)
+    est = LogisticRegression(max_iter=10)
+    param_dist = {"C": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est, param_dist, cv=3, n_trials=10, random_state=0, resource="n_samples"
+        )
+    optuna_search.fit(X, y)
+
+    assert isinstance(optuna_search.study_.pruner, SuccessiveHalvingPruner)
+    # min_resources defaults to 2 * n_splits * n_classes, and max_resources to 60 samples.
+    for trial in optuna_search.trials_:
+        assert set(trial.intermediate_values) <= {18, 54, 60}
+        if trial.state == TrialState.COMPLETE:
+            assert trial.last_step == 60
+    assert any(trial.state == TrialState.PRUNED for trial in optuna_search.trials_)
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_resource_estimator_param() -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = RandomForestClassifier(n_estimators=9, random_state=0)
+    param_dist = {"max_depth": distributions.IntDistribution(1, 4)}
+    study = create_study(direction="maximize", pruner=SuccessiveHalvingPruner())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            cv=3,
+            n_trials=5,
+            random_state=0,
+            resource="n_estimators",
+            study=study,
+        )
+    optuna_search.fit(X, y)
+
+    assert optuna_search.study_ is study
+    for trial in optuna_search.trials_:
+        assert set(trial.intermediate_values) <= {1, 3, 9}
+        assert "n_estimators" not in trial.params
+    assert optuna_search.best_estimator_.n_estimators == 9
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_resource_refit_with_max_resources() -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    est = RandomForestClassifier(random_state=0)
+    param_dist = {"max_depth": distributions.IntDistribution(1, 4)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            cv=3,
+            max_resources=18,
+            min_resources=2,
+            n_trials=5,
+            random_state=0,
+            resource="n_estimators",
+        )
+    optuna_search.fit(X, y)
+
+    assert optuna_search.n_resources_ == [2, 6, 18]
+    assert optuna_search.best_estimator_.get_params()["n_estimators"] == 18
+    assert len(optuna_search.best_estimator_.estimators_) == 18
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_optuna_search_fold_pruning() -> None:
+    X, y = make_regression(n_samples=30, random_state=0)
+    est = DecisionTreeRegressor(random_state=0)
+    param_dist = {"max_depth": distributions.IntDistribution(1, 3)}
+
+    study = create_study(direction="maximize", pruner=NopPruner())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est, param_dist, cv=3, enable_fold_pruning=True, n_trials=3, study=study
+        )
+    optuna_search.fit(X, y)
+    for trial in optuna_search.trials_:
+        assert trial.state == TrialState.COMPLETE
+        assert list(trial.intermediate_values) == [0, 1, 2]
+        assert trial.intermediate_values[2] == pytest.approx(trial.value)
+
+    # Every trial scores below the threshold on the first fold.
+    study = create_study(direction="maximize", pruner=ThresholdPruner(lower=1.0))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est, param_dist, cv=3, enable_fold_pruning=True, n_trials=3, refit=False, study=study
+        )
+    optuna_search.fit(X, y)
+    for trial in optuna_search.study_.trials:
+        assert trial.state == TrialState.PRUNED
+        assert list(trial.intermediate_values) == [0]
+        assert "split0_test_score" in trial.user_attrs
+        assert "split1_test_score" not in trial.user_attrs
+
+
+def test_optuna_search_pipeline_cache() -> None:
+    X, y = make_blobs(n_samples=60, n_features=4, random_state=0)
+    est = Pipeline([("pca", PCA()), ("clf", LogisticRegression())])
+    param_dist = {
+        "pca__n_components": distributions.CategoricalDistribution([2, 3]),
+        "clf__C": distributions.FloatDistribution(1e-2, 1e2, log=True),
+    }
+
+    def run(pipeline_cache_size: int | None, cv_n_jobs: int | None = None) -> OptunaSearchCV:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExperimentalWarning)
+            optuna_search = OptunaSearchCV(
+                est,
+                param_dist,
+                cv=3,
+                cv_n_jobs=cv_n_jobs,
+                n_trials=8,
+                pipeline_cache_size=pipeline_cache_size,
+                random_state=0,
+                refit=False,
+                return_train_score=True,
+            )
+        optuna_search.fit(X, y)
+        return optuna_search
+
+    with patch.object(PCA, "fit_transform", autospec=True, side_effect=PCA.fit_transform) as m:
+        cached = run(6)
+    # Each fold is transformed once per value of ``pca__n_components``.
+    assert 0 < m.call_count <= 2 * 3
+
+    uncached = run(None)
+    parallel = run(6, cv_n_jobs=2)
+    for cached_trial, trial, parallel_trial in zip(
+        cached.trials_, uncached.trials_, parallel.trials_
+    ):
+        assert cached_trial.params == trial.params == parallel_trial.params
+        assert cached_trial.value == pytest.approx(trial.value)
+        assert parallel_trial.value == pytest.approx(trial.value)
+        for key in ["split0_test_score", "split0_train_score", "mean_train_score"]:
+            assert cached_trial.user_attrs[key] == pytest.approx(trial.user_attrs[key])
+            assert parallel_trial.user_attrs[key] == pytest.approx(trial.user_attrs[key])
+
+
+def test_optuna_search_warm_start() -> None:
+    X, y = make_blobs(n_samples=60, random_state=0)
+    est = RandomForestClassifier(random_state=0)
+    param_dist = {"n_estimators": distributions.CategoricalDistribution([5, 10, 20])}
+
+    def run(warm_start_param: str | None, cv_n_jobs: int | None = None) -> OptunaSearchCV:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExperimentalWarning)
+            optuna_search = OptunaSearchCV(
+                est,
+                param_dist,
+                cv=3,
+                cv_n_jobs=cv_n_jobs,
+                n_trials=3,
+                refit=False,
+                return_train_score=True,
+                study=create_study(direction="maximize", sampler=BruteForceSampler(seed=0)),
+                warm_start_param=warm_start_param,
+            )
+        optuna_search.fit(X, y)
+        return optuna_search
+
+    with patch.object(
+        RandomForestClassifier,
+        "_make_estimator",
+        autospec=True,
+        side_effect=RandomForestClassifier._make_estimator,
+    ) as m:
+        warm = run("n_estimators")
+    # Trees of smaller forests are reused instead of fitting all 35 trees on each fold.
+    assert m.call_count < 35 * 3
+
+    cold = run(None)
+    parallel = run("n_estimators", cv_n_jobs=2)
+    for warm_trial, trial, parallel_trial in zip(warm.trials_, cold.trials_, parallel.trials_):
+        assert warm_trial.params == trial.params == parallel_trial.params
+        assert warm_trial.value == pytest.approx(trial.value)
+        assert parallel_trial.value == pytest.approx(trial.value)
+        assert warm_trial.user_attrs["split0_train_score"] == pytest.approx(
+            trial.user_attrs["split0_train_score"]
+        )
+
+
+@pytest.mark.parametrize(
+    "random_state,memoize,n_fits",
+    [(0, None, 2 * 3), (0, False, 6 * 3), (None, None, 6 * 3), (None, True, 2 * 3)],
+)
+def test_optuna_search_memoize(
+    random_state: int | None, memoize: bool | None, n_fits: int
+) -> None:
+    X, y = make_regression(n_samples=30, random_state=0)
+    est = DecisionTreeRegressor(random_state=random_state)
+    param_dist = {"max_depth": distributions.CategoricalDistribution([1, 2])}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est, param_dist, cv=3, memoize=memoize, n_trials=6, random_state=0, refit=False
+        )
+    with patch.object(
+        DecisionTreeRegressor, "fit", autospec=True, side_effect=DecisionTreeRegressor.fit
+    ) as m:
+        optuna_search.fit(X, y)
+    assert m.call_count == n_fits
+
+    # Memoized trials copy the fit times along with the scores.
+    if n_fits == 2 * 3:
+        for trial in optuna_search.trials_:
+            for other in optuna_search.trials_:
+                if trial.params == other.params:
+                    assert trial.user_attrs == other.user_attrs
+
+
+def test_optuna_search_cv_results_attr() -> None:
+    X, y = make_regression(n_samples=30, random_state=0)
+    est = DecisionTreeRegressor(random_state=0)
+    param_dist = {"max_depth": distributions.IntDistribution(1, 3)}
+
+    def run(cv_results_attr: str | None) -> OptunaSearchCV:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExperimentalWarning)
+            optuna_search = OptunaSearchCV(
+                est,
+                param_dist,
+                cv=3,
+                cv_results_attr=cv_results_attr,
+                n_trials=3,
+                random_state=0,
+                return_train_score=True,
+            )
+        optuna_search.fit(X, y)
+        return optuna_search
+
+    with patch.object(Trial, "set_user_attr", autospec=True, side_effect=Trial.set_user_attr) as m:
+        optuna_search = run("cv_results")
+    assert m.call_count == 3
+    for trial in optuna_search.trials_:
+        assert list(trial.user_attrs) == ["cv_results"]
+        assert trial.value == trial.user_attrs["cv_results"]["mean_test_score"]
+
+    cv_results = optuna_search.cv_results_
+    expected = run(None).cv_results_
+    assert list(cv_results) == list(expected)
+    for key in cv_results:
+        if not key.endswith("_time"):
+            assert cv_results[key] == pytest.approx(expected[key])
+
+
+def test_optuna_search_batch_size(tmp_path: Path) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    np.save(tmp_path / "X.npy", X)
+    X = np.load(tmp_path / "X.npy", mmap_mode="r")
+    est = SGDClassifier(max_iter=5, tol=1e-03)
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            batch_size=8,
+            cv=3,
+            enable_pruning=True,
+            max_iter=5,
+            n_trials=2,
+            return_train_score=True,
+            study=create_study(direction="maximize", pruner=NopPruner()),
+        )
+    with patch.object(
+        SGDClassifier, "partial_fit", autospec=True, side_effect=SGDClassifier.partial_fit
+    ) as m:
+        optuna_search.fit(X, y)
+
+    # 2 trials x 5 epochs x 3 folds x 3 batches of 20 samples, then 5 epochs x 4 batches of 30.
+    assert m.call_count == 2 * 5 * 3 * 3 + 5 * 4
+    assert all(len(call.args[1]) <= 8 for call in m.call_args_list)
+    for trial in optuna_search.trials_:
+        assert list(trial.intermediate_values) == list(range(5))
+        assert 0.0 <= trial.user_attrs["mean_train_score"] <= 1.0
+    optuna_search.predict(X)
+
+
+@pytest.mark.parametrize("batch_size", [None, 8])
+def test_optuna_search_partial_fit_sample_weight(batch_size: int | None) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    sample_weight = np.linspace(0.5, 1.5, len(X))
+    est = SGDClassifier(max_iter=5, tol=1e-03)
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(
+            est,
+            param_dist,
+            batch_size=batch_size,
+            cv=3,
+            enable_pruning=True,
+            error_score="raise",
+            max_iter=2,
+            n_trials=2,
+        )
+    with patch.object(
+        SGDClassifier, "partial_fit", autospec=True, side_effect=SGDClassifier.partial_fit
+    ) as m:
+        optuna_search.fit(X, y, sample_weight=sample_weight)
+
+    assert m.call_count > 0
+    for call in m.call_args_list:
+        assert len(call.kwargs["sample_weight"]) == len(call.args[1])
+    if batch_size is not None:
+        # The last epoch of the refit goes through all the samples in 4 batches.
+        last_epoch = m.call_args_list[-4:]
+        assert np.concatenate([call.kwargs["sample_weight"] for call in last_epoch]) == (
+            pytest.approx(sample_weight)
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"resource": "n_samples", "enable_pruning": True}, "enable_pruning"),
+        ({"resource": "alpha"}, "param_distributions"),
+        ({"resource": "foo"}, "parameter of the estimator"),
+        ({"resource": "n_samples", "reduction_factor": 1}, "reduction_factor"),
+        ({"resource": "n_samples", "min_resources": 100}, "min_resources"),
+        ({"enable_fold_pruning": True, "enable_pruning": True}, "enable_fold_pruning"),
+        ({"enable_fold_pruning": True, "resource": "n_samples"}, "enable_fold_pruning"),
+        ({"trial_backend": "dask"}, "trial_backend"),
+        ({"trial_backend": "loky", "resource": "n_samples"}, "trial_backend"),
+        ({"trial_backend": "loky", "enable_pruning": True}, "trial_backend"),
+        ({"pipeline_cache_size": 10}, "Pipeline"),
+        (
+            {
+                "estimator": Pipeline([("pca", PCA()), ("sgd", SGDClassifier())]),
+                "pipeline_cache_size": 0,
+            },
+            "pipeline_cache_size must be > 0",
+        ),
+        (
+            {
+                "estimator": Pipeline([("pca", PCA()), ("sgd", SGDClassifier())]),
+                "pipeline_cache_size": 10,
+                "enable_fold_pruning": True,
+            },
+            "pipeline_cache_size",
+        ),
+        (
+            {
+                "estimator": Pipeline([("pca", PCA()), ("sgd", SGDClassifier())]),
+                "pipeline_cache_size": 10,
+                "warm_start_param": "sgd__max_iter",
+            },
+            "pipeline_cache_size",
+        ),
+        ({"warm_start_param": "n_estimators"}, "parameter of the estimator"),
+        ({"estimator": DecisionTreeRegressor(), "warm_start_param": "max_depth"}, "warm_start"),
+        ({"warm_start_param": "max_iter", "warm_start_cache_size": 0}, "warm_start_cache_size"),
+        ({"warm_start_param": "max_iter", "resource": "n_samples"}, "warm_start_param"),
+        ({"memoize": True, "enable_pruning": True}, "memoize"),
+        ({"memoize": True, "enable_fold_pruning": True}, "memoize"),
+        ({"memoize": True, "resource": "n_samples"}, "memoize"),
+        ({"batch_size": 8}, "enable_pruning"),
+        ({"batch_size": 0, "enable_pruning": True}, "batch_size must be > 0"),
+    ],
+)
+def test_optuna_search_invalid_params(kwargs: dict, match: str) -> None:
+    X, y = make_blobs(n_samples=30, random_state=0)
+    kwargs = kwargs.copy()
+    est = kwargs.pop("estimator", SGDClassifier(max_iter=5, tol=1e-03))
+    param_dist = {"alpha": distributions.FloatDistribution(1e-04, 1e03, log=True)}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
+        optuna_search = OptunaSearchCV(est, param_dist, cv=3, **kwargs)
+
+    with pytest.raises(ValueError, match=match):
+        optuna_search.fit(X, y)
+
+
 @pytest.mark.filterwarnings("ignore::UserWarning")
 def test_optuna_search_properties() -> None:
     X, y = make_blobs(n_samples=10)